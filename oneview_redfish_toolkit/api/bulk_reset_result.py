@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections import OrderedDict
+
+from oneview_redfish_toolkit.api.computer_system import ComputerSystem
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+from oneview_redfish_toolkit.api.task_collection import TaskCollection
+
+
+class BulkResetResult(RedfishJsonValidator):
+    """Creates the result dict of a bulk reset of Computer Systems
+
+        Populates self.redfish with the result of the power action of
+        each Computer System. Will not validate as there's no schema to
+        validate against.
+    """
+
+    SCHEMA_NAME = None
+
+    def __init__(self, reset_type, reset_results):
+        """BulkResetResult constructor
+
+            Args:
+                reset_type: Redfish ResetType of the bulk reset
+                reset_results: list of ResetResult, one for each
+                    Computer System
+        """
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["ResetType"] = reset_type
+        self.redfish["Members"] = [
+            self._build_member(reset_result)
+            for reset_result in reset_results
+        ]
+        self.redfish["Members@odata.count"] = len(self.redfish["Members"])
+
+    @staticmethod
+    def _build_member(reset_result):
+        member = OrderedDict()
+        member["@odata.id"] = \
+            ComputerSystem.BASE_URI + "/" + reset_result.system_id
+
+        if reset_result.error:
+            member["Status"] = "Failed"
+            member["Message"] = reset_result.error
+        elif reset_result.task:
+            member["Status"] = "Accepted"
+            member["Task"] = {
+                "@odata.id": TaskCollection.BASE_URI + "/" +
+                reset_result.task.task_id
+            }
+        else:
+            member["Status"] = "Completed"
+
+        return member
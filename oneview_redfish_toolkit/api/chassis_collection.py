@@ -76,10 +76,16 @@ class ChassisCollection(RedfishJsonValidator):
         """Populates self.redfish["Members"] with the links resources"""
 
         for resource in oneview_resource:
-            link_dict = collections.OrderedDict()
-            link_dict["@odata.id"] = \
-                "/redfish/v1/Chassis/" + resource["uuid"]
-            self.redfish["Members"].append(link_dict)
+            self.redfish["Members"].append(self.build_member(resource))
+
+    @staticmethod
+    def build_member(resource):
+        """Builds the Redfish member link of a OneView resource"""
+
+        link_dict = collections.OrderedDict()
+        link_dict["@odata.id"] = \
+            "/redfish/v1/Chassis/" + resource["uuid"]
+        return link_dict
 
     def _get_redfish_members_length(self):
         """Gets the length of redfish members"""
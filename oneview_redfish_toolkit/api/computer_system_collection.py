@@ -20,6 +20,8 @@ from oneview_redfish_toolkit.api.computer_system \
     import ComputerSystem
 from oneview_redfish_toolkit.api.redfish_json_validator \
     import RedfishJsonValidator
+from oneview_redfish_toolkit.api.util.power_option import \
+    RESET_ALLOWABLE_VALUES_LIST
 from oneview_redfish_toolkit.api.zone_collection \
     import ZoneCollection
 
@@ -33,6 +35,8 @@ class ComputerSystemCollection(RedfishJsonValidator):
     """
 
     SCHEMA_NAME = 'ComputerSystemCollection'
+    RESET_ACTION_URI = ComputerSystem.BASE_URI + \
+        "/Actions/Oem/HpeComputerSystemCollection.Reset"
 
     def __init__(self,
                  server_profile_list,
@@ -61,6 +65,7 @@ class ComputerSystemCollection(RedfishJsonValidator):
         self.redfish["Members"] = server_profile_members_list
 
         self._set_collection_capabilities(server_profile_templates, zone_ids)
+        self._set_oem_actions()
 
         self.redfish["@odata.context"] = \
             "/redfish/v1/$metadata#ComputerSystemCollection" \
@@ -86,12 +91,32 @@ class ComputerSystemCollection(RedfishJsonValidator):
         """
         members = list()
         for server_profile in server_profile_list:
-            members.append({
-                "@odata.id": "/redfish/v1/Systems/" + server_profile["uuid"]
-            })
+            members.append(self.build_member(server_profile))
 
         return members
 
+    @staticmethod
+    def build_member(server_profile):
+        """Builds the Redfish member link of a Server Profile"""
+        return {
+            "@odata.id": "/redfish/v1/Systems/" + server_profile["uuid"]
+        }
+
+    def _set_oem_actions(self):
+        """Sets the OEM action resetting many Computer Systems at once"""
+        reset_action = OrderedDict()
+        reset_action["target"] = self.RESET_ACTION_URI
+        reset_action["ResetType@Redfish.AllowableValues"] = \
+            RESET_ALLOWABLE_VALUES_LIST
+
+        self.redfish["Oem"] = {
+            "Hpe": {
+                "Actions": {
+                    "#HpeComputerSystemCollection.Reset": reset_action
+                }
+            }
+        }
+
     def _set_collection_capabilities(self, server_profile_templates, zone_ids):
         self.capabilities_key = "@Redfish.CollectionCapabilities"
         self.redfish[self.capabilities_key] = dict()
@@ -52,3 +52,10 @@ class OneViewRedfishResourceNotFoundException(OneViewRedfishException):
     def __init__(self, msg):
         self.msg = msg
         self.status_code_error = status.HTTP_404_NOT_FOUND
+
+
+class OneViewRedfishUnavailableException(OneViewRedfishException):
+
+    def __init__(self, msg):
+        self.msg = msg
+        self.status_code_error = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections import OrderedDict
+
+from oneview_redfish_toolkit.api.metric_report_collection import \
+    MetricReportCollection
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+
+
+class MetricReport(RedfishJsonValidator):
+    """Creates a Metric Report dict
+
+        Populates self.redfish with the samples of a OneView utilization
+        metric for many Chassis. Will not validate as there's no schema
+        to validate against.
+    """
+
+    SCHEMA_NAME = None
+
+    def __init__(self, metric_id, metric_values):
+        """MetricReport constructor
+
+            Args:
+                metric_id: OneView metric name, used as the report id
+                metric_values: list of (uuid, timestamp, value) tuples of
+                    the Chassis samples
+        """
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.type"] = "#MetricReport.v1_0_0.MetricReport"
+        self.redfish["@odata.context"] = \
+            "/redfish/v1/$metadata#MetricReport.MetricReport"
+        self.redfish["@odata.id"] = \
+            MetricReportCollection.BASE_URI + "/" + metric_id
+        self.redfish["Id"] = metric_id
+        self.redfish["Name"] = metric_id + " Metric Report"
+        self.redfish["MetricValues"] = [
+            self._build_metric_value(metric_id, uuid, timestamp, value)
+            for uuid, timestamp, value in metric_values
+        ]
+
+    @staticmethod
+    def _build_metric_value(metric_id, uuid, timestamp, value):
+        metric_value = OrderedDict()
+        metric_value["MetricId"] = metric_id
+        metric_value["MetricValue"] = "{:g}".format(value)
+        metric_value["Timestamp"] = timestamp
+        metric_value["MetricProperty"] = "/redfish/v1/Chassis/" + uuid
+
+        return metric_value
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+
+
+class MetricReportCollection(RedfishJsonValidator):
+    """Metric Report Collection class
+
+        Populates self.redfish with a list of Metric Reports. Will not
+        validate as there's no schema to validate against.
+    """
+
+    BASE_URI = "/redfish/v1/TelemetryService/MetricReports"
+    SCHEMA_NAME = None
+
+    def __init__(self, ids):
+        """MetricReportCollection constructor
+
+            Populates self.redfish with MetricReportCollection response.
+
+            Args:
+                ids: List with id of Metric Reports
+        """
+
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.context"] = "/redfish/v1/$metadata" \
+            "#MetricReportCollection.MetricReportCollection"
+        self.redfish["@odata.id"] = self.BASE_URI
+        self.redfish["@odata.type"] = \
+            "#MetricReportCollection.MetricReportCollection"
+        self.redfish["Name"] = "Metric Report Collection"
+        self.redfish["Members"] = [
+            {"@odata.id": self.BASE_URI + "/" + report_id}
+            for report_id in ids
+        ]
+        self.redfish["Members@odata.count"] = len(self.redfish["Members"])
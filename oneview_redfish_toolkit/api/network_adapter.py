@@ -42,9 +42,7 @@ class NetworkAdapter(RedfishJsonValidator):
         self.redfish["@odata.type"] = self.get_odata_type()
         self.redfish["Id"] = device_id
 
-        device_slot = self.get_resource_by_id(
-            server_hardware["portMap"]["deviceSlots"],
-            "deviceNumber", device_id)
+        device_slot = self.get_port_map_resource(server_hardware, device_id)
 
         self.redfish["Name"] = device_slot["deviceName"]
 
@@ -14,6 +14,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishInvalidAttributeValueException
+from oneview_redfish_toolkit.api.network_adapter import NetworkAdapter
+from oneview_redfish_toolkit.api.network_device_function import \
+    NetworkDeviceFunction
+from oneview_redfish_toolkit.api.network_device_function_collection import \
+    NetworkDeviceFunctionCollection
+from oneview_redfish_toolkit.api.network_port import NetworkPort
+from oneview_redfish_toolkit.api.network_port_collection import \
+    NetworkPortCollection
 from oneview_redfish_toolkit.api.redfish_json_validator \
     import RedfishJsonValidator
 
@@ -58,3 +70,61 @@ class NetworkAdapterCollection(RedfishJsonValidator):
             server_hardware["uuid"] + "/NetworkAdapters/"
 
         self._validate()
+
+    def expand(self, server_hardware, levels=1):
+        """Expands the Members of the collection
+
+            Replaces each member link by its NetworkAdapter. With 2 levels
+            the NetworkPorts and NetworkDeviceFunctions of each adapter are
+            replaced by their collections, and with 3 levels the members
+            of these collections are expanded as well. All of them are
+            built from the same server hardware dict.
+
+            Args:
+                server_hardware: a server hardware dict from OneView
+                levels: number of levels to expand
+        """
+        self.redfish["Members"] = [
+            self._expand_network_adapter(
+                server_hardware, os.path.basename(member["@odata.id"]),
+                levels)
+            for member in self.redfish["Members"]
+        ]
+
+    def _expand_network_adapter(self, server_hardware, device_id, levels):
+        network_adapter = NetworkAdapter(device_id, server_hardware).redfish
+
+        if levels < 2:
+            return network_adapter
+
+        network_ports = \
+            NetworkPortCollection(server_hardware, device_id).redfish
+        network_device_functions = \
+            NetworkDeviceFunctionCollection(device_id, server_hardware).redfish
+
+        if levels > 2:
+            network_ports["Members"] = [
+                self._expand_member(
+                    member, NetworkPort, device_id,
+                    os.path.basename(member["@odata.id"]), server_hardware)
+                for member in network_ports["Members"]
+            ]
+            network_device_functions["Members"] = [
+                self._expand_member(
+                    member, NetworkDeviceFunction, device_id,
+                    os.path.basename(member["@odata.id"]), server_hardware)
+                for member in network_device_functions["Members"]
+            ]
+
+        network_adapter["NetworkPorts"] = network_ports
+        network_adapter["NetworkDeviceFunctions"] = network_device_functions
+
+        return network_adapter
+
+    @staticmethod
+    def _expand_member(member, redfish_class, *args):
+        """Builds the member, keeping its link when it is not supported"""
+        try:
+            return redfish_class(*args).redfish
+        except OneViewRedfishInvalidAttributeValueException:
+            return member
@@ -51,15 +51,11 @@ class NetworkDeviceFunction(RedfishJsonValidator):
             port_number, virtual_port_number, virtual_port_function = \
                 device_function_id.split("_")
 
-            physical_ports = self.get_resource_by_id(
-                server_hardware["portMap"]["deviceSlots"], "deviceNumber",
-                device_id)["physicalPorts"]
+            port = self.get_port_map_resource(
+                server_hardware, device_id, port_number)
 
-            port = self.get_resource_by_id(
-                physical_ports, "portNumber", port_number)
-
-            virtual_port = self.get_resource_by_id(
-                port["virtualPorts"], "portNumber", virtual_port_number)
+            virtual_port = self.get_port_map_resource(
+                server_hardware, device_id, port_number, virtual_port_number)
         except Exception:
             raise OneViewRedfishResourceNotFoundException(
                 "NetworkDeviceFunction id {} not found.".format(
@@ -40,9 +40,8 @@ class NetworkDeviceFunctionCollection(RedfishJsonValidator):
         members_count = 0
         self.redfish["Members"] = list()
 
-        physical_ports = self.get_resource_by_id(
-            server_hardware["portMap"]["deviceSlots"], "deviceNumber",
-            device_id)["physicalPorts"]
+        physical_ports = self.get_port_map_resource(
+            server_hardware, device_id)["physicalPorts"]
 
         for port in physical_ports:
             physical_port = str(port["portNumber"])
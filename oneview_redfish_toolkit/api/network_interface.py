@@ -41,9 +41,8 @@ class NetworkInterface(RedfishJsonValidator):
         self.redfish["@odata.type"] = self.get_odata_type()
         self.redfish["Id"] = device_id
 
-        self.redfish["Name"] = self.get_resource_by_id(
-            server_hardware["portMap"]["deviceSlots"], "deviceNumber",
-            device_id)["deviceName"]
+        self.redfish["Name"] = self.get_port_map_resource(
+            server_hardware, device_id)["deviceName"]
 
         self.redfish["Links"] = dict()
         self.redfish["Links"]["NetworkAdapter"] = dict()
@@ -42,11 +42,7 @@ class NetworkPort(RedfishJsonValidator):
         """
         super().__init__(self.SCHEMA_NAME)
 
-        physical_ports = self.get_resource_by_id(
-            server_hardware["portMap"]["deviceSlots"], "deviceNumber",
-            device_id)["physicalPorts"]
-
-        port = self.get_resource_by_id(physical_ports, "portNumber", port_id)
+        port = self.get_port_map_resource(server_hardware, device_id, port_id)
 
         self.redfish["@odata.type"] = self.get_odata_type()
         self.redfish["Id"] = port_id
@@ -37,9 +37,8 @@ class NetworkPortCollection(RedfishJsonValidator):
         """
         super().__init__(self.SCHEMA_NAME)
 
-        physical_ports = self.get_resource_by_id(
-            server_hardware["portMap"]["deviceSlots"], "deviceNumber",
-            device_id)["physicalPorts"]
+        physical_ports = self.get_port_map_resource(
+            server_hardware, device_id)["physicalPorts"]
 
         self.redfish["@odata.type"] = self.get_odata_type()
         self.redfish["Name"] = "Network Port Collection"
@@ -19,12 +19,14 @@
 import collections
 import json
 import jsonschema
+import logging
 
 from oneview_redfish_toolkit.api.errors import \
     OneViewRedfishInvalidAttributeValueException
 from oneview_redfish_toolkit.api.errors import \
     OneViewRedfishResourceNotFoundException
 from oneview_redfish_toolkit.api import schemas
+from oneview_redfish_toolkit.api.util import port_map
 from oneview_redfish_toolkit import config
 
 
@@ -40,6 +42,8 @@ class RedfishJsonValidator(object):
         successful validation and raises an exception on validation failure
     """
 
+    STREAM_CHUNK_SIZE = 16 * 1024
+
     def __init__(self, schema_name):
         """Constructor
 
@@ -96,15 +100,96 @@ class RedfishJsonValidator(object):
                 string: json string with the contents of self.redfish
         """
 
-        if config.get_config()['redfish']['indent_json']:
-            indent = 4
-        else:
-            indent = None
         return json.dumps(
             self.redfish,
             default=lambda o: o.__dict__,
             sort_keys=False,
-            indent=indent)
+            indent=self._get_json_indent())
+
+    def serialize_stream(self, members):
+        """Generates a json string from redfish content in chunks
+
+            Serializes the contents of self.redfish as serialize does,
+            but the collection Members are taken from the members iterable
+            and written as they are produced, so the whole Members list is
+            never held in memory. Members and Members@odata.count are
+            written last since the count is only known when the iterable
+            is exhausted.
+
+            An error raised by the members iterable once the response has
+            started is logged, and the json is ended validly with the
+            Members written so far, so the response is not cut off.
+
+            Args:
+                members: iterable of dicts to be written as Members.
+
+            Returns:
+                generator: chunks of the json string.
+        """
+        indent = self._get_json_indent()
+        separator = "," if indent else ", "
+
+        def newline(level):
+            if not indent:
+                return ""
+            return "\n" + " " * indent * level
+
+        def dumps(value, level):
+            text = json.dumps(
+                value,
+                default=lambda o: o.__dict__,
+                sort_keys=False,
+                indent=indent)
+            return text.replace("\n", newline(level))
+
+        chunk = ["{"]
+        for key, value in self.redfish.items():
+            if key in ("Members", "Members@odata.count"):
+                continue
+
+            if len(chunk) > 1:
+                chunk.append(separator)
+            chunk.append(newline(1) + json.dumps(key) + ": " +
+                         dumps(value, 1))
+
+        if len(chunk) > 1:
+            chunk.append(separator)
+        chunk.append(newline(1) + '"Members": [')
+        yield "".join(chunk)
+
+        chunk = []
+        chunk_length = 0
+        count = 0
+        try:
+            for member in members:
+                text = newline(2) + dumps(member, 2)
+                if count:
+                    chunk.append(separator)
+                chunk.append(text)
+                chunk_length += len(text)
+                count += 1
+
+                if chunk_length >= self.STREAM_CHUNK_SIZE:
+                    yield "".join(chunk)
+                    chunk = []
+                    chunk_length = 0
+        except Exception as e:
+            logging.exception("Error while streaming the Members of {}: {}"
+                              .format(self.redfish.get("@odata.id"), e))
+
+        if count:
+            chunk.append(newline(1))
+        chunk.append("]" + separator + newline(1) +
+                     '"Members@odata.count": ' + str(count) +
+                     newline(0) + "}")
+        yield "".join(chunk)
+
+    @staticmethod
+    def _get_json_indent():
+        if config.get_config()['redfish']['indent_json']:
+            return 4
+
+        return None
 
     def get_resource_by_id(self, resource_list,
                            resource_number_key, resource_id):
@@ -123,12 +208,7 @@ class RedfishJsonValidator(object):
             Returns:
                 Resource in the list.
         """
-        try:
-            resource_id = int(resource_id)
-        except ValueError:
-            raise OneViewRedfishInvalidAttributeValueException(
-                "Invalid {} ID".format(self.__class__.__name__)
-            )
+        resource_id = self._get_resource_number(resource_id)
 
         for resource in resource_list:
             if resource[resource_number_key] == resource_id:
@@ -138,6 +218,43 @@ class RedfishJsonValidator(object):
             "Object {} was not found.".format(self.__class__.__name__)
         )
 
+    def get_port_map_resource(self, server_hardware, *resource_ids):
+        """Gets a specific resource in the portMap of a server hardware
+
+            Validates the resource IDs and gets the device slot, physical
+            port or virtual port from the indexed portMap of the server
+            hardware, instead of searching the portMap lists.
+
+            Args:
+                server_hardware: Oneview's server hardware dict.
+                resource_ids: the device slot number, optionally followed
+                    by the physical port number and the virtual port
+                    number.
+
+            Returns:
+                Resource in the portMap.
+        """
+        resource_numbers = [self._get_resource_number(resource_id)
+                            for resource_id in resource_ids]
+
+        resource = port_map.get_port_map_index(server_hardware)\
+            .get(*resource_numbers)
+
+        if resource is None:
+            raise OneViewRedfishResourceNotFoundException(
+                "Object {} was not found.".format(self.__class__.__name__)
+            )
+
+        return resource
+
+    def _get_resource_number(self, resource_id):
+        try:
+            return int(resource_id)
+        except ValueError:
+            raise OneViewRedfishInvalidAttributeValueException(
+                "Invalid {} ID".format(self.__class__.__name__)
+            )
+
     def get_odata_type(self):
         """Retrieves odata.type from schema file
 
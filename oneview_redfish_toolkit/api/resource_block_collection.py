@@ -67,10 +67,16 @@ class ResourceBlockCollection(RedfishJsonValidator):
         """
 
         for block in self.members:
-            block_id = block.get("uuid", block["uri"].split("/")[-1])
+            self.redfish["Members"].append(self.build_member(block))
 
-            resource_block = dict()
+    @classmethod
+    def build_member(cls, block):
+        """Builds the Redfish member link of a ResourceBlock"""
 
-            resource_block["@odata.id"] = self.BASE_URI + "/" + block_id
+        block_id = block.get("uuid", block["uri"].split("/")[-1])
 
-            self.redfish["Members"].append(resource_block)
+        resource_block = dict()
+
+        resource_block["@odata.id"] = cls.BASE_URI + "/" + block_id
+
+        return resource_block
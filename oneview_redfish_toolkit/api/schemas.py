@@ -59,6 +59,9 @@ SCHEMAS = {
     "SessionCollection": "SessionCollection.json",
     "EventDestinationCollection": "EventDestinationCollection.json",
     "SessionService": "SessionService.v1_1_3.json",
+    "TaskService": "TaskService.v1_1_0.json",
+    "TaskCollection": "TaskCollection.json",
+    "Task": "Task.v1_1_0.json",
     "VolumeCollection": "VolumeCollection.json",
     "Volume": "Volume.v1_0_3.json"
 }
@@ -33,6 +33,10 @@ from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api.event import Event
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services import server_hardware_type_service
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.services import task_watch_service
+from oneview_redfish_toolkit.services import zone_service
 from oneview_redfish_toolkit import util
 
 SCMB_DIR_NAME = "scmb"
@@ -46,6 +50,12 @@ SCMB_RESOURCE_LIST = [
     'enclosures',
     'racks',
     'server-hardware']
+# Resources cached by the toolkit, which are kept up to date by SCMB
+SCMB_CACHED_RESOURCE_LIST = [
+    'enclosures',
+    'server-hardware',
+    'server-hardware-types',
+    'tasks']
 SCMB_EXCHANGE_NAME = 'scmb'
 
 
@@ -263,14 +273,38 @@ class SCMB(Thread):
             category = resource['associatedResource']['resourceCategory']
         else:
             category = resource['category']
+            if (category in SCMB_CACHED_RESOURCE_LIST):
+                self._update_cached_resource(body)
 
         if (category in SCMB_RESOURCE_LIST):
             event = Event(body)
 
             util.dispatch_event(event)
-        else:
+        elif (category not in SCMB_CACHED_RESOURCE_LIST):
             logging.debug('SCMB message received for an unmanaged resource')
 
+    def _update_cached_resource(self, message):
+        category = message['resource']['category']
+
+        if category == 'enclosures':
+            zone_service.remove_zone_index_enclosure(message['resourceUri'])
+        elif category == 'server-hardware':
+            server_hardware = dict(message['resource'])
+            server_hardware['uri'] = message['resourceUri']
+            zone_service.update_zone_index_server_hardware(
+                message['changeType'], server_hardware)
+        elif category == 'tasks':
+            oneview_task = dict(message['resource'])
+            oneview_task['uri'] = message['resourceUri']
+            task_watch_service.update_oneview_task(oneview_task)
+            task_tracker_service.update_oneview_task(oneview_task)
+        elif message['changeType'] == 'Deleted':
+            server_hardware_type_service.remove_server_hardware_type(
+                message['resourceUri'])
+        else:
+            server_hardware_type_service.update_server_hardware_type(
+                message['resource'])
+
     def _listen_scmb(self):
         try:
             scmb_conn = self.scmb_connect()
@@ -278,7 +312,8 @@ class SCMB(Thread):
 
             queue_name = ch.queue_declare(auto_delete=True)
 
-            for resource in SCMB_RESOURCE_LIST:
+            for resource in \
+                    set(SCMB_RESOURCE_LIST + SCMB_CACHED_RESOURCE_LIST):
                 # scmb.<resource>.#
                 route = SCMB_EXCHANGE_NAME + '.' + resource + '.#'
 
@@ -22,6 +22,8 @@ from oneview_redfish_toolkit.api.event_service import EventService
 from oneview_redfish_toolkit.api.redfish_json_validator import \
     RedfishJsonValidator
 from oneview_redfish_toolkit.api.session_service import SessionService
+from oneview_redfish_toolkit.api.task_service import TaskService
+from oneview_redfish_toolkit.api.telemetry_service import TelemetryService
 from oneview_redfish_toolkit import config
 
 
@@ -64,6 +66,7 @@ class ServiceRoot(RedfishJsonValidator):
 
         self.add_event_service_api()
         self.add_session_service_endpoints()
+        self.add_task_service_api()
 
         self.redfish["@odata.context"] = \
             "/redfish/v1/$metadata#ServiceRoot.ServiceRoot"
@@ -73,6 +76,10 @@ class ServiceRoot(RedfishJsonValidator):
 
         self._validate()
 
+        # The bundled ServiceRoot schema predates TelemetryService, so the
+        # link is added after the validation
+        self.add_telemetry_service_api()
+
     def add_event_service_api(self):
         self.redfish["EventService"] = {"@odata.id": EventService.BASE_URI}
 
@@ -82,3 +89,10 @@ class ServiceRoot(RedfishJsonValidator):
         if config.auth_mode_is_session():
             self.redfish['Links']['Sessions']['@odata.id'] = \
                 SessionService.BASE_URI + "/Sessions"
+
+    def add_task_service_api(self):
+        self.redfish["Tasks"] = {"@odata.id": TaskService.BASE_URI}
+
+    def add_telemetry_service_api(self):
+        self.redfish["TelemetryService"] = \
+            {"@odata.id": TelemetryService.BASE_URI}
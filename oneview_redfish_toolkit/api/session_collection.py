@@ -27,13 +27,17 @@ class SessionCollection(RedfishJsonValidator):
     BASE_URI = "/redfish/v1/SessionService/Sessions"
     SCHEMA_NAME = 'SessionCollection'
 
-    def __init__(self, ids):
+    def __init__(self, ids, count=None, next_skip=None):
         """Session constructor
 
             Populates self.redfish with Session response.
 
             Args:
                 ids: List with id of sessions
+                count: total number of sessions, when ids is a page of
+                    them
+                next_skip: $skip query parameter of the next page, if
+                    there is one
         """
 
         super().__init__(self.SCHEMA_NAME)
@@ -44,7 +48,12 @@ class SessionCollection(RedfishJsonValidator):
         self.redfish["@odata.type"] = self.get_odata_type()
         self.redfish["Name"] = "Active sessions"
         self.redfish["Members"] = [self._build_member(s_id) for s_id in ids]
-        self.redfish["Members@odata.count"] = len(self.redfish["Members"])
+        self.redfish["Members@odata.count"] = len(self.redfish["Members"]) \
+            if count is None else count
+
+        if next_skip is not None:
+            self.redfish["Members@odata.nextLink"] = \
+                "{}?$skip={}".format(self.BASE_URI, next_skip)
 
         self._validate()
 
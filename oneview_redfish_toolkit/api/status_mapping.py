@@ -102,6 +102,29 @@ APPLIANCE_STATE_TO_REDFISH_STATE = {
     "STARTING": "Starting",
 }
 
+ONEVIEW_TASK_STATE_TO_REDFISH_TASK_STATE = {
+    "New": "New",
+    "Starting": "Starting",
+    "Pending": "Pending",
+    "Running": "Running",
+    "Suspended": "Suspended",
+    "Stopping": "Stopping",
+    "Interrupted": "Interrupted",
+    "Completed": "Completed",
+    "Warning": "Completed",
+    "Error": "Exception",
+    "Terminated": "Killed",
+    "Killed": "Killed"
+}
+
+ONEVIEW_TASK_STATE_TO_REDFISH_TASK_STATUS = {
+    "Interrupted": "Warning",
+    "Warning": "Warning",
+    "Error": "Critical",
+    "Terminated": "Critical",
+    "Killed": "Critical"
+}
+
 CRITICALITY_STATUS = {
     "OK": 1,
     "Warning": 2,
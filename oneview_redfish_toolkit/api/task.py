@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+from oneview_redfish_toolkit.api.task_collection import TaskCollection
+
+
+class Task(RedfishJsonValidator):
+    """Creates a Task Redfish dict
+
+        Populates self.redfish with the state of an operation running
+        in background.
+    """
+
+    SCHEMA_NAME = 'Task'
+
+    def __init__(self, tracked_task):
+        """Task constructor
+
+            Populates self.redfish with Task response.
+
+            Args:
+                tracked_task: TrackedTask with the state of the operation
+        """
+
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.context"] = "/redfish/v1/$metadata#Task.Task"
+        self.redfish["@odata.id"] = \
+            TaskCollection.BASE_URI + "/" + tracked_task.task_id
+        self.redfish["@odata.type"] = self.get_odata_type()
+        self.redfish["Id"] = tracked_task.task_id
+        self.redfish["Name"] = tracked_task.name
+        self.redfish["TaskState"] = tracked_task.state
+        self.redfish["TaskStatus"] = tracked_task.status
+        self.redfish["StartTime"] = tracked_task.start_time
+
+        if tracked_task.end_time:
+            self.redfish["EndTime"] = tracked_task.end_time
+
+        self._validate()
+
+        # The Message schema referenced by the Task schema lists Message
+        # versions not shipped with the toolkit, so the messages are
+        # validated against the Message schema version in use instead
+        for message in tracked_task.messages:
+            self.validate(message, "Message")
+
+        self.redfish["Messages"] = list(tracked_task.messages)
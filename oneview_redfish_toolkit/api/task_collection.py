@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+
+
+class TaskCollection(RedfishJsonValidator):
+    """Task Collection class
+
+        Populates self.redfish with a list of Tasks.
+    """
+
+    BASE_URI = "/redfish/v1/TaskService/Tasks"
+    SCHEMA_NAME = 'TaskCollection'
+
+    def __init__(self, ids):
+        """TaskCollection constructor
+
+            Populates self.redfish with TaskCollection response.
+
+            Args:
+                ids: List with id of tasks
+        """
+
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.context"] = \
+            "/redfish/v1/$metadata#TaskCollection.TaskCollection"
+        self.redfish["@odata.id"] = self.BASE_URI
+        self.redfish["@odata.type"] = self.get_odata_type()
+        self.redfish["Name"] = "Task Collection"
+        self.redfish["Members"] = [self._build_member(t_id) for t_id in ids]
+        self.redfish["Members@odata.count"] = len(self.redfish["Members"])
+
+        self._validate()
+
+    def _build_member(self, task_id):
+        return {"@odata.id": self.BASE_URI + "/" + str(task_id)}
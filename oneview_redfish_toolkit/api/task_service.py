@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+
+
+class TaskService(RedfishJsonValidator):
+    """Creates a Task Service dict
+
+        Populates self.redfish with TaskService values.
+    """
+
+    SCHEMA_NAME = 'TaskService'
+    BASE_URI = '/redfish/v1/TaskService'
+
+    def __init__(self):
+        """Constructor
+
+            Populates self.redfish with TaskService response.
+        """
+
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.type"] = self.get_odata_type()
+        self.redfish["@odata.context"] = "/redfish/v1/$metadata" \
+            "#TaskService.TaskService"
+        self.redfish["@odata.id"] = self.BASE_URI
+
+        self.redfish["Id"] = "TaskService"
+        self.redfish["Name"] = "Task Service"
+        self.redfish["Description"] = "Task service"
+        self.redfish["ServiceEnabled"] = True
+        self.redfish["CompletedTaskOverWritePolicy"] = "Oldest"
+        self.redfish["LifeCycleEventOnTaskStateChange"] = False
+        self.redfish["Status"] = {
+            "State": "Enabled",
+            "Health": "OK"
+        }
+        self.redfish["Tasks"] = {
+            "@odata.id": self.BASE_URI + "/Tasks"
+        }
+
+        self._validate()
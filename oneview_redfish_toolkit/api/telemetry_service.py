@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from oneview_redfish_toolkit.api.redfish_json_validator \
+    import RedfishJsonValidator
+
+
+class TelemetryService(RedfishJsonValidator):
+    """Creates a Telemetry Service dict
+
+        Populates self.redfish with TelemetryService values. Will not
+        validate as there's no schema to validate against.
+    """
+
+    SCHEMA_NAME = None
+    BASE_URI = '/redfish/v1/TelemetryService'
+
+    def __init__(self, service_enabled):
+        """Constructor
+
+            Populates self.redfish with TelemetryService response.
+
+            Args:
+                service_enabled: whether the telemetry sampling is enabled
+        """
+
+        super().__init__(self.SCHEMA_NAME)
+
+        self.redfish["@odata.type"] = \
+            "#TelemetryService.v1_0_0.TelemetryService"
+        self.redfish["@odata.context"] = "/redfish/v1/$metadata" \
+            "#TelemetryService.TelemetryService"
+        self.redfish["@odata.id"] = self.BASE_URI
+
+        self.redfish["Id"] = "TelemetryService"
+        self.redfish["Name"] = "Telemetry Service"
+        self.redfish["Description"] = "Telemetry service"
+        self.redfish["ServiceEnabled"] = service_enabled
+        self.redfish["Status"] = {
+            "State": "Enabled" if service_enabled else "Disabled",
+            "Health": "OK"
+        }
+        self.redfish["MetricReports"] = {
+            "@odata.id": self.BASE_URI + "/MetricReports"
+        }
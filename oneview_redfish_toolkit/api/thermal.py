@@ -27,7 +27,7 @@ class Thermal(RedfishJsonValidator):
 
     SCHEMA_NAME = 'Thermal'
 
-    def __init__(self, utilization, uuid, name):
+    def __init__(self, utilization, uuid, name, reading_time=None):
         """Thermal constructor
 
             Populates self.redfish with the contents of utilization or
@@ -35,6 +35,8 @@ class Thermal(RedfishJsonValidator):
 
             Args:
                 utilization: Hardware utilization or topology dict from OneView
+                reading_time: time of the reading when it is served from
+                    the telemetry samples
         """
         super().__init__(self.SCHEMA_NAME)
 
@@ -49,18 +51,32 @@ class Thermal(RedfishJsonValidator):
         self.redfish["Temperatures"][0]["Status"]["State"] = "Enabled"
         self.redfish["Temperatures"][0]["Status"]["Health"] = "OK"
         self.redfish["Temperatures"][0]["PhysicalContext"] = "Intake"
-        if name is not 'Rack':
+        if name != 'Rack':
+            ambient_temperature = self._get_ambient_temperature(utilization)
             self.redfish["Temperatures"][0]["ReadingCelsius"] = \
-                utilization["metricList"][0]["metricSamples"][0][1]
+                ambient_temperature["metricSamples"][0][1]
             self.redfish["Temperatures"][0]["UpperThresholdCritical"] = \
-                utilization["metricList"][0]["metricCapacity"]
+                ambient_temperature["metricCapacity"]
             self.redfish["Temperatures"][0]["MinReadingRangeTemp"] = 10
             self.redfish["Temperatures"][0]["MaxReadingRangeTemp"] = 35
         else:
             self.redfish["Temperatures"][0]["ReadingCelsius"] = \
                 utilization["peakTemp"]
+        if reading_time:
+            self.redfish["Temperatures"][0]["Oem"] = {
+                "Hpe": {"ReadingTime": reading_time}
+            }
         self.redfish["@odata.context"] = \
             "/redfish/v1/$metadata#Thermal.Thermal"
         self.redfish["@odata.id"] = "/redfish/v1/Chassis/" + uuid + "/Thermal"
 
         self._validate()
+
+    @staticmethod
+    def _get_ambient_temperature(utilization):
+        """Gets the AmbientTemperature metric among the utilization metrics"""
+        for metric in utilization["metricList"]:
+            if metric.get("metricName") == "AmbientTemperature":
+                return metric
+
+        return utilization["metricList"][0]
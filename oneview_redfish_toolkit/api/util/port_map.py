@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import threading
+
+
+lock = threading.Lock()
+
+# Port map indexes by Server Hardware URI: {uri: (eTag, PortMapIndex)}
+map_port_map_indexes = dict()
+
+
+def init_map_port_map_indexes():
+    global map_port_map_indexes
+    map_port_map_indexes = dict()
+
+
+def get_port_map_index(server_hardware):
+    """Gets the port map index of a Server Hardware
+
+        The index is built once for each Server Hardware eTag, so the
+        requests walking the network resources of the same Server
+        Hardware share it while the hardware is not changed.
+
+        Args:
+            server_hardware: Server Hardware dict from OneView
+
+        Returns:
+            PortMapIndex: index of the Server Hardware portMap
+    """
+    uri = server_hardware.get("uri")
+    e_tag = server_hardware.get("eTag")
+
+    cached = map_port_map_indexes.get(uri)
+    if cached and e_tag and cached[0] == e_tag:
+        return cached[1]
+
+    index = PortMapIndex(server_hardware["portMap"])
+
+    if uri and e_tag:
+        with lock:
+            map_port_map_indexes[uri] = (e_tag, index)
+
+    return index
+
+
+class PortMapIndex(object):
+    """Index of the device slots and ports of a Server Hardware portMap
+
+        Device slots, physical ports and virtual ports are indexed by
+        (deviceNumber,), (deviceNumber, portNumber) and
+        (deviceNumber, portNumber, virtualPortNumber) respectively.
+    """
+
+    def __init__(self, port_map):
+        """PortMapIndex constructor
+
+            Args:
+                port_map: portMap dict of a Server Hardware
+        """
+        self.resources = dict()
+
+        for device_slot in port_map["deviceSlots"]:
+            device_key = (device_slot["deviceNumber"],)
+            self.resources[device_key] = device_slot
+
+            for port in device_slot["physicalPorts"]:
+                port_key = device_key + (port["portNumber"],)
+                self.resources[port_key] = port
+
+                for virtual_port in port["virtualPorts"]:
+                    virtual_port_key = port_key + (virtual_port["portNumber"],)
+                    self.resources[virtual_port_key] = virtual_port
+
+    def get(self, *key):
+        """Gets a device slot, physical port or virtual port by its numbers
+
+            Returns:
+                dict: the portMap resource or None if it does not exist
+        """
+        return self.resources.get(key)
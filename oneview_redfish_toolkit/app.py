@@ -41,6 +41,7 @@ import oneview_redfish_toolkit
 from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api import scmb
 from oneview_redfish_toolkit.api.session_collection import SessionCollection
+from oneview_redfish_toolkit.api.util import port_map
 from oneview_redfish_toolkit.blueprints.chassis import chassis
 from oneview_redfish_toolkit.blueprints.chassis_collection \
     import chassis_collection
@@ -95,6 +96,8 @@ from oneview_redfish_toolkit.blueprints.subscription\
     import subscription
 from oneview_redfish_toolkit.blueprints.subscription_collection \
     import subscription_collection
+from oneview_redfish_toolkit.blueprints.task_service import task_service
+from oneview_redfish_toolkit.blueprints.telemetry import telemetry
 from oneview_redfish_toolkit.blueprints.thermal import thermal
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
@@ -102,13 +105,23 @@ from oneview_redfish_toolkit.blueprints.vlan_network_interface import \
     vlan_network_interface
 from oneview_redfish_toolkit.blueprints.zone import zone
 from oneview_redfish_toolkit.blueprints.zone_collection import zone_collection
+from oneview_redfish_toolkit import async_oneview
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import circuit_breaker
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.config import PERFORMANCE_LOGGER_NAME
 from oneview_redfish_toolkit import connection
 from oneview_redfish_toolkit import handler_multiple_oneview
 from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import appliance_health_service
+from oneview_redfish_toolkit.services import sas_logical_jbod_service
+from oneview_redfish_toolkit.services import server_hardware_type_service
+from oneview_redfish_toolkit.services import service_root_service
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.services import task_watch_service
+from oneview_redfish_toolkit.services import telemetry_service
+from oneview_redfish_toolkit.services import zone_service
 from oneview_redfish_toolkit import util
 
 
@@ -145,6 +158,8 @@ def main(config_file_path, logging_config_file_path,
     app.register_blueprint(service_root, url_prefix='/redfish/v1/')
     app.register_blueprint(event_service)
     app.register_blueprint(session_service)
+    app.register_blueprint(task_service)
+    app.register_blueprint(telemetry)
     app.register_blueprint(chassis_collection)
     app.register_blueprint(computer_system_collection)
     app.register_blueprint(computer_system)
@@ -179,12 +194,24 @@ def main(config_file_path, logging_config_file_path,
     app.register_blueprint(subscription)
 
     # Init cached data
+    async_oneview.init_event_loop()
     client_session.init_map_clients()
+    client_session.init_map_pooled_clients()
     scmb.init_map_scmb_connections()
     client_session.init_gc_for_expired_sessions()
+    circuit_breaker.init_map_circuit_breakers()
     multiple_oneview.init_map_resources()
     multiple_oneview.init_map_appliances()
     category_resource.init_map_category_resources()
+    sas_logical_jbod_service.init_map_drives_by_sas_logical_jbod()
+    server_hardware_type_service.init_map_server_hardware_types()
+    service_root_service.init_map_service_root()
+    port_map.init_map_port_map_indexes()
+    zone_service.init_zone_index()
+    task_tracker_service.init_map_tasks()
+    task_watch_service.init_map_watched_tasks()
+    telemetry_service.init_map_sampled_chassis()
+    appliance_health_service.init_map_polled_appliances()
 
     if auth_mode == "conf":
         client_session.login_conf_mode()
@@ -234,6 +261,8 @@ def main(config_file_path, logging_config_file_path,
         response.headers["OData-Version"] = "4.0"
         return response
 
+    app.after_request(multiple_oneview.set_partial_result_header)
+
     @app.after_request
     def log_performance_data(response):
         if logging.getLogger().isEnabledFor(logging.DEBUG):
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+# 3rd party libs
+from flask import _app_ctx_stack
+from flask import _request_ctx_stack
+
+
+DEFAULT_MAX_WORKERS = 20
+
+lock = threading.Lock()
+
+# Thread local flag set on the executor threads
+worker_state = threading.local()
+
+map_event_loop = None
+
+
+def init_event_loop(max_workers=DEFAULT_MAX_WORKERS):
+    """Enables the event loop used to query OneViews concurrently
+
+        The loop thread itself is only started on the first query, so it
+        belongs to the process that serves the requests, even when the
+        toolkit is daemonized after the initialization.
+    """
+    global map_event_loop
+    map_event_loop = {'max_workers': max_workers}
+
+
+def is_event_loop_enabled():
+    return map_event_loop is not None
+
+
+def get_event_loop():
+    """Gets the running event loop, starting it if needed"""
+    with lock:
+        if map_event_loop.get('pid') != os.getpid():
+            map_event_loop['loop'] = _start_event_loop(
+                map_event_loop['max_workers'])
+            map_event_loop['pid'] = os.getpid()
+
+        return map_event_loop['loop']
+
+
+def _start_event_loop(max_workers):
+    loop = asyncio.new_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+
+    return loop
+
+
+async def gather(queries):
+    """Awaits the queries running concurrently on the loop executor
+
+        Args:
+            queries: list of callables without arguments
+
+        Returns:
+            list: the result of each query in the same order, or the
+            exception raised by the query
+    """
+    loop = asyncio.get_event_loop()
+
+    return await asyncio.gather(
+        *[loop.run_in_executor(None, query) for query in queries],
+        return_exceptions=True)
+
+
+def run_concurrently(queries):
+    """Runs blocking OneView queries concurrently
+
+        Submits the queries to the OneView event loop and blocks the
+        calling worker thread only until all of them are done, instead
+        of waiting for each socket in turn. The queries run within the
+        Flask context of the caller, so they can use g.oneview_client.
+        When the event loop is not enabled, or when called from a query
+        already running on the loop, the queries run sequentially.
+
+        Args:
+            queries: list of callables without arguments
+
+        Returns:
+            list: the result of each query in the same order, or the
+            exception raised by the query
+    """
+    if not _can_run_concurrently(queries):
+        return [_run_query(query) for query in queries]
+
+    queries_in_context = [_bind_current_context(query) for query in queries]
+
+    future = asyncio.run_coroutine_threadsafe(gather(queries_in_context),
+                                              get_event_loop())
+    return future.result()
+
+
+def fetch_concurrently(queries):
+    """Runs independent OneView queries concurrently
+
+        Same as run_concurrently, but an error of any query is raised as
+        if the queries had run in order: the exception of the first query
+        that failed is raised. When running sequentially, the queries
+        after the failed one are not run.
+
+        Args:
+            queries: list of callables without arguments
+
+        Returns:
+            list: the result of each query in the same order
+    """
+    if not _can_run_concurrently(queries):
+        return [query() for query in queries]
+
+    results = run_concurrently(queries)
+
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+    return results
+
+
+def _can_run_concurrently(queries):
+    return is_event_loop_enabled() and len(queries) > 1 and \
+        not getattr(worker_state, 'active', False)
+
+
+def _run_query(query):
+    try:
+        return query()
+    except Exception as e:
+        return e
+
+
+def bind_context_for_background(function):
+    """Binds the caller Flask contexts to run a function in background
+
+        Unlike the queries, the function may run after the request has
+        finished. Like them, it gets its own copy of the caller contexts,
+        which keeps the request headers and g.oneview_client.
+
+        Args:
+            function: callable without arguments
+
+        Returns:
+            callable: the function running within the caller contexts
+    """
+    return _bind_contexts(function, *_copy_current_contexts())
+
+
+def _bind_current_context(query):
+    """Binds the caller Flask contexts to run the query on other thread"""
+    return _bind_contexts(query, *_copy_current_contexts())
+
+
+def _copy_current_contexts():
+    """Copies the caller Flask contexts for another thread
+
+        A Flask context must not be pushed on several threads at once, so
+        each query gets its own application context, sharing g with the
+        caller, and its own request context, built from a copy of the
+        request environ so popping it does not close the caller request.
+
+        Returns:
+            tuple: the application context and the request context, each
+            one None when the caller has none
+    """
+    app_context = _app_ctx_stack.top
+    request_context = _request_ctx_stack.top
+
+    if app_context is None:
+        return None, None
+
+    app_context_copy = app_context.app.app_context()
+    app_context_copy.g = app_context.g
+
+    if request_context is None:
+        return app_context_copy, None
+
+    return app_context_copy, app_context.app.request_context(
+        dict(request_context.request.environ))
+
+
+def _bind_contexts(query, app_context, request_context):
+    def query_in_context():
+        worker_state.active = True
+        try:
+            if app_context is None:
+                return query()
+
+            with app_context:
+                if request_context is None:
+                    return query()
+
+                # pushed and popped explicitly so the request context is
+                # never preserved on the executor thread after an error
+                request_context.push()
+                try:
+                    return query()
+                finally:
+                    request_context.pop()
+        finally:
+            worker_state.active = False
+
+    return query_in_context
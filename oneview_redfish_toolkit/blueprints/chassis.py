@@ -26,12 +26,14 @@ from flask_api import status
 from oneview_redfish_toolkit.api.blade_chassis import BladeChassis
 from oneview_redfish_toolkit.api.enclosure_chassis import EnclosureChassis
 from oneview_redfish_toolkit.api.rack_chassis import RackChassis
-from oneview_redfish_toolkit.api.util.power_option import OneViewPowerOption
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.services.manager_service import \
     get_manager_uuid
+from oneview_redfish_toolkit.services.power_action_service import \
+    PowerActionService
 
 chassis = Blueprint("chassis", __name__)
 
@@ -94,6 +96,8 @@ def change_server_hardware_power_state(uuid):
         Return ResetType Chassis redfish JSON for a
         given chassis UUID.
         Logs exception of any error and return abort.
+        When async actions are enabled, returns 202 with the Task
+        tracking the power operation instead of waiting for it.
 
         Returns:
             JSON: Redfish JSON with Chassis ResetType.
@@ -125,15 +129,16 @@ def change_server_hardware_power_state(uuid):
         # Gets ServerHardware for given UUID
         sh = g.oneview_client.server_hardware.get_by_id(uuid).data
 
-        # Gets power configuration based on OneView pattern
-        oneview_power_configuration = \
-            OneViewPowerOption.get_oneview_power_configuration(
-                sh, reset_type
-            )
+        power_action_service = PowerActionService(g.oneview_client)
+
+        if config.async_actions_enabled():
+            task = power_action_service.change_power_state_async(
+                sh, reset_type)
+
+            return ResponseBuilder.accepted_task(task)
 
         # Changes the ServerHardware power state
-        g.oneview_client.server_hardware.update_power_state(
-            oneview_power_configuration, uuid)
+        power_action_service.change_power_state(sh, reset_type)
 
         return Response(
             response='{"ResetType": "%s"}' % reset_type,
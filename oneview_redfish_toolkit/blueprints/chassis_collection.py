@@ -22,10 +22,14 @@ from flask import g
 from oneview_redfish_toolkit.api.chassis_collection import ChassisCollection
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
+from oneview_redfish_toolkit import config
 
 
 chassis_collection = Blueprint("chassis_collection", __name__)
 
+# Attributes of the OneView resources read to build the Chassis members
+MEMBER_FIELDS = "uuid"
+
 
 @chassis_collection.route("/redfish/v1/Chassis/", methods=["GET"])
 def get_chassis_collection():
@@ -41,17 +45,40 @@ def get_chassis_collection():
             calls abort(404).
     """
 
+    if config.stream_collections_enabled():
+        cc = ChassisCollection([], [], [])
+
+        return ResponseBuilder.success_stream(cc, _stream_chassis_members())
+
     # Gets all enclosures
-    enclosures = g.oneview_client.enclosures.get_all()
+    enclosures = g.oneview_client.enclosures.get_all_fields(fields=MEMBER_FIELDS)
 
     # Gets all racks
-    racks = g.oneview_client.racks.get_all()
+    racks = g.oneview_client.racks.get_all_fields(fields=MEMBER_FIELDS)
 
     # Gets all server hardware
-    server_hardware_list = g.oneview_client.server_hardware.get_all()
+    server_hardware_list = g.oneview_client.server_hardware.get_all_fields(
+        fields=MEMBER_FIELDS)
 
     # Build Chassis Collection object and validates it
     cc = ChassisCollection(server_hardware_list, enclosures,
                            racks)
 
     return ResponseBuilder.success(cc)
+
+
+def _stream_chassis_members():
+    """Yields the Chassis members as OneView pages are read"""
+
+    resource_pages = [
+        g.oneview_client.enclosures.get_all_fields_pages(
+            fields=MEMBER_FIELDS),
+        g.oneview_client.racks.get_all_fields_pages(fields=MEMBER_FIELDS),
+        g.oneview_client.server_hardware.get_all_fields_pages(
+            fields=MEMBER_FIELDS)
+    ]
+
+    for pages in resource_pages:
+        for page in pages:
+            for resource in page:
+                yield ChassisCollection.build_member(resource)
@@ -15,6 +15,7 @@
 # under the License.
 
 # Python libs
+from functools import partial
 from functools import reduce
 import logging
 
@@ -35,16 +36,25 @@ from jsonschema import ValidationError
 
 from oneview_redfish_toolkit.api.capabilities_object import CapabilitiesObject
 from oneview_redfish_toolkit.api.computer_system import ComputerSystem
+from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api.redfish_json_validator \
     import RedfishJsonValidator
-from oneview_redfish_toolkit.api.util.power_option import OneViewPowerOption
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
+from oneview_redfish_toolkit import async_oneview
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.services.computer_system_service import \
     ComputerSystemService
 from oneview_redfish_toolkit.services.manager_service import \
     get_manager_uuid
+from oneview_redfish_toolkit.services.power_action_service import \
+    PowerActionService
+from oneview_redfish_toolkit.services.sas_logical_jbod_service import \
+    SasLogicalJbodService
+from oneview_redfish_toolkit.services.server_hardware_type_service import \
+    ServerHardwareTypeService
+from oneview_redfish_toolkit.services import task_tracker_service
 from oneview_redfish_toolkit.single_oneview_context import single_oneview
 
 computer_system = Blueprint("computer_system", __name__)
@@ -70,24 +80,27 @@ def get_computer_system(uuid):
     if category == 'server-profile-templates':
         computer_system_resource = CapabilitiesObject(resource)
     elif category == 'server-profiles':
-        server_hardware = g.oneview_client.server_hardware\
-            .get_by_uri(resource["serverHardwareUri"]).data
-        server_hardware_type = g.oneview_client.server_hardware_types\
-            .get_by_uri(resource['serverHardwareTypeUri']).data
-
         computer_system_service = ComputerSystemService(g.oneview_client)
-        drives = _get_drives_from_sp(resource)
-        spt_uuid = computer_system_service.\
-            get_server_profile_template_from_sp(resource["uri"])
 
-        # Get external storage volumes from server profile
-        volumes_uris = [volume["volumeUri"] for volume in resource[
-            "sanStorage"]["volumeAttachments"]]
+        # These resources depend only on the server profile, so they are
+        # fetched concurrently
+        server_hardware, server_hardware_type, drives, spt_uuid = \
+            async_oneview.fetch_concurrently([
+                lambda: g.oneview_client.server_hardware
+                .get_by_uri(resource["serverHardwareUri"]).data,
+                lambda: ServerHardwareTypeService(g.oneview_client)
+                .get_server_hardware_type(resource['serverHardwareTypeUri']),
+                lambda: SasLogicalJbodService(g.oneview_client)
+                .get_drives_from_sp(resource),
+                lambda: computer_system_service.
+                get_server_profile_template_from_sp(resource["uri"])
+            ])
 
-        # Emptying volume list to suppress external storage changes for
-        # current release.
-        # In future, remove this line to enable external storage support
+        # Get external storage volumes from server profile
         volumes_uris = []
+        if config.external_storage_enabled():
+            volumes_uris = [volume["volumeUri"] for volume in resource[
+                "sanStorage"]["volumeAttachments"]]
 
         manager_uuid = get_manager_uuid(resource['serverHardwareTypeUri'])
 
@@ -117,6 +130,8 @@ def change_power_state(uuid):
         Return ResetType Computer System redfish JSON for a
         given server profile UUID.
         Logs exception of any error and return abort.
+        When async actions are enabled, returns 202 with the Task
+        tracking the power operation instead of waiting for it.
 
         Returns:
             JSON: Redfish JSON with ComputerSystem ResetType.
@@ -134,13 +149,15 @@ def change_power_state(uuid):
     sh = g.oneview_client.server_hardware.get_by_uri(
         profile["serverHardwareUri"]).data
 
-    oneview_power_configuration = \
-        OneViewPowerOption.get_oneview_power_configuration(
-            sh, reset_type)
+    power_action_service = PowerActionService(g.oneview_client)
+
+    if config.async_actions_enabled():
+        task = power_action_service.change_power_state_async(sh, reset_type)
+
+        return ResponseBuilder.accepted_task(task)
 
     # Changes the ServerHardware power state
-    g.oneview_client.server_hardware.update_power_state(
-        oneview_power_configuration, sh["uuid"])
+    power_action_service.change_power_state(sh, reset_type)
 
     return Response(
         response='{"ResetType": "%s"}' % reset_type,
@@ -258,23 +275,18 @@ def create_composed_system():
             storage_blocks,
             external_storage_blocks)
 
-        service.power_off_server_hardware(system_block["uuid"],
-                                          on_compose=True)
+        if config.async_actions_enabled():
+            task = task_tracker_service.create_task(
+                "Compose {}".format(body["Name"]))
+            task_tracker_service.run_task(
+                task,
+                partial(_compose_system_task, task, service,
+                        system_block, server_profile, spt_id))
 
-        task, resource_uri = service.create_composed_system(server_profile)
+            return ResponseBuilder.accepted_task(task)
 
-        if resource_uri:
-            result_uuid = resource_uri.split("/")[-1]
-            result_location_uri = ComputerSystem.BASE_URI + "/" + result_uuid
-            server_profile_label = dict(
-                resourceUri=resource_uri, labels=[spt_id.replace("-", " ")])
-            g.oneview_client.labels.create(server_profile_label)
-        elif task.get("taskErrors"):
-            err_msg = reduce(
-                lambda result, msg: result + msg["message"] + "\n",
-                task["taskErrors"],
-                "")
-            abort(status.HTTP_403_FORBIDDEN, err_msg)
+        result_location_uri = _compose_system(
+            service, system_block, server_profile, spt_id)
 
     except ValidationError as e:
         abort(status.HTTP_400_BAD_REQUEST, e.message)
@@ -294,6 +306,51 @@ def create_composed_system():
                     mimetype="application/json")
 
 
+def _compose_system(service, system_block, server_profile, spt_id):
+    """Powers off the Server Hardware and creates the Server Profile
+
+        Returns:
+            string: the URI of the Composed System, or None when the
+            Server Profile URI is not returned by OneView.
+
+        Raises:
+            HPOneViewTaskError: when the OneView task has errors
+    """
+    service.power_off_server_hardware(system_block["uuid"],
+                                      on_compose=True)
+
+    task, resource_uri = service.create_composed_system(server_profile)
+
+    if resource_uri:
+        server_profile_label = dict(
+            resourceUri=resource_uri, labels=[spt_id.replace("-", " ")])
+        g.oneview_client.labels.create(server_profile_label)
+
+        return ComputerSystem.BASE_URI + "/" + resource_uri.split("/")[-1]
+
+    if task.get("taskErrors"):
+        err_msg = reduce(
+            lambda result, msg: result + msg["message"] + "\n",
+            task["taskErrors"],
+            "")
+        raise HPOneViewTaskError(err_msg)
+
+    return None
+
+
+def _compose_system_task(task, service, system_block, server_profile,
+                         spt_id):
+    result_location_uri = _compose_system(
+        service, system_block, server_profile, spt_id)
+
+    if not result_location_uri:
+        raise OneViewRedfishException(
+            "It was not possible get the server profile URI when "
+            "creating a composed system")
+
+    task.set_created(result_location_uri)
+
+
 def _get_oneview_resource(uuid):
     """Gets a Server hardware or Server profile templates"""
     cached_category = category_resource.get_category_by_resource_id(uuid)
@@ -382,15 +439,3 @@ def _get_resource_block_data(func, uuids):
                 raise  # Raise any unexpected errors
 
     return resources
-
-
-def _get_drives_from_sp(server_profile):
-    """Gets Drives from Server Profile"""
-    jbods_drives = list()
-    for sas_logical_jbod in server_profile["localStorage"]["sasLogicalJBODs"]:
-        if sas_logical_jbod["sasLogicalJBODUri"]:
-            drives_by_sas_logical_uuid = g.oneview_client.sas_logical_jbods. \
-                get_drives(sas_logical_jbod["sasLogicalJBODUri"])
-            jbods_drives.extend(drives_by_sas_logical_uuid)
-
-    return jbods_drives
@@ -14,17 +14,29 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from flask import abort
 from flask import Blueprint
 from flask import g
+from flask import request
+from flask_api import status
 
+from oneview_redfish_toolkit.api.bulk_reset_result import BulkResetResult
 from oneview_redfish_toolkit.api.computer_system_collection \
     import ComputerSystemCollection
+from oneview_redfish_toolkit.api.util.power_option import \
+    RESET_ALLOWABLE_VALUES_LIST
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services.power_action_service import \
+    PowerActionService
 from oneview_redfish_toolkit.services.zone_service import ZoneService
 
 computer_system_collection = Blueprint("computer_system_collection", __name__)
 
+# Attributes of the Server Profiles read to build the Systems members
+MEMBER_FIELDS = "uuid,serverHardwareUri"
+
 
 @computer_system_collection.route("/redfish/v1/Systems/", methods=["GET"])
 def get_computer_system_collection():
@@ -37,9 +49,13 @@ def get_computer_system_collection():
                 JSON: JSON with ComputerSystemCollection.
     """
 
-    server_profile_list = g.oneview_client.server_profiles.get_all()
-    server_profile_list = list(filter(lambda i: i.get('serverHardwareUri'),
-                                      server_profile_list))
+    if config.stream_collections_enabled():
+        server_profile_list = []
+    else:
+        server_profile_list = g.oneview_client.server_profiles.\
+            get_all_fields(fields=MEMBER_FIELDS)
+        server_profile_list = list(filter(
+            lambda i: i.get('serverHardwareUri'), server_profile_list))
 
     server_profile_tmpls = \
         g.oneview_client.server_profile_templates.get_all()
@@ -47,8 +63,68 @@ def get_computer_system_collection():
     zone_service = ZoneService(g.oneview_client)
     zone_ids = zone_service.get_zone_ids_by_templates(server_profile_tmpls)
 
+    if config.stream_collections_enabled():
+        csc = ComputerSystemCollection(server_profile_list,
+                                       server_profile_tmpls,
+                                       zone_ids)
+
+        return ResponseBuilder.success_stream(
+            csc, _stream_computer_system_members())
+
     csc = ComputerSystemCollection(server_profile_list,
                                    server_profile_tmpls,
                                    zone_ids)
 
     return ResponseBuilder.success(csc)
+
+
+@computer_system_collection.route(
+    ComputerSystemCollection.RESET_ACTION_URI, methods=["POST"])
+def reset_computer_systems():
+    """Change the power state of many Computer Systems in one call.
+
+        OEM action of the Systems collection. The request has the
+        ResetType and the Members to be reset, as links to the Computer
+        Systems. Each Computer System is reset independently, so the
+        result of each one is reported instead of failing the request.
+
+        Returns:
+            JSON: JSON with the result of each Computer System.
+    """
+    body = request.get_json(silent=True) or {}
+    reset_type = body.get("ResetType")
+    members = body.get("Members")
+
+    if reset_type not in RESET_ALLOWABLE_VALUES_LIST:
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Invalid ResetType: {}".format(reset_type))
+
+    if not members or not isinstance(members, list):
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Members should be a non empty list of Computer Systems")
+
+    try:
+        system_ids = [member["@odata.id"].rstrip("/").split("/")[-1]
+                      for member in members]
+    except (KeyError, TypeError, AttributeError):
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Each member should have a Computer System @odata.id")
+
+    power_action_service = PowerActionService(g.oneview_client)
+    reset_results = power_action_service.reset_computer_systems(
+        system_ids, reset_type)
+
+    return ResponseBuilder.success(
+        BulkResetResult(reset_type, reset_results))
+
+
+def _stream_computer_system_members():
+    """Yields the Systems members as OneView pages are read"""
+
+    server_profile_pages = g.oneview_client.server_profiles.\
+        get_all_fields_pages(fields=MEMBER_FIELDS)
+
+    for page in server_profile_pages:
+        for server_profile in page:
+            if server_profile.get('serverHardwareUri'):
+                yield ComputerSystemCollection.build_member(server_profile)
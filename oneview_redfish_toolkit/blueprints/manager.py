@@ -27,7 +27,7 @@ from hpOneView.exceptions import HPOneViewException
 # Own libs
 from oneview_redfish_toolkit.api.manager import Manager
 from oneview_redfish_toolkit import client_session
-from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import appliance_health_service
 from oneview_redfish_toolkit.services.manager_service import \
     get_oneview_ip_by_manager_uuid
 
@@ -45,9 +45,6 @@ def get_managers(uuid):
             JSON: JSON with Managers info.
     """
     try:
-        state_url = "/controller-state.json"
-        ov_health_status_url = "/rest/appliance/health-status"
-
         ov_ip = get_oneview_ip_by_manager_uuid(uuid)
         if not ov_ip:
             abort(status.HTTP_404_NOT_FOUND,
@@ -55,19 +52,16 @@ def get_managers(uuid):
 
         ov_client = client_session.get_oneview_client(ov_ip)
 
-        ov_appliance_info = multiple_oneview.execute_query_ov_client(
-            ov_client, "appliance_node_information", "get_version"
-        )
-        ov_appliance_state = multiple_oneview.execute_query_ov_client(
-            ov_client, "connection", "get", state_url
-        )
-        ov_appliance_health_status = multiple_oneview.execute_query_ov_client(
-            ov_client, "connection", "get", ov_health_status_url
-        )
+        if appliance_health_service.is_polling_enabled():
+            snapshot = appliance_health_service.get_manager_snapshot(
+                ov_ip, ov_client)
+        else:
+            snapshot = appliance_health_service.read_manager_snapshot(
+                ov_client)
 
-        manager = Manager(ov_appliance_info,
-                          ov_appliance_state,
-                          ov_appliance_health_status
+        manager = Manager(snapshot.appliance_info,
+                          snapshot.appliance_state,
+                          snapshot.appliance_health_status
                           )
 
         json_str = manager.serialize()
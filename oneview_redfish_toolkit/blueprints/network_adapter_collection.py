@@ -14,8 +14,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import re
+
+from flask import abort
 from flask import Blueprint
 from flask import g
+from flask import request
+from flask_api import status
 
 from oneview_redfish_toolkit.api.network_adapter_collection \
     import NetworkAdapterCollection
@@ -25,17 +30,42 @@ from oneview_redfish_toolkit.blueprints.util.response_builder import \
 network_adapter_collection = Blueprint(
     "network_adapter_collection", __name__)
 
+# Supported $expand values: ".", "*" or "~", with an optional $levels
+EXPAND_QUERY_REGEX = re.compile(r"^[.*~](\(\$levels=(\d+)\))?$")
+
 
 @network_adapter_collection.route(
     "/redfish/v1/Chassis/<uuid>/NetworkAdapters/", methods=["GET"])
 def get_network_adapter_collection(uuid):
     """Get the Redfish Network Adapters Collection.
 
-    Return NetworkAdapterCollection Redfish JSON.
+    Return NetworkAdapterCollection Redfish JSON. With the $expand query
+    parameter, like $expand=.($levels=3), the NetworkAdapters and their
+    NetworkPorts and NetworkDeviceFunctions are returned expanded in the
+    collection, all built from a single server hardware query.
     """
+    expand_levels = _get_expand_levels()
 
     server_hardware = g.oneview_client.server_hardware.get_by_id(uuid).data
 
     nic = NetworkAdapterCollection(server_hardware)
 
+    if expand_levels:
+        nic.expand(server_hardware, expand_levels)
+
     return ResponseBuilder.success(nic)
+
+
+def _get_expand_levels():
+    expand = request.args.get("$expand")
+
+    if expand is None:
+        return 0
+
+    match = EXPAND_QUERY_REGEX.match(expand)
+
+    if not match or match.group(2) == "0":
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Invalid $expand query parameter: {}".format(expand))
+
+    return int(match.group(2) or 1)
@@ -21,9 +21,14 @@ from oneview_redfish_toolkit.api.resource_block_collection \
     import ResourceBlockCollection
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services.zone_service import ZoneService
 
 resource_block_collection = Blueprint("resource_block_collection", __name__)
 
+# Attributes of the OneView resources read to build the ResourceBlocks members
+MEMBER_FIELDS = "uri,uuid"
+
 
 @resource_block_collection.route(
     "/redfish/v1/CompositionService/ResourceBlocks/", methods=["GET"])
@@ -38,20 +43,21 @@ def get_resource_block_collection():
             JSON: Redfish json with ResourceBlockCollection.
     """
 
+    filter_volume_list = \
+        ZoneService(g.oneview_client).get_shareable_volumes()
+
+    if config.stream_collections_enabled():
+        members = _stream_resource_block_members(filter_volume_list)
+
+        return ResponseBuilder.success_stream(ResourceBlockCollection(),
+                                              members)
+
     # Gets all server hardware
-    server_hardware_list = g.oneview_client.server_hardware.get_all()
+    server_hardware_list = g.oneview_client.server_hardware.get_all_fields(
+        fields=MEMBER_FIELDS)
     server_profile_template_list = g.oneview_client.\
-        server_profile_templates.get_all()
-    drives_list = g.oneview_client.index_resources \
-        .get_all(category="drives", count=10000)
-    volume_list = g.oneview_client.volumes.get_all()
-    filter_volume_list = [volume for volume in volume_list
-                          if volume["isShareable"]]
-
-    # Emptying volume list to suppress external storage changes for
-    # current release.
-    # In future, remove this line to enable external storage support
-    filter_volume_list = []
+        server_profile_templates.get_all_fields(fields=MEMBER_FIELDS)
+    drives_list = [drive for page in _get_drive_pages() for drive in page]
 
     # Build ResourceBlockCollection object and validates it
     cc = ResourceBlockCollection(server_hardware_list,
@@ -59,3 +65,34 @@ def get_resource_block_collection():
                                  drives_list, filter_volume_list)
 
     return ResponseBuilder.success(cc)
+
+
+def _stream_resource_block_members(external_volume_list):
+    """Yields the ResourceBlocks members as OneView pages are read"""
+
+    resource_pages = [
+        g.oneview_client.server_hardware.get_all_fields_pages(
+            fields=MEMBER_FIELDS),
+        g.oneview_client.server_profile_templates.get_all_fields_pages(
+            fields=MEMBER_FIELDS),
+        _get_drive_pages(),
+        [external_volume_list]
+    ]
+
+    for pages in resource_pages:
+        for page in pages:
+            for block in page:
+                yield ResourceBlockCollection.build_member(block)
+
+
+def _get_drive_pages():
+    """Yields the pages of drives from the OneView index
+
+        The drives are read page by page, without a limit on their number,
+        and only the URI needed to build the ResourceBlock link is kept.
+    """
+    drive_pages = g.oneview_client.index_resources.get_all_pages(
+        category="drives", fields="uri")
+
+    for page in drive_pages:
+        yield [{"uri": drive["uri"]} for drive in page]
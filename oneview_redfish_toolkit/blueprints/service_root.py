@@ -28,6 +28,8 @@ from hpOneView.exceptions import HPOneViewException
 from oneview_redfish_toolkit.api.service_root import ServiceRoot
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import connection
+from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import service_root_service
 
 service_root = Blueprint('service_root', __name__)
 
@@ -36,19 +38,26 @@ service_root = Blueprint('service_root', __name__)
 def get_service_root():
     """Gets ServiceRoot
 
-        Recover OneView UUID from appliance and creates
-        ServiceRoot redfish JSON
+        Creates ServiceRoot redfish JSON with the UUID of the first
+        OneView. The UUID is kept by the logins to the OneViews, so it is
+        only recovered from the appliance until the first login. The JSON
+        is serialized once and served from memory until the UUID changes.
     """
 
     try:
         ov_ip = config.get_oneview_multiple_ips()[0]
-        appliance_node_information = \
-            connection.request_oneview(ov_ip,
-                                       '/rest/appliance/nodeinfo/version')
-        uuid = appliance_node_information['uuid']
+        uuid = multiple_oneview.get_map_appliances().get(ov_ip)
+        json_str = service_root_service.get_service_root(ov_ip, uuid)
+
+        if json_str is None:
+            if uuid is None:
+                appliance_node_information = connection.request_oneview(
+                    ov_ip, '/rest/appliance/nodeinfo/version')
+                uuid = appliance_node_information['uuid']
+
+            json_str = ServiceRoot(uuid).serialize()
+            service_root_service.set_service_root(ov_ip, uuid, json_str)
 
-        sr = ServiceRoot(uuid)
-        json_str = sr.serialize()
         return Response(
             response=json_str,
             status=200,
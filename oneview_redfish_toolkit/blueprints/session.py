@@ -33,20 +33,50 @@ from oneview_redfish_toolkit.blueprints import subscription
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
 from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
 
 session = Blueprint('session', __name__)
 
 
 @session.route(SessionCollection.BASE_URI, methods=["GET"])
 def get_collection():
-    result = SessionCollection(client_session.get_session_ids())
+    """Get the Redfish Session Collection.
+
+    The sessions are paged by the $skip and $top query parameters, with
+    at most collection_page_size sessions per page. A page which is not
+    the last one links the next page in Members@odata.nextLink.
+    """
+    page_size = config.get_collection_page_size()
+    skip = _get_query_integer("$skip", 0)
+    top = min(_get_query_integer("$top", page_size), page_size)
+
+    session_ids, count = client_session.get_session_ids_page(skip, top)
+
+    next_skip = None
+    if session_ids and skip + len(session_ids) < count:
+        next_skip = skip + len(session_ids)
+
+    result = SessionCollection(session_ids, count, next_skip)
     return ResponseBuilder.success(result)
 
 
+def _get_query_integer(name, default):
+    value = request.args.get(name)
+
+    if value is None:
+        return default
+
+    if not value.isdigit():
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Invalid {} query parameter: {}".format(name, value))
+
+    return int(value)
+
+
 @session.route(SessionCollection.BASE_URI + "/" + "<session_id>",
                methods=["GET"])
 def get_session(session_id):
-    if session_id not in client_session.get_session_ids():
+    if not client_session.has_session_id(session_id):
         abort(status.HTTP_404_NOT_FOUND)
 
     return ResponseBuilder.success(Session(session_id))
@@ -29,11 +29,17 @@ from oneview_redfish_toolkit.api.volume import Volume
 from oneview_redfish_toolkit.api.volume_collection import VolumeCollection
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
+from oneview_redfish_toolkit.services.sas_logical_jbod_service import \
+    SasLogicalJbodService
+from oneview_redfish_toolkit.services.server_hardware_type_service import \
+    ServerHardwareTypeService
+from oneview_redfish_toolkit.single_oneview_context import single_oneview
 
 storage = Blueprint("storage", __name__)
 
 
 @storage.route(ComputerSystem.BASE_URI + "/<uuid>/Storage/1", methods=["GET"])
+@single_oneview
 def get_storage(uuid):
     """Get the Redfish Storage for a given UUID.
 
@@ -52,9 +58,10 @@ def get_storage(uuid):
     """
     server_profile = g.oneview_client.server_profiles.get_by_id(uuid).data
     sht_uri = server_profile['serverHardwareTypeUri']
-    server_hardware_type = \
-        g.oneview_client.server_hardware_types.get_by_uri(sht_uri).data
-    sas_logical_jbods = _find_sas_logical_jbods_by(server_profile)
+    server_hardware_type = ServerHardwareTypeService(g.oneview_client)\
+        .get_server_hardware_type(sht_uri)
+    sas_logical_jbods = SasLogicalJbodService(g.oneview_client)\
+        .get_sas_logical_jbods_from_sp(server_profile)
     external_storage_volumes = [volume for volume in server_profile[
         "sanStorage"]["volumeAttachments"]]
 
@@ -69,6 +76,7 @@ def get_storage(uuid):
 @storage.route(ComputerSystem.BASE_URI +
                "/<profile_id>/Storage/1/Drives/<drive_id>",
                methods=["GET"])
+@single_oneview
 def get_drive(profile_id, drive_id):
     """Get the Redfish Storage for a given UUID.
 
@@ -94,7 +102,8 @@ def get_drive(profile_id, drive_id):
 
     server_profile = g.oneview_client.server_profiles.get_by_id(
         profile_id).data
-    sas_logical_jbods = _find_sas_logical_jbods_by(server_profile)
+    sas_logical_jbods = SasLogicalJbodService(g.oneview_client)\
+        .get_sas_logical_jbods_from_sp(server_profile)
 
     logical_jbod = _get_logical_jbod(drive_id_int, logical_jbod,
                                      sas_logical_jbods)
@@ -186,17 +195,6 @@ def _get_logical_jbod(drive_id_int, logical_jbod, sas_logical_jbods):
     return logical_jbod
 
 
-def _find_sas_logical_jbods_by(server_profile):
-    sas_logical_jbods = []
-    for logical_jbod in server_profile["localStorage"]["sasLogicalJBODs"]:
-        if logical_jbod["sasLogicalJBODUri"]:
-            item = g.oneview_client.sas_logical_jbods\
-                .get(logical_jbod["sasLogicalJBODUri"])
-            sas_logical_jbods.append(item)
-
-    return sas_logical_jbods
-
-
 def _is_volume_id_number(volume_id):
     try:
         int(volume_id)
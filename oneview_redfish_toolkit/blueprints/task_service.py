@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# 3rd party libs
+from flask import abort
+from flask import Blueprint
+from flask_api import status
+
+# own libs
+from oneview_redfish_toolkit.api.task import Task
+from oneview_redfish_toolkit.api.task_collection import TaskCollection
+from oneview_redfish_toolkit.api.task_service import TaskService
+from oneview_redfish_toolkit.blueprints.util.response_builder import \
+    ResponseBuilder
+from oneview_redfish_toolkit.services import task_tracker_service
+
+task_service = Blueprint("task_service", __name__)
+
+
+@task_service.route(TaskService.BASE_URI, methods=["GET"])
+def get_task_service():
+    """Get the Redfish Task Service.
+
+        Get method to return TaskService JSON when
+        /redfish/v1/TaskService is requested.
+
+        Returns:
+            JSON: JSON with TaskService.
+    """
+    return ResponseBuilder.success(TaskService())
+
+
+@task_service.route(TaskCollection.BASE_URI, methods=["GET"])
+def get_task_collection():
+    """Get the Redfish Task Collection.
+
+        The Tasks are read from memory, without querying OneView.
+
+        Returns:
+            JSON: JSON with TaskCollection.
+    """
+    task_ids = task_tracker_service.get_task_ids()
+
+    return ResponseBuilder.success(TaskCollection(task_ids))
+
+
+@task_service.route(TaskCollection.BASE_URI + "/<task_id>", methods=["GET"])
+def get_task(task_id):
+    """Get the Redfish Task for a given id.
+
+        The Task is read from memory, without querying OneView.
+
+        Returns:
+            JSON: JSON with Task.
+            When the Task is not found calls abort(404)
+    """
+    tracked_task = task_tracker_service.get_task(task_id)
+
+    if not tracked_task:
+        abort(status.HTTP_404_NOT_FOUND,
+              "Task {} not found".format(task_id))
+
+    return ResponseBuilder.success(Task(tracked_task))
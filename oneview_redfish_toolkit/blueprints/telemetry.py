@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# 3rd party libs
+from flask import abort
+from flask import Blueprint
+from flask_api import status
+
+# own libs
+from oneview_redfish_toolkit.api.metric_report import MetricReport
+from oneview_redfish_toolkit.api.metric_report_collection import \
+    MetricReportCollection
+from oneview_redfish_toolkit.api.telemetry_service import TelemetryService
+from oneview_redfish_toolkit.blueprints.util.response_builder import \
+    ResponseBuilder
+from oneview_redfish_toolkit.services import telemetry_service
+
+telemetry = Blueprint("telemetry", __name__)
+
+
+@telemetry.route(TelemetryService.BASE_URI, methods=["GET"])
+def get_telemetry_service():
+    """Get the Redfish Telemetry Service.
+
+        Get method to return TelemetryService JSON when
+        /redfish/v1/TelemetryService is requested.
+
+        Returns:
+            JSON: JSON with TelemetryService.
+    """
+    return ResponseBuilder.success(
+        TelemetryService(telemetry_service.is_sampling_enabled()))
+
+
+@telemetry.route(MetricReportCollection.BASE_URI, methods=["GET"])
+def get_metric_report_collection():
+    """Get the Redfish Metric Report Collection.
+
+        There is a Metric Report for each sampled OneView utilization
+        metric, only when the telemetry sampling is enabled.
+
+        Returns:
+            JSON: JSON with MetricReportCollection.
+    """
+    report_ids = []
+    if telemetry_service.is_sampling_enabled():
+        report_ids = telemetry_service.METRIC_IDS
+
+    return ResponseBuilder.success(MetricReportCollection(report_ids))
+
+
+@telemetry.route(MetricReportCollection.BASE_URI + "/<report_id>",
+                 methods=["GET"])
+def get_metric_report(report_id):
+    """Get the Redfish Metric Report for a given metric.
+
+        The samples are read from memory. The first read lists the
+        Server Hardware and Enclosures of the OneViews to be sampled,
+        so the following reads return their samples.
+
+        Returns:
+            JSON: JSON with MetricReport.
+            When the report is not found calls abort(404)
+    """
+    if not telemetry_service.is_sampling_enabled() or \
+            report_id not in telemetry_service.METRIC_IDS:
+        abort(status.HTTP_404_NOT_FOUND,
+              "Metric Report {} not found".format(report_id))
+
+    telemetry_service.discover_chassis()
+    metric_values = telemetry_service.get_metric_values(report_id)
+
+    return ResponseBuilder.success(MetricReport(report_id, metric_values))
@@ -28,10 +28,17 @@ from flask_api import status
 from hpOneView.exceptions import HPOneViewException
 from oneview_redfish_toolkit.api.thermal import Thermal
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit.services import telemetry_service
 
 
 thermal = Blueprint("thermal", __name__)
 
+THERMAL_NAME_BY_CATEGORY = {
+    'server-hardware': 'Blade',
+    'enclosures': 'Enclosure',
+    'racks': 'Rack'
+}
+
 
 @thermal.route("/redfish/v1/Chassis/<uuid>/Thermal", methods=["GET"])
 def get_thermal(uuid):
@@ -50,41 +57,20 @@ def get_thermal(uuid):
 
     """
     try:
-        category = ''
-        cached_category = category_resource.get_category_by_resource_id(uuid)
+        thermal_sample = telemetry_service.get_thermal_sample(uuid)
 
-        if cached_category:
-            category = cached_category.resource.replace('_', '-')
-        else:
-            index_obj = g.oneview_client.index_resources.get_all(
-                filter='uuid=' + uuid
-            )
-
-            if index_obj:
-                category = index_obj[0]["category"]
-            else:
-                abort(status.HTTP_404_NOT_FOUND, 'Cannot find Index resource')
-
-        if category == 'server-hardware':
-            try:
-                server_hardware = g.oneview_client.server_hardware. \
-                    get_utilization(uuid, fields='AmbientTemperature')
-            except HPOneViewException as e:
-                abort(status.HTTP_404_NOT_FOUND, e.msg)
-            thrml = Thermal(server_hardware, uuid, 'Blade')
-        elif category == 'enclosures':
-            try:
-                enclosure = g.oneview_client.enclosures. \
-                    get_utilization(uuid, fields='AmbientTemperature')
-            except HPOneViewException as e:
-                abort(status.HTTP_404_NOT_FOUND, e.msg)
-            thrml = Thermal(enclosure, uuid, 'Enclosure')
-        elif category == 'racks':
-            rack = g.oneview_client.racks.\
-                get_device_topology(uuid)
-            thrml = Thermal(rack, uuid, 'Rack')
+        if thermal_sample:
+            category, sample = thermal_sample
         else:
-            abort(status.HTTP_404_NOT_FOUND, 'OneView resource not found')
+            category = _get_category(uuid)
+            sample = _read_thermal_sample(uuid, category)
+
+        name = THERMAL_NAME_BY_CATEGORY[category]
+        reading_time = None
+        if telemetry_service.is_sampling_enabled():
+            reading_time = telemetry_service.get_reading_time(sample)
+
+        thrml = Thermal(sample.utilization, uuid, name, reading_time)
 
         json_str = thrml.serialize()
 
@@ -100,3 +86,46 @@ def get_thermal(uuid):
             abort(status.HTTP_404_NOT_FOUND, "Resource not found")
         else:
             abort(status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _get_category(uuid):
+    cached_category = category_resource.get_category_by_resource_id(uuid)
+
+    if cached_category:
+        return cached_category.resource.replace('_', '-')
+
+    index_obj = g.oneview_client.index_resources.get_all(
+        filter='uuid=' + uuid
+    )
+
+    if not index_obj:
+        abort(status.HTTP_404_NOT_FOUND, 'Cannot find Index resource')
+
+    return index_obj[0]["category"]
+
+
+def _read_thermal_sample(uuid, category):
+    """Reads the ambient temperature of a Chassis from OneView
+
+        When the telemetry sampling is enabled, the Chassis is sampled in
+        background from then on.
+    """
+    if category not in THERMAL_NAME_BY_CATEGORY:
+        abort(status.HTTP_404_NOT_FOUND, 'OneView resource not found')
+
+    if category == 'racks':
+        utilization = g.oneview_client.racks.get_device_topology(uuid)
+    else:
+        resource = 'server_hardware' if category == 'server-hardware' \
+            else 'enclosures'
+        try:
+            utilization = getattr(g.oneview_client, resource).\
+                get_utilization(uuid, fields='AmbientTemperature')
+        except HPOneViewException as e:
+            abort(status.HTTP_404_NOT_FOUND, e.msg)
+
+    if telemetry_service.is_sampling_enabled():
+        return telemetry_service.add_thermal_sample(
+            uuid, category, utilization)
+
+    return telemetry_service.ThermalSample(None, utilization)
@@ -15,13 +15,16 @@
 # under the License.
 
 from collections import namedtuple
+import itertools
 
 from flask import Response
+from flask import stream_with_context
 from flask_api import status
 
 from oneview_redfish_toolkit.api.errors import AUTH_ONEVIEW_ERRORS
 from oneview_redfish_toolkit.api.errors import NOT_FOUND_ONEVIEW_ERRORS
 from oneview_redfish_toolkit.api.redfish_error import RedfishError
+from oneview_redfish_toolkit.api.task import Task
 
 
 ErrorDescription = namedtuple('ErrorDescription', ['description'])
@@ -41,14 +44,47 @@ class ResponseBuilder(object):
     def success(api_data, headers={}):
         return ResponseBuilder.response(api_data, status.HTTP_200_OK, headers)
 
+    @staticmethod
+    def success_stream(api_data, members, headers={}):
+        """Builds a 200 response streaming the collection members
+
+            The first member is read before the response is built, so
+            the errors of the first OneView page are answered by the
+            error handlers, and the OneViews skipped by their circuit
+            breaker are known when the response headers are set. An error
+            of a later page ends the Members streamed so far.
+        """
+        members = iter(members)
+        first_members = list(itertools.islice(members, 1))
+
+        return Response(
+            response=stream_with_context(api_data.serialize_stream(
+                itertools.chain(first_members, members))),
+            status=status.HTTP_200_OK,
+            mimetype="application/json",
+            headers=headers)
+
     @staticmethod
     def success_201(api_data, headers={}):
         return ResponseBuilder.response(api_data, status.HTTP_201_CREATED,
                                         headers)
 
+    @staticmethod
+    def success_202(api_data, headers={}):
+        return ResponseBuilder.response(api_data, status.HTTP_202_ACCEPTED,
+                                        headers)
+
+    @staticmethod
+    def accepted_task(tracked_task):
+        """Builds the 202 response of an operation running in background"""
+        task = Task(tracked_task)
+
+        return ResponseBuilder.success_202(
+            task, {"Location": task.redfish["@odata.id"]})
+
     @staticmethod
     def error_by_hp_oneview_exception(exception):
-        error_code = exception.oneview_response['errorCode']
+        error_code = (exception.oneview_response or {}).get('errorCode')
         http_error_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
         if error_code in NOT_FOUND_ONEVIEW_ERRORS:
@@ -111,6 +147,13 @@ class ResponseBuilder(object):
         return ResponseBuilder.response(redfish_error,
                                         status.HTTP_501_NOT_IMPLEMENTED)
 
+    @staticmethod
+    def error_503(error):
+        redfish_error = RedfishError(
+            "ServiceTemporarilyUnavailable", error.description)
+        return ResponseBuilder.response(redfish_error,
+                                        status.HTTP_503_SERVICE_UNAVAILABLE)
+
     @staticmethod
     def error_400(error):
         redfish_error = RedfishError(
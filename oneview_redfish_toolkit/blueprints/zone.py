@@ -46,38 +46,24 @@ def get_zone(zone_uuid):
     template_id, enclosure_id = ZoneService.\
         split_zone_id_to_spt_uuid_and_enclosure_id(zone_uuid)
 
+    zone_service = ZoneService(g.oneview_client)
+
     profile_template = g.oneview_client.server_profile_templates.get_by_id(
         template_id).data
-    sh_type_uri = profile_template['serverHardwareTypeUri']
     enclosure_name = None
 
     if enclosure_id:
         enclosure = g.oneview_client.enclosures.get_by_id(enclosure_id).data
         enclosure_name = enclosure["name"]
-        drives = _get_drives(enclosure)
-        sh_filter = [
-            "locationUri='{}'".format(enclosure['uri']),
-            "serverHardwareTypeUri='{}'".format(sh_type_uri)
-        ]
+        drives = zone_service.get_drives_by_enclosure(enclosure)
+        server_hardware_list = zone_service.get_server_hardware_by_zone(
+            profile_template, enclosure["uri"])
     else:
         drives = []
-        enclosure_group_uri = profile_template["enclosureGroupUri"]
-        sh_filter = [
-            "serverGroupUri='{}'".format(enclosure_group_uri),
-            "serverHardwareTypeUri='{}'".format(sh_type_uri)
-        ]
-
-    server_hardware_list = g.oneview_client.server_hardware.get_all(
-        filter=sh_filter)
-
-    volume_list = g.oneview_client.volumes.get_all()
-    filter_volume_list = [volume for volume in volume_list
-                          if volume["isShareable"]]
+        server_hardware_list = zone_service.get_server_hardware_by_zone(
+            profile_template)
 
-    # Emptying volume list to suppress external storage changes for
-    # current release.
-    # In future, remove this line to enable external storage support
-    filter_volume_list = []
+    filter_volume_list = zone_service.get_shareable_volumes()
 
     zone_data = Zone(zone_uuid, profile_template, server_hardware_list,
                      enclosure_name, drives, filter_volume_list)
@@ -91,24 +77,3 @@ def get_zone(zone_uuid):
         "ResourceBlocks listed on Zone: " + str(blocks_count))
 
     return ResponseBuilder.success(zone_data)
-
-
-def _get_drives(enclosure):
-    drive_encl_assoc_uri = "/rest/index/associations/resources" \
-                           "?parenturi={}&category=drive-enclosures"\
-        .format(enclosure["uri"])
-    drive_encl_assoc = g.oneview_client.connection.get(drive_encl_assoc_uri)
-    get_drives_uri = '/rest/index/resources' \
-        '?category=drives&count=10000' \
-        '&filter="driveEnclosureUri:{}"'
-    drives = []
-    for member in drive_encl_assoc["members"]:
-        drive_encl_uri = member["childResource"]["uri"]
-        drives_index_list = g.oneview_client.connection.get(
-            get_drives_uri.format(drive_encl_uri))
-
-        drives = [drive for drive in drives_index_list["members"]
-                  if drive["attributes"].get('capacityInGB') and
-                  int(drive["attributes"]["capacityInGB"]) > 0]
-
-    return drives
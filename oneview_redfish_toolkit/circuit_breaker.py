@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import collections
+import threading
+import time
+
+# 3rd party libs
+from hpOneView.exceptions import HPOneViewException
+
+# Modules own libs
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
+from oneview_redfish_toolkit import config
+
+
+CLOSED = "Closed"
+OPEN = "Open"
+HALF_OPEN = "HalfOpen"
+
+# Number of the last calls to an appliance used to compute its error rate
+CALLS_WINDOW_SIZE = 20
+
+# Minimum number of calls in the window before the circuit can open
+MIN_CALLS_TO_OPEN = 5
+
+lock = threading.Lock()
+
+# Circuit breakers by OneView IP: {ov_ip: CircuitBreaker}
+map_circuit_breakers = dict()
+
+
+def init_map_circuit_breakers():
+    global map_circuit_breakers
+    map_circuit_breakers = dict()
+
+
+def is_enabled():
+    return config.get_circuit_breaker_error_rate() > 0
+
+
+def allow_request(ov_ip):
+    """Checks if an appliance can be queried
+
+        The circuit of an appliance opens when the rate of its last calls
+        that failed or were slow reaches the circuit_breaker_error_rate
+        configuration. Its queries are then rejected for the cooldown, so
+        the requests do not wait on it. After the cooldown, a single
+        query probes the appliance: the circuit closes when it succeeds,
+        and opens again for another cooldown when it fails.
+
+        The check does not start the probe, which is only started by the
+        call querying the appliance.
+
+        Args:
+            ov_ip: IP of the OneView appliance
+
+        Returns:
+            bool: False when the circuit of the appliance is open, or
+            while it is probed
+    """
+    if not is_enabled():
+        return True
+
+    with lock:
+        return _get_circuit_breaker(ov_ip).allow_request(
+            time.time(), config.get_circuit_breaker_cooldown())
+
+
+def call(ov_ip, function, *args, **kwargs):
+    """Calls a function querying an appliance, recording its outcome
+
+        A call fails when it raises an error other than a OneView error,
+        as an appliance answering with an error is available, or when it
+        takes longer than the circuit_breaker_slow_call configuration.
+        The connection errors raised by hpOneView as a HPOneViewException
+        without a OneView response are failures too.
+
+        Args:
+            ov_ip: IP of the OneView appliance
+            function: function querying the appliance
+            *args: arguments of the function
+            **kwargs: keyword arguments of the function
+
+        Returns:
+            the result of the function
+
+        Raises:
+            OneViewRedfishUnavailableException: when the circuit of the
+            appliance is open, or when another call is probing it
+    """
+    if not is_enabled():
+        return function(*args, **kwargs)
+
+    with lock:
+        acquired = _get_circuit_breaker(ov_ip).acquire(
+            time.time(), config.get_circuit_breaker_cooldown())
+
+    if not acquired:
+        raise OneViewRedfishUnavailableException(
+            "OneView {} is unavailable".format(ov_ip))
+
+    start_time = time.time()
+
+    try:
+        result = function(*args, **kwargs)
+    except Exception as e:
+        record_call(ov_ip, time.time() - start_time,
+                    failed=is_connection_error(e))
+        raise
+
+    record_call(ov_ip, time.time() - start_time)
+
+    return result
+
+
+def is_connection_error(exception):
+    """Checks if an error means the appliance could not be reached
+
+        Any error other than a OneView error is a connection error. The
+        connection errors raised by hpOneView are a HPOneViewException
+        without the OneView response.
+    """
+    if isinstance(exception, HPOneViewException):
+        return not exception.oneview_response
+
+    return True
+
+
+def record_call(ov_ip, elapsed_time, failed=False):
+    """Records the outcome of a call to an appliance
+
+        Args:
+            ov_ip: IP of the OneView appliance
+            elapsed_time: seconds taken by the call
+            failed: True when the call could not reach the appliance
+    """
+    if not is_enabled():
+        return
+
+    failed = failed or \
+        elapsed_time >= config.get_circuit_breaker_slow_call()
+
+    with lock:
+        _get_circuit_breaker(ov_ip).record_call(
+            failed, time.time(), config.get_circuit_breaker_error_rate())
+
+
+def get_state(ov_ip):
+    """Gets the state of the circuit of an appliance"""
+    with lock:
+        circuit_breaker = map_circuit_breakers.get(ov_ip)
+
+        return circuit_breaker.state if circuit_breaker else CLOSED
+
+
+def _get_circuit_breaker(ov_ip):
+    circuit_breaker = map_circuit_breakers.get(ov_ip)
+
+    if not circuit_breaker:
+        circuit_breaker = CircuitBreaker()
+        map_circuit_breakers[ov_ip] = circuit_breaker
+
+    return circuit_breaker
+
+
+class CircuitBreaker(object):
+    """Outcome of the last calls to an appliance and state of its circuit"""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failed_calls = collections.deque(maxlen=CALLS_WINDOW_SIZE)
+        self.opened_at = None
+
+    def allow_request(self, now, cooldown):
+        """Checks if the appliance can be queried
+
+            A probe not answered after a cooldown is considered lost, so
+            another probe is allowed.
+
+            Args:
+                now: current time in seconds
+                cooldown: seconds the circuit stays open
+
+            Returns:
+                bool: False when the circuit is open or being probed
+        """
+        return self.state == CLOSED or now - self.opened_at >= cooldown
+
+    def acquire(self, now, cooldown):
+        """Takes the permit to query the appliance, probing it if needed
+
+            Args:
+                now: current time in seconds
+                cooldown: seconds the circuit stays open
+
+            Returns:
+                bool: False when the circuit is open or being probed
+        """
+        if not self.allow_request(now, cooldown):
+            return False
+
+        if self.state != CLOSED:
+            self.state = HALF_OPEN
+            self.opened_at = now
+
+        return True
+
+    def record_call(self, failed, now, error_rate):
+        """Records the outcome of a call, opening or closing the circuit
+
+            Args:
+                failed: True when the call failed or was slow
+                now: current time in seconds
+                error_rate: percentage of failed calls opening the circuit
+        """
+        if self.state == HALF_OPEN:
+            if failed:
+                self._open(now)
+            else:
+                self._close()
+            return
+
+        self.failed_calls.append(failed)
+
+        if self.state == CLOSED and \
+                len(self.failed_calls) >= MIN_CALLS_TO_OPEN and \
+                100 * sum(self.failed_calls) >= \
+                error_rate * len(self.failed_calls):
+            self._open(now)
+
+    def _open(self, now):
+        self.state = OPEN
+        self.opened_at = now
+
+    def _close(self):
+        self.state = CLOSED
+        self.failed_calls.clear()
+        self.opened_at = None
@@ -16,8 +16,16 @@
 
 # Python libs
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+import hashlib
+import heapq
+import hmac
+from itertools import islice
 import logging
 import logging.config
+import os
 import threading
 from threading import Lock
 import time
@@ -25,11 +33,13 @@ import uuid
 
 # 3rd party libs
 from flask import abort
+from flask import has_request_context
 from flask import request
 from flask_api import status
-from hpOneView import HPOneViewException
 
 # Modules own libs
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import connection
 from oneview_redfish_toolkit import multiple_oneview
@@ -39,10 +49,41 @@ from oneview_redfish_toolkit import multiple_oneview
 #   globals()['map_clients']
 
 
-GC_FREQUENCY_IN_SEC = 12 * 60 * 60
+GC_FREQUENCY_IN_SEC = 5 * 60
+
+# Maximum number of OneView sessions checked at the same time by the GC
+GC_MAX_CONCURRENT_CHECKS = 10
+
+# Interval between the logins to the OneViews unavailable on start
+RETRY_LOGIN_INTERVAL_IN_SEC = 60
 
 lock = Lock()
 
+# IPs of the OneViews not logged in yet in the conf authentication mode
+unavailable_ov_ips = set()
+
+# Process of the thread logging in to the unavailable OneViews:
+# {'pid': process id}
+map_oneview_reconnector = dict()
+
+# OneView clients shared by the sessions of the same user:
+# {(userName, authLoginDomain, password digest, OneView IP): PooledClient}
+map_pooled_clients = dict()
+
+# Key of the password digests, so the passwords are not kept in memory
+PASSWORD_DIGEST_KEY = os.urandom(16)
+
+# Expiry index of the sessions: a heap of (expiry time, token), with the
+# last use of each token in map_token_last_use. An expired entry is only
+# evicted when its token was not used since, otherwise it is pushed back
+# with the new expiry time, so a request only updates the last use.
+token_expiry_heap = []
+map_token_last_use = dict()
+
+# Redfish tokens by session id, in the creation order of the sessions:
+# {session_id: token}
+map_token_by_session_id = OrderedDict()
+
 
 def _get_map_clients():
     return globals()['map_clients']
@@ -50,6 +91,15 @@ def _get_map_clients():
 
 def init_map_clients():
     globals()['map_clients'] = OrderedDict()
+    unavailable_ov_ips.clear()
+    del token_expiry_heap[:]
+    map_token_last_use.clear()
+    map_token_by_session_id.clear()
+
+
+def init_map_pooled_clients():
+    global map_pooled_clients
+    map_pooled_clients = dict()
 
 
 def init_gc_for_expired_sessions():
@@ -62,44 +112,119 @@ def _gc_for_expired_sessions():
         time.sleep(GC_FREQUENCY_IN_SEC)
         logging.debug('Verifying expired sessions...')
 
-        tokens_to_remove = []
-        map_items = _get_map_clients().items()
-        for token, dict_by_token in map_items:
-            ov_clients = iter(dict_by_token['client_ov_by_ip'].values())
-            ov_client = next(ov_clients)  # ov_clients can be in any order
-            ov_session_id = ov_client.connection.get_session_id()
-            try:
-                # request that does not increment the life of Oneview session
-                resp, body = ov_client.connection.do_http(
-                    'GET',
-                    '/rest/sessions/',
-                    '',
-                    {'Session-Id': ov_session_id}
-                )
-
-                # when is not a success
-                if resp.status not in range(200, 300):
-                    if resp.status == 404:
-                        tokens_to_remove.append(token)
-                    else:
-                        logging.error('Unexpected response with status {} '
-                                      'of Oneview sessions endpoint: {}'
-                                      .format(resp.status, body))
-
-            except Exception as e:
-                logging.exception('Unexpected error: {}'.format(e))
-
-        for token in tokens_to_remove:
+        evict_idle_sessions()
+        _remove_sessions_expired_on_oneview()
+        evict_idle_pooled_clients()
+
+
+def evict_idle_sessions():
+    """Removes the sessions not used for the session_idle_timeout"""
+    idle_timeout = config.get_session_idle_timeout()
+    now = time.time()
+    idle_tokens = []
+
+    with lock:
+        while token_expiry_heap and token_expiry_heap[0][0] <= now:
+            _, token = heapq.heappop(token_expiry_heap)
+            last_use = map_token_last_use.get(token)
+
+            # the session was already removed
+            if last_use is None:
+                continue
+
+            if last_use + idle_timeout > now:
+                heapq.heappush(token_expiry_heap,
+                               (last_use + idle_timeout, token))
+            else:
+                idle_tokens.append(token)
+
+    for token in idle_tokens:
+        logging.debug('Removing the idle session of token {}'.format(token))
+        clear_session_by_token(token)
+
+
+def _remove_sessions_expired_on_oneview():
+    """Removes the sessions whose OneView session has expired
+
+        The sessions sharing the same OneView client are checked with a
+        single request, and the OneView sessions are checked
+        concurrently, at most GC_MAX_CONCURRENT_CHECKS at a time.
+    """
+    with lock:
+        session_items = list(_get_map_clients().items())
+
+    ov_clients_by_id = OrderedDict()
+    tokens_by_client_id = dict()
+    for token, dict_by_token in session_items:
+        ov_clients = iter(dict_by_token['client_ov_by_ip'].values())
+        ov_client = next(ov_clients)  # ov_clients can be in any order
+        ov_clients_by_id[id(ov_client)] = ov_client
+        tokens_by_client_id.setdefault(id(ov_client), []).append(token)
+
+    if not ov_clients_by_id:
+        return
+
+    with ThreadPoolExecutor(max_workers=GC_MAX_CONCURRENT_CHECKS) as executor:
+        expired_by_client_id = zip(
+            ov_clients_by_id,
+            executor.map(_is_oneview_session_expired,
+                         ov_clients_by_id.values()))
+
+    for client_id, expired in expired_by_client_id:
+        if not expired:
+            continue
+
+        _remove_pooled_client(ov_clients_by_id[client_id])
+
+        for token in tokens_by_client_id[client_id]:
             clear_session_by_token(token)
 
 
+def _is_oneview_session_expired(ov_client):
+    ov_session_id = ov_client.connection.get_session_id()
+    try:
+        # request that does not increment the life of Oneview session
+        resp, body = ov_client.connection.do_http(
+            'GET',
+            '/rest/sessions/',
+            '',
+            {'Session-Id': ov_session_id}
+        )
+
+        # when is not a success
+        if resp.status not in range(200, 300):
+            if resp.status == 404:
+                return True
+
+            logging.error('Unexpected response with status {} '
+                          'of Oneview sessions endpoint: {}'
+                          .format(resp.status, body))
+
+    except Exception as e:
+        logging.exception('Unexpected error: {}'.format(e))
+
+    return False
+
+
 def _set_new_client_by_token(redfish_token, client_ov_by_ip):
+    now = time.time()
+    session_id = str(uuid.uuid4())
+
     with lock:
+        _remove_session_by_token(redfish_token)
+
         globals()['map_clients'][redfish_token] = {
             'client_ov_by_ip': client_ov_by_ip,
-            'session_id': str(uuid.uuid4())
+            'session_id': session_id
         }
 
+        map_token_by_session_id[session_id] = redfish_token
+
+        map_token_last_use[redfish_token] = now
+        heapq.heappush(token_expiry_heap,
+                       (now + config.get_session_idle_timeout(),
+                        redfish_token))
+
 
 def get_session_id_by_token(token):
     session_dict = _get_map_clients().get(token)
@@ -109,59 +234,410 @@ def get_session_id_by_token(token):
     return None
 
 
+def get_current_session_id():
+    """Gets the Redfish session id of the current request
+
+        Returns:
+            str: the session id, or None in the conf authentication mode
+            and outside of a request
+    """
+    if not config.auth_mode_is_session() or not has_request_context():
+        return None
+
+    return get_session_id_by_token(request.headers.get('x-auth-token'))
+
+
+def get_token_by_session_id(session_id):
+    return map_token_by_session_id.get(session_id)
+
+
 def _set_new_clients_by_ip(ov_clients_by_ip):
     with lock:
         globals()['map_clients'] = ov_clients_by_ip
 
 
 def get_session_ids():
-    session_map_items = _get_map_clients().items()
-    return [sess_dict['session_id'] for _, sess_dict in session_map_items]
+    with lock:
+        return list(map_token_by_session_id)
+
+
+def get_session_ids_page(skip, top):
+    """Gets a page of the session ids, in the creation order of the sessions
+
+        Args:
+            skip: number of sessions before the page
+            top: maximum number of sessions in the page
+
+        Returns:
+            tuple: list of the session ids in the page and the total number
+            of sessions
+    """
+    with lock:
+        return (list(islice(map_token_by_session_id, skip, skip + top)),
+                len(map_token_by_session_id))
+
+
+def has_session_id(session_id):
+    return session_id in map_token_by_session_id
 
 
 def clear_session_by_token(token):
     with lock:
-        if token in _get_map_clients():
-            del _get_map_clients()[token]
+        _remove_session_by_token(token)
+
+        map_token_last_use.pop(token, None)
+
+        _release_pooled_clients(token)
+
+
+def _release_pooled_clients(token):
+    """Releases the pooled clients used by a token, called with lock"""
+    for pooled_client in map_pooled_clients.values():
+        pooled_client.release(token)
+
+
+def _remove_session_by_token(token):
+    session_dict = _get_map_clients().pop(token, None)
+
+    if session_dict:
+        map_token_by_session_id.pop(session_dict['session_id'], None)
 
 
 def login(username, password):
-    try:
-        clients_ov_by_ip = dict()
-        tokens = []
+    """Logs in to all OneViews and creates a Redfish session
+
+        The OneViews are logged in to concurrently, each one limited by
+        the oneview_login_timeout configuration. When degraded sessions
+        are allowed, the session is created with the OneViews logged in
+        if at least one login succeeded, otherwise any failed login fails
+        the session.
+
+        The OneView clients of a user are pooled while the
+        session_pool_idle_timeout configuration is set, so the sessions
+        of the same user share the OneView sessions, instead of logging
+        in to each OneView again. The pooled clients are acquired for
+        the login until the session is created, so they are not evicted
+        as idle while the other OneViews are logged in to.
+
+        Returns:
+            tuple: the Redfish token and the session id
+    """
+    evict_idle_pooled_clients()
+
+    # the pooled clients are acquired for the login with a unique token
+    login_token = object()
+    ov_ips = config.get_oneview_multiple_ips()
+    results = run_on_oneviews(
+        ov_ips, partial(_login_oneview, username=username,
+                        password=password, login_token=login_token),
+        config.get_oneview_login_timeout(),
+        partial(_logout_late_login, login_token=login_token))
+
+    clients_ov_by_ip = OrderedDict()
+    errors = []
+    for ip, result in results.items():
+        if isinstance(result, Exception):
+            logging.error('Failed to log in to OneView {}: {}'
+                          .format(ip, result))
+            errors.append(result)
+        else:
+            clients_ov_by_ip[ip] = result
+
+    if errors and \
+            not (clients_ov_by_ip and config.degraded_sessions_allowed()):
+        logging.exception('Unauthorized error: {}'.format(errors[0]))
 
-        for ip in config.get_oneview_multiple_ips():
-            oneview_client = connection.new_oneview_client(ip, username,
-                                                           password)
-            tokens.append(oneview_client.connection.get_session_id())
+        with lock:
+            _release_pooled_clients(login_token)
 
-            clients_ov_by_ip[ip] = oneview_client
-            _set_manager_into_appliances_map(ip, oneview_client)
+        raise errors[0]
 
-        redfish_token = tokens[0]
+    if errors:
+        logging.warning('Creating a degraded session with the OneViews {}'
+                        .format(list(clients_ov_by_ip)))
 
-        _set_new_client_by_token(redfish_token, clients_ov_by_ip)
+    first_client = next(iter(clients_ov_by_ip.values()))
+    redfish_token = first_client.connection.get_session_id()
 
-        return redfish_token, get_session_id_by_token(redfish_token)
-    except HPOneViewException as e:
-        logging.exception('Unauthorized error: {}'.format(e))
-        raise e
+    with lock:
+        # the OneView session is already shared with another session
+        if redfish_token in _get_map_clients():
+            redfish_token = uuid.uuid4().hex
 
+        for pooled_client in map_pooled_clients.values():
+            if pooled_client.client in clients_ov_by_ip.values():
+                pooled_client.acquire(redfish_token)
+
+        _release_pooled_clients(login_token)
+
+    _set_new_client_by_token(redfish_token, dict(clients_ov_by_ip))
+
+    return redfish_token, get_session_id_by_token(redfish_token)
+
+
+def run_on_oneviews(ov_ips, function, timeout, on_late_result=None):
+    """Runs a function for each OneView concurrently
+
+        Args:
+            ov_ips: list of OneView IPs
+            function: function receiving the OneView IP
+            timeout: maximum number of seconds to wait for all OneViews
+            on_late_result: function receiving the result of a function
+                finished after the timeout, as its result is not used
+
+        Returns:
+            OrderedDict: the function result for each OneView IP, in the
+            ov_ips order, or the exception raised by the function, which
+            is a OneViewRedfishUnavailableException when it timed out
+    """
+    executor = ThreadPoolExecutor(max_workers=max(len(ov_ips), 1))
+    futures = [(ip, executor.submit(function, ip)) for ip in ov_ips]
+    executor.shutdown(wait=False)
+
+    deadline = time.time() + timeout
+    results = OrderedDict()
+    for ip, future in futures:
+        try:
+            results[ip] = future.result(
+                timeout=max(deadline - time.time(), 0))
+        except FutureTimeoutError:
+            results[ip] = OneViewRedfishUnavailableException(
+                'Timed out after {} seconds waiting for OneView {}'
+                .format(timeout, ip))
+
+            if on_late_result:
+                future.add_done_callback(
+                    partial(_handle_late_result, on_late_result))
+        except Exception as e:
+            results[ip] = e
+
+    return results
+
+
+def _handle_late_result(on_late_result, future):
+    if not future.cancelled() and future.exception() is None:
+        on_late_result(future.result())
+
+
+def _logout_late_login(oneview_client, login_token=None):
+    """Logs out of a OneView logged in after the login timeout
+
+        The client is not used by the login that timed out, so its
+        OneView session is logged out, unless a pooled client has been
+        shared by another session meanwhile.
+    """
+    with lock:
+        for key, pooled_client in list(map_pooled_clients.items()):
+            if pooled_client.client is oneview_client:
+                pooled_client.release(login_token)
+
+                if pooled_client.tokens:
+                    return
+
+                del map_pooled_clients[key]
 
-def login_conf_mode():
     try:
-        clients_ov_by_ip = dict()
+        oneview_client.connection.logout()
+    except Exception as e:
+        logging.warning('Failed to log out of a OneView session logged in '
+                        'after the timeout: {}'.format(e))
+
+
+def _login_oneview(ip, username=None, password=None, login_token=None):
+    if config.auth_mode_is_session() and \
+            config.get_session_pool_idle_timeout():
+        return _get_pooled_client(ip, username, password, login_token)
+
+    oneview_client = connection.new_oneview_client(ip, username, password)
+    _set_manager_into_appliances_map(ip, oneview_client)
+
+    return oneview_client
+
+
+def _get_pooled_client(ip, username, password, login_token):
+    """Gets the pooled OneView client of a user, logging in if needed
+
+        The clients are pooled by the digest of the password too, so a
+        client is only shared by the sessions created with the password
+        of its login, and a wrong password still fails on OneView.
+
+        The client is acquired for login_token under the lock, so it is
+        not evicted as idle before the login creates its session.
+    """
+    credentials = connection.create_credentials(username, password)
+    password_digest = hmac.new(PASSWORD_DIGEST_KEY,
+                               password.encode('utf-8'),
+                               hashlib.sha256).digest()
+    key = (credentials["userName"], credentials.get("authLoginDomain"),
+           password_digest, ip)
+
+    with lock:
+        pooled_client = map_pooled_clients.get(key)
+        if pooled_client:
+            pooled_client.acquire(login_token)
+            return pooled_client.client
+
+    oneview_client = connection.new_oneview_client(ip, username, password)
+    _set_manager_into_appliances_map(ip, oneview_client)
+
+    with lock:
+        pooled_client = map_pooled_clients.setdefault(
+            key, PooledClient(oneview_client))
+        pooled_client.acquire(login_token)
+
+    # Another login of the same user was pooled first
+    if pooled_client.client is not oneview_client:
+        try:
+            oneview_client.connection.logout()
+        except Exception as e:
+            logging.warning('Failed to log out of a duplicated OneView '
+                            'session: {}'.format(e))
+
+    return pooled_client.client
+
+
+def evict_idle_pooled_clients():
+    """Logs out of the pooled OneView clients idle for too long
+
+        A pooled client is idle while no session uses it, and is evicted
+        after the session_pool_idle_timeout configuration.
+    """
+    idle_timeout = config.get_session_pool_idle_timeout()
+
+    with lock:
+        idle_keys = [key for key, pooled_client in map_pooled_clients.items()
+                     if pooled_client.is_idle(idle_timeout)]
+        idle_clients = [map_pooled_clients.pop(key).client
+                        for key in idle_keys]
+
+    for oneview_client in idle_clients:
+        try:
+            oneview_client.connection.logout()
+        except Exception as e:
+            logging.warning('Failed to log out of an idle OneView '
+                            'session: {}'.format(e))
+
+
+def _remove_pooled_client(oneview_client):
+    with lock:
+        for key, pooled_client in list(map_pooled_clients.items()):
+            if pooled_client.client is oneview_client:
+                del map_pooled_clients[key]
 
-        for ip in config.get_oneview_multiple_ips():
-            oneview_client = connection.new_oneview_client(ip)
-            clients_ov_by_ip[ip] = oneview_client
 
-            _set_manager_into_appliances_map(ip, oneview_client)
+def is_oneview_available(ip):
+    """Checks if a OneView is available in the current session
 
-        _set_new_clients_by_ip(clients_ov_by_ip)
-    except HPOneViewException as e:
-        logging.exception('Unauthorized error: {}'.format(e))
-        raise e
+        A degraded session only has the clients of some OneViews, so the
+        other OneViews are not queried in that session. In the conf
+        authentication mode, the OneViews that failed to log in on start
+        are not available until they are logged in by the background
+        thread, which is started by the first check.
+
+        Args:
+            ip: the OneView IP
+
+        Returns:
+            bool: False when the session has no client of the OneView
+    """
+    if config.auth_mode_is_conf() and ip in unavailable_ov_ips:
+        _start_oneview_reconnector()
+        return False
+
+    if not config.auth_mode_is_session() or not has_request_context():
+        return True
+
+    session_dict = globals().get('map_clients', dict()).get(
+        request.headers.get('x-auth-token'))
+
+    return not session_dict or ip in session_dict['client_ov_by_ip']
+
+
+def login_unavailable_oneviews():
+    """Logs in to the OneViews that failed to log in on start
+
+        Each OneView logged in is added to the clients and becomes
+        available to the requests.
+    """
+    results = run_on_oneviews(sorted(unavailable_ov_ips), _login_oneview,
+                              config.get_oneview_login_timeout(),
+                              _logout_late_login)
+
+    for ip, result in results.items():
+        if isinstance(result, Exception):
+            logging.warning('OneView {} is still unavailable: {}'
+                            .format(ip, result))
+            continue
+
+        with lock:
+            _get_map_clients()[ip] = result
+            unavailable_ov_ips.discard(ip)
+
+        logging.info('OneView {} is available'.format(ip))
+
+
+def _start_oneview_reconnector():
+    """Starts the thread logging in to the unavailable OneViews
+
+        Like the other background threads, it is only started by the
+        process that serves the requests, even when the toolkit is
+        daemonized after the initialization.
+    """
+    with lock:
+        if map_oneview_reconnector.get('pid') == os.getpid():
+            return
+
+        map_oneview_reconnector['pid'] = os.getpid()
+
+    reconnector_thread = threading.Thread(
+        target=_login_unavailable_oneviews_periodically, daemon=True)
+    reconnector_thread.start()
+
+
+def _login_unavailable_oneviews_periodically():
+    while unavailable_ov_ips:
+        time.sleep(RETRY_LOGIN_INTERVAL_IN_SEC)
+
+        try:
+            login_unavailable_oneviews()
+        except Exception as e:
+            logging.exception('Error while logging in to OneViews: {}'
+                              .format(e))
+
+
+def login_conf_mode():
+    """Logs in to all OneViews with the credentials of the configuration
+
+        The OneViews are logged in to concurrently, each one limited by
+        the oneview_login_timeout configuration. When degraded start is
+        allowed, the toolkit starts with the OneViews logged in and the
+        others are logged in to again in background, becoming available
+        once logged in. Otherwise any failed login fails the start.
+    """
+    results = run_on_oneviews(config.get_oneview_multiple_ips(),
+                              _login_oneview,
+                              config.get_oneview_login_timeout(),
+                              _logout_late_login)
+
+    clients_ov_by_ip = OrderedDict()
+    failed_ov_ips = []
+    for ip, result in results.items():
+        if not isinstance(result, Exception):
+            clients_ov_by_ip[ip] = result
+            continue
+
+        if not config.degraded_start_allowed():
+            logging.exception('Unauthorized error: {}'.format(result))
+            raise result
+
+        logging.warning('Starting without the OneView {}: {}'
+                        .format(ip, result))
+        failed_ov_ips.append(ip)
+
+    _set_new_clients_by_ip(clients_ov_by_ip)
+
+    with lock:
+        unavailable_ov_ips.update(failed_ov_ips)
 
 
 def check_authentication(rf_token):
@@ -170,6 +646,10 @@ def check_authentication(rf_token):
         logging.exception(msg)
         abort(status.HTTP_401_UNAUTHORIZED, msg)
 
+    with lock:
+        if rf_token in map_token_last_use:
+            map_token_last_use[rf_token] = time.time()
+
 
 def _get_oneview_client_by_token(ip_oneview, token=None):
     try:
@@ -203,3 +683,34 @@ def get_oneview_client(ip_oneview, token=None):
 def _set_manager_into_appliances_map(ip, oneview_client):
     manager = oneview_client.appliance_node_information.get_version()
     multiple_oneview.set_map_appliances_entry(ip, manager["uuid"])
+
+
+class PooledClient(object):
+    """OneView client shared by the sessions of a user"""
+
+    def __init__(self, client):
+        """PooledClient constructor
+
+            Args:
+                client: the OneView client logged in
+        """
+        self.client = client
+        self.tokens = set()
+        self.idle_since = time.time()
+
+    def acquire(self, token):
+        self.tokens.add(token)
+
+    def release(self, token):
+        if token not in self.tokens:
+            return
+
+        self.tokens.discard(token)
+
+        if not self.tokens:
+            self.idle_since = time.time()
+
+    def is_idle(self, idle_timeout):
+        """Checks if no session has used the client for idle_timeout"""
+        return not self.tokens and \
+            time.time() - self.idle_since >= idle_timeout
@@ -16,6 +16,7 @@
 
 # Python libs
 import collections
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 import glob
 import json
@@ -35,6 +36,29 @@ from oneview_redfish_toolkit import util
 
 API_VERSION = 1200
 
+DEFAULT_COLLECTION_PAGE_SIZE = 500
+
+DEFAULT_SERVER_HARDWARE_TYPE_TTL = 86400  # seconds
+
+DEFAULT_ZONE_INDEX_TTL = 300  # seconds
+
+DEFAULT_BULK_ACTION_MAX_CONCURRENCY = 10
+DEFAULT_ASYNC_ACTIONS_MAX_WORKERS = 10
+
+DEFAULT_TELEMETRY_SAMPLING_INTERVAL = 0  # seconds, 0 disables sampling
+
+DEFAULT_ONEVIEW_LOGIN_TIMEOUT = 30  # seconds
+
+DEFAULT_SESSION_POOL_IDLE_TIMEOUT = 0  # seconds, 0 disables the pool
+
+DEFAULT_SESSION_IDLE_TIMEOUT = 86400  # seconds
+
+DEFAULT_APPLIANCE_HEALTH_INTERVAL = 0  # seconds, 0 disables polling
+
+DEFAULT_CIRCUIT_BREAKER_ERROR_RATE = 50  # percent, 0 disables the breakers
+DEFAULT_CIRCUIT_BREAKER_SLOW_CALL = 10  # seconds
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN = 30  # seconds
+
 COUNTER_LOGGER_NAME = 'qtty'
 PERFORMANCE_LOGGER_NAME = 'perf'
 ONEVIEW_SDK_LOGGER_NAME = 'ovData'
@@ -102,6 +126,96 @@ def get_composition_settings():
     return dict(get_config().items('redfish-composition'))
 
 
+def stream_collections_enabled():
+    return get_config().getboolean('redfish', 'stream_collections',
+                                   fallback=False)
+
+
+def get_collection_page_size():
+    return get_config().getint('redfish', 'collection_page_size',
+                               fallback=DEFAULT_COLLECTION_PAGE_SIZE)
+
+
+def external_storage_enabled():
+    return get_config().getboolean('redfish', 'external_storage',
+                                   fallback=False)
+
+
+def get_server_hardware_type_ttl():
+    return get_config().getint('redfish', 'server_hardware_type_ttl',
+                               fallback=DEFAULT_SERVER_HARDWARE_TYPE_TTL)
+
+
+def get_zone_index_ttl():
+    return get_config().getint('redfish', 'zone_index_ttl',
+                               fallback=DEFAULT_ZONE_INDEX_TTL)
+
+
+def async_actions_enabled():
+    return get_config().getboolean('redfish', 'async_actions',
+                                   fallback=False)
+
+
+def get_bulk_action_max_concurrency():
+    return get_config().getint('redfish', 'bulk_action_max_concurrency',
+                               fallback=DEFAULT_BULK_ACTION_MAX_CONCURRENCY)
+
+
+def get_async_actions_max_workers():
+    return get_config().getint('redfish', 'async_actions_max_workers',
+                               fallback=DEFAULT_ASYNC_ACTIONS_MAX_WORKERS)
+
+
+def get_telemetry_sampling_interval():
+    return get_config().getint('redfish', 'telemetry_sampling_interval',
+                               fallback=DEFAULT_TELEMETRY_SAMPLING_INTERVAL)
+
+
+def get_oneview_login_timeout():
+    return get_config().getint('redfish', 'oneview_login_timeout',
+                               fallback=DEFAULT_ONEVIEW_LOGIN_TIMEOUT)
+
+
+def degraded_sessions_allowed():
+    return get_config().getboolean('redfish', 'allow_degraded_sessions',
+                                   fallback=False)
+
+
+def get_session_idle_timeout():
+    return get_config().getint('redfish', 'session_idle_timeout',
+                               fallback=DEFAULT_SESSION_IDLE_TIMEOUT)
+
+
+def get_session_pool_idle_timeout():
+    return get_config().getint('redfish', 'session_pool_idle_timeout',
+                               fallback=DEFAULT_SESSION_POOL_IDLE_TIMEOUT)
+
+
+def get_appliance_health_interval():
+    return get_config().getint('redfish', 'appliance_health_interval',
+                               fallback=DEFAULT_APPLIANCE_HEALTH_INTERVAL)
+
+
+def get_circuit_breaker_error_rate():
+    return get_config().getint('redfish', 'circuit_breaker_error_rate',
+                               fallback=DEFAULT_CIRCUIT_BREAKER_ERROR_RATE)
+
+
+def get_circuit_breaker_slow_call():
+    return get_config().getint('redfish', 'circuit_breaker_slow_call',
+                               fallback=DEFAULT_CIRCUIT_BREAKER_SLOW_CALL)
+
+
+def get_circuit_breaker_cooldown():
+    return get_config().getint('redfish', 'circuit_breaker_cooldown',
+                               fallback=DEFAULT_CIRCUIT_BREAKER_COOLDOWN)
+
+
+def degraded_start_allowed():
+    return get_config().getboolean('redfish', 'allow_degraded_start',
+                                   fallback=False)
+
+
 def configure_logging(log_file_path):
     """Loads logging.conf file
 
@@ -169,8 +283,7 @@ def load_config(conf_file):
 
     # Load schemas | Store schemas
     try:
-        for ip_oneview in get_oneview_multiple_ips():
-            connection.check_oneview_availability(ip_oneview)
+        check_oneviews_availability()
 
         registry_dict = load_registry(
             get_registry_path(),
@@ -184,6 +297,39 @@ def load_config(conf_file):
         )
 
 
+def check_oneviews_availability():
+    """Checks the availability of all OneViews concurrently
+
+        So the start takes about the time of the slowest OneView, instead
+        of the sum of the time of all OneViews. When degraded start is
+        allowed, the unavailable OneViews are only logged.
+
+        Exception:
+            OneViewRedfishException:
+                - if a OneView is unavailable and degraded start is not
+                allowed
+    """
+    ov_ips = get_oneview_multiple_ips()
+
+    with ThreadPoolExecutor(max_workers=max(len(ov_ips), 1)) as executor:
+        futures = [
+            (ip, executor.submit(connection.check_oneview_availability, ip))
+            for ip in ov_ips
+        ]
+
+    for ip, future in futures:
+        error = future.exception()
+
+        if not error:
+            continue
+
+        if not degraded_start_allowed():
+            raise error
+
+        logging.warning('OneView {} is unavailable on start: {}'
+                        .format(ip, error))
+
+
 def load_conf_file(conf_file):
     """Loads and parses conf file
 
@@ -33,6 +33,7 @@ RESOURCE_STRATEGY = {
     "connection": {
         "get": st.first_parameter_resource,
         "post": st.create_server_profile,
+        "put": st.update_server_hardware_resource,
         },
     "drive_enclosures": {
         "get": st.first_parameter_resource,
@@ -43,6 +44,9 @@ RESOURCE_STRATEGY = {
         "get_by_id": st.first_parameter_resource,
         "get_by_uri": st.first_parameter_resource,
         "get_all": st.all_oneviews_resource,
+        "get_all_pages": st.all_oneviews_resource_pages,
+        "get_all_fields": st.all_oneviews_resource,
+        "get_all_fields_pages": st.all_oneviews_resource_pages,
         "get_environmental_configuration": st.multiple_parameter_resource,
         "get_utilization": st.multiple_parameter_resource,
         },
@@ -52,6 +56,7 @@ RESOURCE_STRATEGY = {
     "index_resources": {
         "get": st.first_parameter_resource,
         "get_all": st.filter_uuid_parameter_resource,
+        "get_all_pages": st.all_oneviews_resource_pages,
         },
     "logical_enclosures": {
         "get": st.first_parameter_resource,
@@ -66,10 +71,14 @@ RESOURCE_STRATEGY = {
     "racks": {
         "get": st.first_parameter_resource,
         "get_all": st.all_oneviews_resource,
+        "get_all_pages": st.all_oneviews_resource_pages,
+        "get_all_fields": st.all_oneviews_resource,
+        "get_all_fields_pages": st.all_oneviews_resource_pages,
         "get_device_topology": st.first_parameter_resource,
         },
     "sas_logical_jbods": {
         "get": st.first_parameter_resource,
+        "get_all": st.all_oneviews_resource,
         "get_drives": st.first_parameter_resource,
         },
     "server_hardware": {
@@ -77,6 +86,9 @@ RESOURCE_STRATEGY = {
         "get_by_id": st.first_parameter_resource,
         "get_by_uri": st.first_parameter_resource,
         "get_all": st.all_oneviews_resource,
+        "get_all_pages": st.all_oneviews_resource_pages,
+        "get_all_fields": st.all_oneviews_resource,
+        "get_all_fields_pages": st.all_oneviews_resource_pages,
         "get_utilization": st.multiple_parameter_resource,
         "update_power_state": st.update_power_state_server_hardware,
         },
@@ -88,6 +100,9 @@ RESOURCE_STRATEGY = {
         "delete": st.multiple_parameter_resource,
         "get": st.first_parameter_resource,
         "get_all": st.all_oneviews_resource,
+        "get_all_pages": st.all_oneviews_resource_pages,
+        "get_all_fields": st.all_oneviews_resource,
+        "get_all_fields_pages": st.all_oneviews_resource_pages,
         "get_available_targets": st.first_parameter_resource,
         "get_by_id": st.first_parameter_resource,
         "get_by_uri": st.first_parameter_resource,
@@ -97,6 +112,9 @@ RESOURCE_STRATEGY = {
         "get_by_id": st.first_parameter_resource,
         "get_by_uri": st.first_parameter_resource,
         "get_all": st.spt_get_all_with_filter,
+        "get_all_pages": st.all_oneviews_resource_pages,
+        "get_all_fields": st.all_oneviews_resource,
+        "get_all_fields_pages": st.all_oneviews_resource_pages,
         },
     "tasks": {
         "get": st.first_parameter_resource,
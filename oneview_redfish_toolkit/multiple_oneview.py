@@ -16,16 +16,22 @@
 
 # Python libs
 from collections import OrderedDict
+import functools
 import logging
 import threading
 import time
 
 # 3rd party libs
 from flask import g
+from flask import has_app_context
 from hpOneView.exceptions import HPOneViewException
 
 # Modules own libs
 from oneview_redfish_toolkit.api.errors import NOT_FOUND_ONEVIEW_ERRORS
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
+from oneview_redfish_toolkit import async_oneview
+from oneview_redfish_toolkit import circuit_breaker
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.config import ONEVIEW_SDK_LOGGER_NAME
@@ -35,6 +41,8 @@ from oneview_redfish_toolkit import single_oneview_context as single
 # Globals vars:
 #   globals()['map_resources_ov']
 
+# Function of the resources that only gets the attributes in its fields
+GET_ALL_FIELDS_FUNCTION = "get_all_fields"
 
 lock = threading.Lock()
 
@@ -94,6 +102,12 @@ def query_ov_client_by_resource(resource_id, resource, function,
     # Get OneView's IP for cached resource ID
     cached_oneview_ip = get_ov_ip_by_resource(resource_id)
 
+    # A degraded session has no client for the OneViews that failed on
+    # login, so their resources are searched on the available OneViews
+    if cached_oneview_ip and \
+            not client_session.is_oneview_available(cached_oneview_ip):
+        cached_oneview_ip = None
+
     # Get OneView's IP in the single OneView context or cached by resource ID
     ip_oneview = single_oneview_ip or cached_oneview_ip
 
@@ -106,17 +120,22 @@ def query_ov_client_by_resource(resource_id, resource, function,
     if single.is_single_oneview_context() and not single_oneview_ip:
         single.set_single_oneview_ip(ip_oneview)
 
+    if not circuit_breaker.allow_request(ip_oneview):
+        raise OneViewRedfishUnavailableException(
+            "OneView {} is unavailable".format(ip_oneview))
+
     ov_client = client_session.get_oneview_client(ip_oneview)
 
     try:
-        resp = execute_query_ov_client(ov_client, resource, function,
-                                       *args, **kwargs)
+        resp = circuit_breaker.call(ip_oneview, execute_query_ov_client,
+                                    ov_client, resource, function,
+                                    *args, **kwargs)
     except HPOneViewException as e:
-        if e.oneview_response["errorCode"] not in NOT_FOUND_ONEVIEW_ERRORS:
+        if not _is_not_found_error(e):
             raise
 
         cleanup_map_resources_entry(resource_id)
-        ov_ips = config.get_oneview_multiple_ips()
+        ov_ips = get_available_ov_ips()
         ov_ips.remove(ip_oneview)  # just search in the other ips
 
         if not ov_ips:
@@ -143,6 +162,72 @@ def get_ov_ip_by_resource(resource_id):
     return map_resources.get(resource_id)
 
 
+def get_available_ov_ips():
+    """Get the OneView's IPs available in the current session"""
+    return [ip for ip in config.get_oneview_multiple_ips()
+            if client_session.is_oneview_available(ip)]
+
+
+def get_skipped_ov_ips():
+    """Get the OneView's IPs skipped by the current request
+
+        A OneView is skipped when its circuit breaker is open, so the
+        response of the request is a partial result.
+    """
+    if not has_app_context():
+        return []
+
+    return g.get("skipped_ov_ips", [])
+
+
+def set_partial_result_header(response):
+    """Warns about the OneViews skipped by their circuit breaker
+
+        Registered as an after_request function of the Flask app.
+    """
+    skipped_ov_ips = get_skipped_ov_ips()
+
+    if skipped_ov_ips:
+        response.headers["Warning"] = \
+            '199 - "Partial result, OneViews {} are unavailable"'\
+            .format(", ".join(skipped_ov_ips))
+
+    return response
+
+
+def _skip_ov_ips_with_open_circuit(ov_ips):
+    """Filters out the OneViews whose circuit breaker is open
+
+        The OneViews filtered out are recorded as skipped by the current
+        request.
+
+        Returns:
+            list: the OneView's IPs that can be queried
+    """
+    allowed_ov_ips = []
+
+    for ov_ip in ov_ips:
+        if circuit_breaker.allow_request(ov_ip):
+            allowed_ov_ips.append(ov_ip)
+            continue
+
+        _add_skipped_ov_ip(ov_ip)
+
+    if ov_ips and not allowed_ov_ips:
+        raise OneViewRedfishUnavailableException(
+            "OneViews {} are unavailable".format(", ".join(ov_ips)))
+
+    return allowed_ov_ips
+
+
+def _add_skipped_ov_ip(ov_ip):
+    logging.warning("OneView {} is skipped, its circuit is open"
+                    .format(ov_ip))
+
+    if has_app_context() and ov_ip not in get_skipped_ov_ips():
+        g.skipped_ov_ips = get_skipped_ov_ips() + [ov_ip]
+
+
 def search_resource_multiple_ov(resource, function, resource_id, ov_ips,
                                 *args, **kwargs):
     """Search resource on multiple OneViews
@@ -172,6 +257,9 @@ def search_resource_multiple_ov(resource, function, resource_id, ov_ips,
         Exceptions:
             HPOneViewException: When occur an error on any OneViews which is
             not an not found error.
+            OneViewRedfishUnavailableException: When a specific resource
+            is not found, but some OneViews were skipped because their
+            circuit breaker is open.
     """
     result = []
     error_not_found = []
@@ -183,47 +271,58 @@ def search_resource_multiple_ov(resource, function, resource_id, ov_ips,
     if not ov_ips and single_oneview_ip:
         list_ov_ips = [single_oneview_ip]
     else:
-        list_ov_ips = ov_ips or config.get_oneview_multiple_ips()
+        list_ov_ips = ov_ips or get_available_ov_ips()
 
-    # Loop in all OneView's IP
-    for ov_ip in list_ov_ips:
+    queried_ov_ips = _skip_ov_ips_with_open_circuit(list_ov_ips)
+    skipped = len(queried_ov_ips) < len(list_ov_ips)
 
-        ov_client = client_session.get_oneview_client(ov_ip)
+    # Loop in all OneView's IP responses
+    for ov_ip, expected_resource in _query_multiple_ov(queried_ov_ips,
+                                                       resource, function,
+                                                       *args, **kwargs):
+
+        if isinstance(expected_resource, HPOneViewException):
+            exception = expected_resource
 
-        try:
-            # Query resource on OneView
-            expected_resource = \
-                execute_query_ov_client(ov_client, resource, function,
-                                        *args, **kwargs)
-
-            if expected_resource:
-                # If it's looking for a especific resource and was found
-                if resource_id:
-                    set_map_resources_entry(resource_id, ov_ip)
-
-                    # If it's SingleOneviewContext and there is no OneView IP
-                    # on the context, then set OneView's IP on the context
-                    if single.is_single_oneview_context() and \
-                            not single_oneview_ip:
-                        single.set_single_oneview_ip(ov_ip)
-
-                    return expected_resource
-                else:
-                    # If it's looking for a resource list (get_all)
-                    if isinstance(expected_resource, list):
-                        result.extend(expected_resource)
-                    else:
-                        result.append(expected_resource)
-        except HPOneViewException as exception:
             # If get any error that is not a notFoundError
-            if exception.oneview_response["errorCode"] not in \
-                    NOT_FOUND_ONEVIEW_ERRORS:
+            if not _is_not_found_error(exception):
                 logging.exception("Error while searching on multiple "
                                   "OneViews for Oneview {}: {}".
                                   format(ov_ip, exception))
                 raise exception
 
             error_not_found.append(exception)
+        elif isinstance(expected_resource,
+                        OneViewRedfishUnavailableException):
+            # Another request is probing the OneView
+            _add_skipped_ov_ip(ov_ip)
+            skipped = True
+        elif isinstance(expected_resource, Exception):
+            raise expected_resource
+        elif expected_resource:
+            # If it's looking for a especific resource and was found
+            if resource_id:
+                set_map_resources_entry(resource_id, ov_ip)
+
+                # If it's SingleOneviewContext and there is no OneView IP
+                # on the context, then set OneView's IP on the context
+                if single.is_single_oneview_context() and \
+                        not single_oneview_ip:
+                    single.set_single_oneview_ip(ov_ip)
+
+                return expected_resource
+            else:
+                # If it's looking for a resource list (get_all)
+                if isinstance(expected_resource, list):
+                    result.extend(expected_resource)
+                else:
+                    result.append(expected_resource)
+
+    # The resource may be on a OneView skipped by its circuit breaker
+    if resource_id and skipped:
+        raise OneViewRedfishUnavailableException(
+            "Resource {} was not found on the available OneViews"
+            .format(resource_id))
 
     # If it's looking for a specific resource returns a NotFound exception
     if resource_id and error_not_found:
@@ -232,10 +331,165 @@ def search_resource_multiple_ov(resource, function, resource_id, ov_ips,
     return result
 
 
+def search_resources_with_ov_ip(resource, function, *args, **kwargs):
+    """Query a resource list on all OneViews, keeping their OneView's IP
+
+        Like search_resource_multiple_ov for a resource list, but each
+        resource is returned with the IP of its OneView, so it can be
+        updated on its OneView without being searched again.
+
+        Args:
+            resource: resource type (server_hardware)
+            function: resource function name (get_all)
+            *args: original arguments for the OneView client query
+            **kwargs: original keyword arguments for the OneView client query
+
+        Returns:
+            list: pairs of OneView IP and OneView resource
+
+        Exceptions:
+            HPOneViewException: When occur an error on any OneViews which is
+            not an not found error.
+    """
+    result = []
+    ov_ips = _skip_ov_ips_with_open_circuit(get_available_ov_ips())
+
+    for ov_ip, resources in _query_multiple_ov(ov_ips, resource, function,
+                                               *args, **kwargs):
+        if isinstance(resources, HPOneViewException) and \
+                _is_not_found_error(resources):
+            continue
+        elif isinstance(resources, OneViewRedfishUnavailableException):
+            _add_skipped_ov_ip(ov_ip)
+            continue
+        elif isinstance(resources, Exception):
+            raise resources
+
+        result.extend((ov_ip, ov_resource) for ov_resource in resources or [])
+
+    return result
+
+
+def _is_not_found_error(exception):
+    """Checks if a HPOneViewException is a not found error from OneView
+
+        The connection errors are raised by hpOneView without the OneView
+        response, so they are not a not found error.
+    """
+    oneview_response = exception.oneview_response or {}
+
+    return oneview_response.get("errorCode") in NOT_FOUND_ONEVIEW_ERRORS
+
+
+def _query_multiple_ov(list_ov_ips, resource, function, *args, **kwargs):
+    """Query resource on a list of OneViews
+
+        When the OneView event loop is enabled the OneViews are queried
+        concurrently. Otherwise they are queried one at a time, only when
+        the previous response was consumed.
+
+        Each query goes through the circuit breaker of its OneView, which
+        rejects it with a OneViewRedfishUnavailableException when the
+        OneView is being probed by another request.
+
+        Returns:
+            iterable: pairs of OneView IP and the OneView response or
+            the exception raised by it, in the list_ov_ips order
+    """
+    if async_oneview.is_event_loop_enabled() and len(list_ov_ips) > 1:
+        queries = []
+        for ov_ip in list_ov_ips:
+            ov_client = client_session.get_oneview_client(ov_ip)
+            queries.append(functools.partial(circuit_breaker.call, ov_ip,
+                                             execute_query_ov_client,
+                                             ov_client, resource, function,
+                                             *args, **kwargs))
+
+        return zip(list_ov_ips, async_oneview.run_concurrently(queries))
+
+    return _query_multiple_ov_sequentially(list_ov_ips, resource, function,
+                                           *args, **kwargs)
+
+
+def _query_multiple_ov_sequentially(list_ov_ips, resource, function,
+                                    *args, **kwargs):
+    for ov_ip in list_ov_ips:
+        ov_client = client_session.get_oneview_client(ov_ip)
+
+        try:
+            yield ov_ip, circuit_breaker.call(ov_ip, execute_query_ov_client,
+                                              ov_client, resource, function,
+                                              *args, **kwargs)
+        except (HPOneViewException,
+                OneViewRedfishUnavailableException) as exception:
+            yield ov_ip, exception
+
+
+def search_resource_pages_multiple_ov(resource, function, page_size,
+                                      *args, **kwargs):
+    """Iterate over resource pages on multiple OneViews
+
+        Lazily queries the resource list on all OneViews, one page at a
+        time, using the OneView start/count pagination. The next page is
+        only requested when the previous one was consumed, so just one
+        page is held in memory at a time.
+
+        Args:
+            resource: resource type (server_hardware)
+            function: resource function name (get_all)
+            page_size: number of resources requested per page
+            *args: original arguments for the OneView client query
+            **kwargs: original keyword arguments for the OneView client
+                query, except start and count that are set by the pages
+
+        Yields:
+            list: a non empty page of OneView resources
+
+        Exceptions:
+            HPOneViewException: When occur an error on any OneViews which is
+            not an not found error.
+    """
+    single_oneview_ip = single.is_single_oneview_context() and \
+        single.get_single_oneview_ip()
+
+    if single_oneview_ip:
+        list_ov_ips = [single_oneview_ip]
+    else:
+        list_ov_ips = get_available_ov_ips()
+
+    for ov_ip in _skip_ov_ips_with_open_circuit(list_ov_ips):
+        ov_client = client_session.get_oneview_client(ov_ip)
+        start = 0
+
+        while True:
+            try:
+                page = circuit_breaker.call(ov_ip, execute_query_ov_client,
+                                            ov_client, resource, function,
+                                            *args, start=start,
+                                            count=page_size, **kwargs)
+            except HPOneViewException as exception:
+                if not _is_not_found_error(exception):
+                    logging.exception("Error while searching on multiple "
+                                      "OneViews for Oneview {}: {}".
+                                      format(ov_ip, exception))
+                    raise exception
+                break
+            except OneViewRedfishUnavailableException:
+                _add_skipped_ov_ip(ov_ip)
+                break
+
+            if page:
+                yield page
+
+            if len(page or []) < page_size:
+                break
+
+            start += page_size
+
+
 def execute_query_ov_client(ov_client, resource, function, *args, **kwargs):
     """Execute query for resource on OneView client received as parameter"""
-    ov_resource = getattr(ov_client, resource)
-    ov_function = getattr(ov_resource, function)
+    ov_function = _get_ov_function(ov_client, resource, function)
 
     if logging.getLogger().isEnabledFor(logging.DEBUG):
         start_time = time.time()
@@ -262,7 +516,67 @@ def execute_query_ov_client(ov_client, resource, function, *args, **kwargs):
     return ov_function(*args, **kwargs)
 
 
+def _get_ov_function(ov_client, resource, function):
+    """Gets the OneView SDK function called for a resource function name
+
+        The get_all_fields function is a get_all with the fields query
+        parameter, so OneView returns only the requested attributes of
+        each resource. The get_all of the SDK resources does not accept
+        fields, so the list is requested on the resource URI instead.
+    """
+    if function == GET_ALL_FIELDS_FUNCTION:
+        return functools.partial(_get_all_fields, ov_client,
+                                 getattr(ov_client, resource).URI)
+
+    return getattr(getattr(ov_client, resource), function)
+
+
+def _get_all_fields(ov_client, resource_uri, start=0, count=-1, fields=""):
+    """Gets the resources of a URI with only the attributes in fields
+
+        Like the get_all of the SDK, the next pages are requested until
+        count resources are returned, or all of them when count is -1.
+    """
+    uri = "{}?start={}&count={}&fields={}".format(resource_uri, start,
+                                                  count, fields)
+    members = []
+
+    while uri:
+        response = ov_client.connection.get(uri)
+        members += response.get("members") or []
+
+        if count != -1 and len(members) >= count:
+            break
+
+        next_page_uri = response.get("nextPageUri")
+        uri = next_page_uri if next_page_uri != response.get("uri") else None
+
+    return members
+
+
 def execute_query_function(resource, function, *args, **kwargs):
     ov_function = getattr(resource, function)
     result = ov_function(*args, **kwargs)
     return result
+
+
+def execute_query_function_by_resource(resource_id, resource, function,
+                                       *args, **kwargs):
+    """Execute a function of a resource object read from OneView
+
+        The function goes through the circuit breaker of the OneView
+        the resource was read from, like the queries on the OneView
+        clients, so the actions changing a resource are guarded too.
+
+        Args:
+            resource_id: id or URI the resource object was read by
+            resource: the resource object
+            function: name of the resource function
+    """
+    ip_oneview = get_ov_ip_by_resource(resource_id)
+
+    if not ip_oneview:
+        return execute_query_function(resource, function, *args, **kwargs)
+
+    return circuit_breaker.call(ip_oneview, execute_query_function,
+                                resource, function, *args, **kwargs)
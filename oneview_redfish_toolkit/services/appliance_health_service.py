@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import threading
+import time
+
+# Modules own libs
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
+from oneview_redfish_toolkit import circuit_breaker
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit import multiple_oneview
+
+
+APPLIANCE_STATE_URL = "/controller-state.json"
+APPLIANCE_HEALTH_STATUS_URL = "/rest/appliance/health-status"
+
+# Number of polling intervals a Manager snapshot is served without refresh
+SNAPSHOT_MAX_AGE_IN_INTERVALS = 2
+
+# Appliance documents read to build its Manager
+ManagerSnapshot = namedtuple('ManagerSnapshot', ['appliance_info',
+                                                 'appliance_state',
+                                                 'appliance_health_status',
+                                                 'snapshot_time'])
+
+lock = threading.Lock()
+
+# Appliances polled in background by Redfish session (None in the conf
+# authentication mode) and by OneView IP: {(session_id, ov_ip):
+# PolledAppliance}
+map_polled_appliances = dict()
+
+# Appliances not answering by OneView IP: {ov_ip: time of the first error}
+map_unreachable_appliances = dict()
+
+# Process of the thread polling the appliances: {'pid': process id}
+map_appliance_health_poller = dict()
+
+
+def init_map_polled_appliances():
+    global map_polled_appliances
+    global map_unreachable_appliances
+    map_polled_appliances = dict()
+    map_unreachable_appliances = dict()
+
+
+def is_polling_enabled():
+    return config.get_appliance_health_interval() > 0
+
+
+def read_manager_snapshot(ov_client):
+    """Reads from OneView the documents of an appliance Manager
+
+        Args:
+            ov_client: client of the OneView appliance
+
+        Returns:
+            ManagerSnapshot: the appliance documents
+    """
+    appliance_info = multiple_oneview.execute_query_ov_client(
+        ov_client, "appliance_node_information", "get_version"
+    )
+    appliance_state = multiple_oneview.execute_query_ov_client(
+        ov_client, "connection", "get", APPLIANCE_STATE_URL
+    )
+    appliance_health_status = multiple_oneview.execute_query_ov_client(
+        ov_client, "connection", "get", APPLIANCE_HEALTH_STATUS_URL
+    )
+
+    return ManagerSnapshot(appliance_info, appliance_state,
+                           appliance_health_status, time.time())
+
+
+def get_manager_snapshot(ov_ip, ov_client):
+    """Gets the Manager snapshot of an appliance polled in background
+
+        The first read of an appliance reads its documents from OneView
+        and starts polling it, so the following reads are served from
+        the last snapshot. A snapshot older than two polling intervals
+        is read again from OneView. An appliance not answering its first
+        read is polled as well, so it is no longer recorded as
+        unreachable as soon as it answers.
+
+        The snapshots are kept by Redfish session, so a session is only
+        served the documents read with its own OneView session. The
+        appliances of closed sessions are no longer polled.
+
+        Args:
+            ov_ip: IP of the OneView appliance
+            ov_client: client of the OneView appliance, used to poll it
+
+        Returns:
+            ManagerSnapshot: the appliance documents
+
+        Raises:
+            OneViewRedfishUnavailableException: when the appliance has not
+            answered the last poll and has no current snapshot
+    """
+    polled_appliance_key = (client_session.get_current_session_id(), ov_ip)
+    polled_appliance = map_polled_appliances.get(polled_appliance_key)
+    max_age = SNAPSHOT_MAX_AGE_IN_INTERVALS * \
+        config.get_appliance_health_interval()
+
+    if polled_appliance and polled_appliance.snapshot and \
+            time.time() - polled_appliance.snapshot.snapshot_time < max_age:
+        return polled_appliance.snapshot
+
+    # The appliance is read again by the poller, which clears its record
+    if polled_appliance and ov_ip in map_unreachable_appliances:
+        raise OneViewRedfishUnavailableException(
+            "OneView {} is unreachable".format(ov_ip))
+
+    try:
+        snapshot = _read_appliance(ov_ip, ov_client)
+    except Exception as e:
+        if circuit_breaker.is_connection_error(e):
+            _add_polled_appliance(polled_appliance_key, ov_client, None)
+        raise
+
+    _add_polled_appliance(polled_appliance_key, ov_client, snapshot)
+
+    return snapshot
+
+
+def poll_appliances():
+    """Refreshes the Manager snapshot of all polled appliances
+
+        The appliances are read concurrently, so an appliance not
+        answering does not delay the others. It is recorded as
+        unreachable until it answers again. A client no longer accepted
+        by OneView, as when its session has expired or was logged out,
+        does not poll the appliance anymore, and neither does the client
+        of a closed session.
+    """
+    with lock:
+        _remove_closed_sessions()
+        polled_appliances = list(map_polled_appliances.items())
+
+    if not polled_appliances:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(polled_appliances)) as executor:
+        list(executor.map(_poll_appliance, polled_appliances))
+
+
+def _poll_appliance(polled_appliance_by_key):
+    polled_appliance_key, polled_appliance = polled_appliance_by_key
+    ov_ip = polled_appliance_key[1]
+
+    try:
+        polled_appliance.snapshot = _read_appliance(
+            ov_ip, polled_appliance.ov_client)
+    except Exception as e:
+        if circuit_breaker.is_connection_error(e):
+            logging.warning("Appliance {} is unreachable: {}"
+                            .format(ov_ip, e))
+            return
+
+        logging.warning("Appliance {} is no longer polled: {}"
+                        .format(ov_ip, e))
+
+        with lock:
+            if map_polled_appliances.get(polled_appliance_key) is \
+                    polled_appliance:
+                del map_polled_appliances[polled_appliance_key]
+
+
+def _read_appliance(ov_ip, ov_client):
+    """Reads an appliance, recording whether it is reachable"""
+    try:
+        snapshot = circuit_breaker.call(ov_ip, read_manager_snapshot,
+                                        ov_client)
+    except Exception as e:
+        with lock:
+            if circuit_breaker.is_connection_error(e):
+                map_unreachable_appliances.setdefault(ov_ip, time.time())
+            else:
+                map_unreachable_appliances.pop(ov_ip, None)
+        raise
+
+    with lock:
+        map_unreachable_appliances.pop(ov_ip, None)
+
+    return snapshot
+
+
+def _add_polled_appliance(polled_appliance_key, ov_client, snapshot):
+    """Polls an appliance from now on, even if its first read has failed"""
+    with lock:
+        if polled_appliance_key not in map_polled_appliances:
+            _remove_closed_sessions()
+
+        map_polled_appliances[polled_appliance_key] = \
+            PolledAppliance(ov_client, snapshot)
+
+    _start_appliance_health_poller()
+
+
+def _remove_closed_sessions():
+    """Stops polling the appliances of closed sessions, called with lock"""
+    for polled_appliance_key in list(map_polled_appliances):
+        session_id = polled_appliance_key[0]
+
+        if session_id is not None and \
+                not client_session.has_session_id(session_id):
+            del map_polled_appliances[polled_appliance_key]
+
+
+def _start_appliance_health_poller():
+    """Starts the thread polling the appliances, if not running yet
+
+        The thread is only started by the first read of a Manager, so it
+        belongs to the process that serves the requests, even when the
+        toolkit is daemonized after the initialization.
+    """
+    with lock:
+        if map_appliance_health_poller.get('pid') == os.getpid():
+            return
+
+        map_appliance_health_poller['pid'] = os.getpid()
+
+    poller_thread = threading.Thread(target=_poll_appliances_periodically,
+                                     daemon=True)
+    poller_thread.start()
+
+
+def _poll_appliances_periodically():
+    while True:
+        time.sleep(config.get_appliance_health_interval())
+
+        try:
+            poll_appliances()
+        except Exception as e:
+            logging.exception("Error while polling the appliances: {}"
+                              .format(e))
+
+
+class PolledAppliance(object):
+    """Last Manager snapshot of an appliance polled in background"""
+
+    def __init__(self, ov_client, snapshot):
+        """PolledAppliance constructor
+
+            Args:
+                ov_client: client of the OneView appliance
+                snapshot: ManagerSnapshot of the appliance, or None until
+                    it answers
+        """
+        self.ov_client = ov_client
+        self.snapshot = snapshot
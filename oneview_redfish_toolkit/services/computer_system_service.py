@@ -13,7 +13,6 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import time
 
 from hpOneView import HPOneViewException
 from jsonschema import ValidationError
@@ -23,8 +22,7 @@ from hpOneView.resources.servers.server_profiles import ServerProfiles
 from oneview_redfish_toolkit.api.errors import NOT_FOUND_ONEVIEW_ERRORS
 from oneview_redfish_toolkit.api.util.power_option import OneViewPowerOption
 from oneview_redfish_toolkit import config
-
-DELAY_TO_WAIT_IN_SEC = 3
+from oneview_redfish_toolkit.services import task_watch_service
 
 
 class ComputerSystemService(object):
@@ -118,14 +116,16 @@ class ComputerSystemService(object):
         task, _ = self.ov_client.connection.post(
             ServerProfiles.URI,
             server_profile)
-        resource_uri = task["associatedResource"]["resourceUri"]
 
-        while not task.get("taskErrors") and not resource_uri:
-            time.sleep(DELAY_TO_WAIT_IN_SEC)
-            task = self.ov_client.tasks.get_by_uri(task["uri"]).data
-            resource_uri = task["associatedResource"]["resourceUri"]
+        task = task_watch_service.wait_for_oneview_task(
+            self.ov_client, task, self._has_resource_uri_or_errors)
+
+        return task, task["associatedResource"]["resourceUri"]
 
-        return task, resource_uri
+    @staticmethod
+    def _has_resource_uri_or_errors(task):
+        return bool(task.get("taskErrors") or
+                    task["associatedResource"]["resourceUri"])
 
     def get_server_profile_template_from_sp(self, sp_uri):
         """Gets Sever Profile Template uuid from Server Profile uri"""
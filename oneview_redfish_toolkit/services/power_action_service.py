@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+import threading
+
+# 3rd party libs
+from hpOneView.exceptions import HPOneViewException
+
+# Modules own libs
+from oneview_redfish_toolkit.api.errors import OneViewRedfishException
+from oneview_redfish_toolkit.api.util.power_option import OneViewPowerOption
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import task_tracker_service
+
+
+# Maximum number of resources looked up by a single filtered query
+BULK_LOOKUP_BATCH_SIZE = 50
+
+RESOURCE_ID_REGEX = re.compile(r"^[\w-]+$")
+
+# Result of the power action of a Computer System in a bulk reset:
+# the task is set when the action runs asynchronously and the error
+# message when the action fails
+ResetResult = namedtuple('ResetResult', ['system_id', 'task', 'error'])
+
+lock = threading.Lock()
+
+# Workers running the power actions of the bulk resets:
+# {'pid': process id, 'executor': ThreadPoolExecutor}
+map_bulk_action_workers = dict()
+
+
+class PowerActionService(object):
+    """Represents a Service class of Server Hardware power actions"""
+
+    def __init__(self, oneview_client):
+        """PowerActionService constructor
+
+            Args:
+                oneview_client: client of Oneview SDK
+        """
+        self.ov_client = oneview_client
+
+    def change_power_state(self, server_hardware, reset_type,
+                           ov_client=None):
+        """Changes the power state of a Server Hardware
+
+            Waits until the OneView task of the power operation finishes.
+
+            Args:
+                server_hardware: the Server Hardware
+                reset_type: Redfish ResetType
+                ov_client: client of the OneView of the Server Hardware,
+                    when already known, so it is not searched again
+        """
+        oneview_power_configuration = \
+            OneViewPowerOption.get_oneview_power_configuration(
+                server_hardware, reset_type)
+
+        if ov_client:
+            ov_client.server_hardware.new(
+                ov_client.connection, server_hardware).update_power_state(
+                oneview_power_configuration)
+            return
+
+        self.ov_client.server_hardware.update_power_state(
+            oneview_power_configuration, server_hardware["uuid"])
+
+    def change_power_state_async(self, server_hardware, reset_type,
+                                 ov_client=None):
+        """Starts changing the power state of a Server Hardware
+
+            Returns as soon as OneView accepts the power operation. Its
+            OneView task is then tracked in background by a Redfish Task.
+
+            Args:
+                server_hardware: the Server Hardware
+                reset_type: Redfish ResetType
+                ov_client: client of the OneView of the Server Hardware,
+                    when already known, so it is not searched again
+
+            Returns:
+                TrackedTask: the Task of the power operation
+        """
+        oneview_power_configuration = \
+            OneViewPowerOption.get_oneview_power_configuration(
+                server_hardware, reset_type)
+
+        oneview_task, _ = (ov_client or self.ov_client).connection.put(
+            server_hardware["uri"] + "/powerState",
+            oneview_power_configuration)
+
+        task = task_tracker_service.create_task(
+            "Reset {} of {}".format(reset_type, server_hardware["name"]))
+
+        if not oneview_task:
+            task.set_completed()
+            return task
+
+        # The OneView task is tracked out of the request, so the client
+        # of the OneView running it is kept instead of g.oneview_client
+        if not ov_client:
+            ov_ip = multiple_oneview.get_ov_ip_by_resource(
+                server_hardware["uri"])
+            ov_client = client_session.get_oneview_client(ov_ip)
+
+        task_tracker_service.track_oneview_task(task, ov_client, oneview_task)
+
+        return task
+
+    def reset_computer_systems(self, system_ids, reset_type):
+        """Changes the power state of many Computer Systems at once
+
+            The Server Profiles of the Computer Systems and their Server
+            Hardware are retrieved with batched filtered queries. Then the
+            power operations are submitted to the OneView of each Server
+            Hardware by a pool of bulk_action_max_concurrency workers,
+            apart from the workers querying OneView for the requests. When
+            async actions are enabled, each operation returns as soon as
+            OneView accepts it, with the Task tracking it.
+
+            Args:
+                system_ids: list of Computer System ids
+                reset_type: Redfish ResetType
+
+            Returns:
+                list: a ResetResult for each Computer System, in the
+                system_ids order
+        """
+        server_hardware_by_system_id = \
+            self._get_server_hardware_by_system_id(system_ids)
+
+        # The clients are taken within the request, before running the
+        # power operations out of it
+        ov_clients = {
+            ov_ip: client_session.get_oneview_client(ov_ip)
+            for ov_ip, _ in server_hardware_by_system_id.values()
+        }
+        async_actions = config.async_actions_enabled()
+
+        executor = _get_bulk_action_executor()
+        futures = []
+        for system_id in system_ids:
+            ov_ip, server_hardware = \
+                server_hardware_by_system_id.get(system_id, (None, None))
+
+            futures.append(executor.submit(
+                self._reset_computer_system, ov_clients.get(ov_ip),
+                server_hardware, system_id, reset_type, async_actions))
+
+        results = []
+        for system_id, future in zip(system_ids, futures):
+            error = future.exception()
+
+            if error:
+                results.append(ResetResult(system_id, None,
+                                           self._get_error_message(error)))
+            else:
+                results.append(future.result())
+
+        return results
+
+    def _reset_computer_system(self, ov_client, server_hardware, system_id,
+                               reset_type, async_actions):
+        if not server_hardware:
+            return ResetResult(
+                system_id, None,
+                "Computer System {} not found".format(system_id))
+
+        if async_actions:
+            task = self.change_power_state_async(server_hardware, reset_type,
+                                                 ov_client)
+            return ResetResult(system_id, task, None)
+
+        self.change_power_state(server_hardware, reset_type, ov_client)
+
+        return ResetResult(system_id, None, None)
+
+    def _get_server_hardware_by_system_id(self, system_ids):
+        """Gets the Server Hardware of each Computer System with its OneView
+
+            Returns:
+                dict: pairs of OneView IP and Server Hardware by Computer
+                System id
+        """
+        valid_ids = [system_id for system_id in system_ids
+                     if RESOURCE_ID_REGEX.match(system_id)]
+
+        server_profiles = [
+            server_profile for server_profile in
+            self._get_all_by("server_profiles", "uuid", valid_ids)
+            if server_profile.get("serverHardwareUri")
+        ]
+
+        server_hardware_uris = [server_profile["serverHardwareUri"]
+                                for server_profile in server_profiles]
+        server_hardware_by_uri = {
+            server_hardware["uri"]: (ov_ip, server_hardware)
+            for ov_ip, server_hardware in
+            self._get_all_with_ov_ip_by("server_hardware", "uri",
+                                        server_hardware_uris)
+        }
+
+        return {
+            server_profile["uuid"]:
+                server_hardware_by_uri[server_profile["serverHardwareUri"]]
+            for server_profile in server_profiles
+            if server_profile["serverHardwareUri"] in server_hardware_by_uri
+        }
+
+    def _get_all_by(self, resource, attribute, values):
+        """Gets the resources by an attribute with batched queries"""
+        resources = []
+
+        for start in range(0, len(values), BULK_LOOKUP_BATCH_SIZE):
+            batch = values[start:start + BULK_LOOKUP_BATCH_SIZE]
+            value_filter = " OR ".join(
+                "{}='{}'".format(attribute, value) for value in batch)
+
+            resources.extend(getattr(self.ov_client, resource).get_all(
+                filter=value_filter))
+
+        return resources
+
+    @staticmethod
+    def _get_all_with_ov_ip_by(resource, attribute, values):
+        """Gets the resources by an attribute with their OneView's IP"""
+        resources = []
+
+        for start in range(0, len(values), BULK_LOOKUP_BATCH_SIZE):
+            batch = values[start:start + BULK_LOOKUP_BATCH_SIZE]
+            value_filter = " OR ".join(
+                "{}='{}'".format(attribute, value) for value in batch)
+
+            resources.extend(multiple_oneview.search_resources_with_ov_ip(
+                resource, "get_all", filter=value_filter))
+
+        return resources
+
+    @staticmethod
+    def _get_error_message(exception):
+        if isinstance(exception, (HPOneViewException,
+                                  OneViewRedfishException)):
+            return exception.msg
+
+        return str(exception)
+
+
+def _get_bulk_action_executor():
+    """Gets the pool running the power actions, starting it if needed
+
+        The pool is only started by the first bulk reset of the process
+        serving the requests, even when the toolkit is daemonized after
+        the initialization.
+    """
+    with lock:
+        if map_bulk_action_workers.get('pid') != os.getpid():
+            map_bulk_action_workers['executor'] = ThreadPoolExecutor(
+                max_workers=config.get_bulk_action_max_concurrency())
+            map_bulk_action_workers['pid'] = os.getpid()
+
+        return map_bulk_action_workers['executor']
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import threading
+
+
+lock = threading.Lock()
+
+# Drives by SAS Logical JBOD URI: {uri: (jbod eTag, drives)}
+map_drives_by_sas_logical_jbod = dict()
+
+
+def init_map_drives_by_sas_logical_jbod():
+    global map_drives_by_sas_logical_jbod
+    map_drives_by_sas_logical_jbod = dict()
+
+
+class SasLogicalJbodService(object):
+    """Represents a Service class of SAS Logical JBODs"""
+
+    def __init__(self, oneview_client):
+        """SasLogicalJbodService constructor
+
+            Args:
+                oneview_client: client of Oneview SDK
+        """
+        self.ov_client = oneview_client
+
+    @staticmethod
+    def get_sas_logical_jbod_uris(server_profile):
+        """Returns the SAS Logical JBOD URIs of a Server Profile"""
+        return [
+            sas_logical_jbod["sasLogicalJBODUri"]
+            for sas_logical_jbod in
+            server_profile["localStorage"]["sasLogicalJBODs"]
+            if sas_logical_jbod["sasLogicalJBODUri"]
+        ]
+
+    def get_sas_logical_jbods_from_sp(self, server_profile):
+        """Gets all SAS Logical JBODs of a Server Profile
+
+            The SAS Logical JBODs are retrieved with a single filtered
+            query however many JBODs the Server Profile has. A JBOD not
+            returned by the query is retrieved by its URI, so a missing
+            JBOD raises the OneView not found error.
+
+            Args:
+                server_profile: the Server Profile
+
+            Returns:
+                list: SAS Logical JBODs in the Server Profile order
+        """
+        uris = self.get_sas_logical_jbod_uris(server_profile)
+
+        if not uris:
+            return []
+
+        uri_filter = " OR ".join("uri='{}'".format(uri) for uri in uris)
+        jbods_by_uri = {
+            sas_logical_jbod["uri"]: sas_logical_jbod
+            for sas_logical_jbod in
+            self.ov_client.sas_logical_jbods.get_all(filter=uri_filter)
+        }
+
+        sas_logical_jbods = []
+        for uri in uris:
+            sas_logical_jbod = jbods_by_uri.get(uri)
+
+            if not sas_logical_jbod:
+                sas_logical_jbod = self.ov_client.sas_logical_jbods.get(uri)
+
+            sas_logical_jbods.append(sas_logical_jbod)
+
+        return sas_logical_jbods
+
+    def get_drives_from_sp(self, server_profile):
+        """Gets the Drives of all SAS Logical JBODs of a Server Profile
+
+            The Drives of each SAS Logical JBOD are cached by the JBOD URI
+            and only retrieved again when the JBOD eTag changes, so once
+            cached the Drives are loaded with just the JBODs query.
+
+            Args:
+                server_profile: the Server Profile
+
+            Returns:
+                list: Drives of the Server Profile
+        """
+        drives = []
+        for sas_logical_jbod in \
+                self.get_sas_logical_jbods_from_sp(server_profile):
+            drives.extend(self._get_drives_by_sas_logical_jbod(
+                sas_logical_jbod))
+
+        return drives
+
+    def _get_drives_by_sas_logical_jbod(self, sas_logical_jbod):
+        uri = sas_logical_jbod["uri"]
+        e_tag = sas_logical_jbod.get("eTag")
+
+        cached = map_drives_by_sas_logical_jbod.get(uri)
+        if cached and e_tag and cached[0] == e_tag:
+            return cached[1]
+
+        drives = self.ov_client.sas_logical_jbods.get_drives(uri)
+
+        with lock:
+            map_drives_by_sas_logical_jbod[uri] = (e_tag, drives)
+
+        return drives
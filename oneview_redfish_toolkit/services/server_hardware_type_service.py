@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import threading
+import time
+
+# Modules own libs
+from oneview_redfish_toolkit import config
+
+
+lock = threading.Lock()
+
+# Server Hardware Types by URI: {uri: (revalidation time, document)}
+map_server_hardware_types = dict()
+
+
+def init_map_server_hardware_types():
+    global map_server_hardware_types
+    map_server_hardware_types = dict()
+
+
+def update_server_hardware_type(server_hardware_type):
+    """Updates a cached Server Hardware Type with a newer document
+
+        Used by the SCMB listener, so changes made on OneView are seen
+        before the cached document would be revalidated. The document is
+        only replaced when its eTag has changed. Server Hardware Types not
+        cached are not added, as they are only cached once read from
+        their OneView, which records the OneView of their URI.
+
+        Args:
+            server_hardware_type: Server Hardware Type dict from OneView
+    """
+    uri = server_hardware_type["uri"]
+    cached = map_server_hardware_types.get(uri)
+
+    if not cached or \
+            cached[1].get("eTag") == server_hardware_type.get("eTag"):
+        return
+
+    _set_server_hardware_type(server_hardware_type)
+
+
+def remove_server_hardware_type(uri):
+    with lock:
+        map_server_hardware_types.pop(uri, None)
+
+
+def _set_server_hardware_type(server_hardware_type):
+    revalidation_time = time.time() + config.get_server_hardware_type_ttl()
+
+    with lock:
+        map_server_hardware_types[server_hardware_type["uri"]] = \
+            (revalidation_time, server_hardware_type)
+
+
+class ServerHardwareTypeService(object):
+    """Represents a Service class of Server Hardware Types"""
+
+    def __init__(self, oneview_client):
+        """ServerHardwareTypeService constructor
+
+            Args:
+                oneview_client: client of Oneview SDK
+        """
+        self.ov_client = oneview_client
+
+    def get_server_hardware_type(self, uri):
+        """Gets a Server Hardware Type by its URI
+
+            Server Hardware Types are shared by all servers of the same
+            model and are not expected to change, so they are cached for
+            all requests and sessions. A cached document is only requested
+            again from OneView after the configured TTL, keeping the
+            cached one when its eTag has not changed.
+
+            Args:
+                uri: the Server Hardware Type URI
+
+            Returns:
+                dict: Server Hardware Type, which must not be changed
+        """
+        cached = map_server_hardware_types.get(uri)
+
+        if cached and cached[0] > time.time():
+            return cached[1]
+
+        server_hardware_type = \
+            self.ov_client.server_hardware_types.get_by_uri(uri).data
+
+        if cached and \
+                cached[1].get("eTag") == server_hardware_type.get("eTag"):
+            server_hardware_type = cached[1]
+
+        _set_server_hardware_type(server_hardware_type)
+
+        return server_hardware_type
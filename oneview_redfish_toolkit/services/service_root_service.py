@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+
+# Python libs
+import threading
+
+
+lock = threading.Lock()
+
+# Serialized ServiceRoot by OneView IP: {ip: (appliance UUID, json)}
+map_service_root = dict()
+
+
+def init_map_service_root():
+    global map_service_root
+    map_service_root = dict()
+
+
+def get_service_root(ov_ip, appliance_uuid):
+    """Gets the cached ServiceRoot of a OneView
+
+        Args:
+            ov_ip: IP of the OneView serving the ServiceRoot
+            appliance_uuid: UUID of the OneView appliance, or None if it
+                is not known yet
+
+        Returns:
+            str: the serialized ServiceRoot, or None if it is not cached
+            or was built for another appliance
+    """
+    cached = map_service_root.get(ov_ip)
+
+    if not cached or appliance_uuid not in (None, cached[0]):
+        return None
+
+    return cached[1]
+
+
+def set_service_root(ov_ip, appliance_uuid, service_root_json):
+    with lock:
+        map_service_root[ov_ip] = (appliance_uuid, service_root_json)
@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+import logging
+import os
+import threading
+import time
+import uuid
+
+# Modules own libs
+from oneview_redfish_toolkit.api import status_mapping
+from oneview_redfish_toolkit import async_oneview
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+
+
+# Interval between the queries of the running OneView tasks
+POLLING_INTERVAL_IN_SEC = 3
+
+# Number of consecutive failed queries of a OneView task before its Task
+# is finished with an Exception
+MAX_CONSECUTIVE_QUERY_ERRORS = 5
+
+# Number of finished Tasks kept in memory, the oldest are removed first
+MAX_FINISHED_TASKS = 1000
+
+REDFISH_FINISHED_TASK_STATES = ["Completed", "Exception", "Killed"]
+
+lock = threading.Lock()
+
+# Redfish Tasks by id, in creation order: {task_id: TrackedTask}
+map_tasks = collections.OrderedDict()
+
+# Process of the thread tracking the OneView tasks: {'pid': process id}
+map_task_tracker = dict()
+
+# Workers running the Tasks in background:
+# {'pid': process id, 'executor': ThreadPoolExecutor}
+map_task_workers = dict()
+
+
+def init_map_tasks():
+    global map_tasks
+    map_tasks = collections.OrderedDict()
+
+
+def create_task(name):
+    """Creates a Redfish Task kept in memory
+
+        The Task belongs to the Redfish session of the current request, so
+        in the session authentication mode only that session can read it.
+
+        Args:
+            name: name of the Task, describing its operation
+
+        Returns:
+            TrackedTask: the new Task
+    """
+    task = TrackedTask(name, client_session.get_current_session_id())
+
+    with lock:
+        map_tasks[task.task_id] = task
+        _remove_oldest_finished_tasks()
+
+    return task
+
+
+def get_task(task_id):
+    """Gets a Task of the current session by its id, or None if not found"""
+    task = map_tasks.get(task_id)
+
+    if task and task.session_id == client_session.get_current_session_id():
+        return task
+
+    return None
+
+
+def get_task_ids():
+    """Gets the ids of the Tasks of the current session, in creation order"""
+    session_id = client_session.get_current_session_id()
+
+    with lock:
+        return [task_id for task_id, task in map_tasks.items()
+                if task.session_id == session_id]
+
+
+def run_task(task, function):
+    """Runs an operation in background, tracked by its Task
+
+        The operation is queued to a pool limited by the
+        async_actions_max_workers configuration, and runs within the
+        Flask contexts of the caller, so it can use g.oneview_client.
+        The Task is Running while the operation runs. It is Completed
+        when the operation returns, unless the operation has already
+        finished it, and finishes with an Exception when the operation
+        raises an error.
+
+        Args:
+            task: the TrackedTask of the operation
+            function: callable without arguments running the operation
+    """
+    function_in_context = async_oneview.bind_context_for_background(
+        function)
+
+    _get_task_executor().submit(_run_task, task, function_in_context)
+
+
+def track_oneview_task(task, ov_client, oneview_task):
+    """Tracks a OneView task in background
+
+        The Task is updated with the OneView task state by a single
+        thread, which queries all running OneView tasks at each polling
+        interval. So requests only need to read the Task from memory.
+
+        Args:
+            task: the TrackedTask of the OneView task
+            ov_client: OneView client of the OneView running the task
+            oneview_task: task dict returned by OneView
+    """
+    task.ov_client = ov_client
+    task.update_from_oneview_task(oneview_task)
+
+    if not task.is_finished():
+        _start_task_tracker()
+
+
+def update_oneview_task(oneview_task):
+    """Updates the running Tasks of a OneView task with a newer document
+
+        Used by the SCMB listener, so the Tasks are updated before the
+        next polling interval.
+
+        Args:
+            oneview_task: task dict from OneView
+    """
+    with lock:
+        tasks = [task for task in map_tasks.values()
+                 if task.oneview_task_uri == oneview_task["uri"] and
+                 not task.is_finished()]
+
+    for task in tasks:
+        task.update_from_oneview_task(oneview_task)
+
+
+def refresh_oneview_tasks():
+    """Updates all running Tasks with the state of their OneView task
+
+        A Task is kept Running when its OneView task cannot be queried,
+        so it is queried again at the next polling interval. It is only
+        finished with an Exception after several consecutive errors.
+    """
+    with lock:
+        tasks = [task for task in map_tasks.values()
+                 if task.oneview_task_uri and not task.is_finished()]
+
+    for task in tasks:
+        try:
+            oneview_task = task.ov_client.tasks.get_by_uri(
+                task.oneview_task_uri).data
+        except Exception as e:
+            logging.exception("Error while getting the OneView task {}: {}"
+                              .format(task.oneview_task_uri, e))
+            task.query_errors += 1
+
+            if task.query_errors >= MAX_CONSECUTIVE_QUERY_ERRORS:
+                task.set_exception(
+                    "Could not get the state of the OneView task")
+            continue
+
+        task.query_errors = 0
+        task.update_from_oneview_task(oneview_task)
+
+
+def _run_task(task, function):
+    task.set_running()
+
+    try:
+        function()
+    except Exception as e:
+        logging.exception("Error while running the Task {}: {}"
+                          .format(task.name, e))
+        task.set_exception(getattr(e, "msg", None) or str(e))
+        return
+
+    if not task.is_finished():
+        task.set_completed()
+
+
+def _get_task_executor():
+    """Gets the pool running the Tasks, starting it if needed
+
+        Like the task tracker, the pool is only started by the first Task
+        of the process serving the requests.
+    """
+    with lock:
+        if map_task_workers.get('pid') != os.getpid():
+            map_task_workers['executor'] = ThreadPoolExecutor(
+                max_workers=config.get_async_actions_max_workers())
+            map_task_workers['pid'] = os.getpid()
+
+        return map_task_workers['executor']
+
+
+def _start_task_tracker():
+    """Starts the thread tracking the OneView tasks, if not running yet
+
+        The thread is only started by the first tracked task, so it
+        belongs to the process that serves the requests, even when the
+        toolkit is daemonized after the initialization.
+    """
+    with lock:
+        if map_task_tracker.get('pid') == os.getpid():
+            return
+
+        map_task_tracker['pid'] = os.getpid()
+
+    tracker_thread = threading.Thread(target=_track_oneview_tasks,
+                                      daemon=True)
+    tracker_thread.start()
+
+
+def _track_oneview_tasks():
+    while True:
+        time.sleep(POLLING_INTERVAL_IN_SEC)
+
+        try:
+            refresh_oneview_tasks()
+        except Exception as e:
+            logging.exception("Error while tracking OneView tasks: {}"
+                              .format(e))
+
+
+def _remove_oldest_finished_tasks():
+    finished_ids = [task_id for task_id, task in map_tasks.items()
+                    if task.is_finished()]
+
+    for task_id in finished_ids[:len(finished_ids) - MAX_FINISHED_TASKS]:
+        del map_tasks[task_id]
+
+
+def _get_current_time():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class TrackedTask(object):
+    """State of an operation running in background, as a Redfish Task"""
+
+    def __init__(self, name, session_id=None):
+        """TrackedTask constructor
+
+            Args:
+                name: name of the Task, describing its operation
+                session_id: id of the Redfish session owning the Task, or
+                    None in the conf authentication mode
+        """
+        self.task_id = str(uuid.uuid4())
+        self.name = name
+        self.session_id = session_id
+        self.state = "New"
+        self.status = "OK"
+        self.start_time = _get_current_time()
+        self.end_time = None
+        self.messages = []
+        self.ov_client = None
+        self.oneview_task_uri = None
+        self.query_errors = 0
+
+    def is_finished(self):
+        return self.state in REDFISH_FINISHED_TASK_STATES
+
+    def update_from_oneview_task(self, oneview_task):
+        """Updates the Task state with a OneView task
+
+            Args:
+                oneview_task: task dict from OneView
+        """
+        oneview_state = oneview_task["taskState"]
+
+        self.oneview_task_uri = oneview_task["uri"]
+        self.state = status_mapping.ONEVIEW_TASK_STATE_TO_REDFISH_TASK_STATE\
+            .get(oneview_state, "Running")
+        self.status = status_mapping.\
+            ONEVIEW_TASK_STATE_TO_REDFISH_TASK_STATUS.get(oneview_state, "OK")
+
+        if not self.is_finished():
+            return
+
+        self.end_time = _get_current_time()
+        self.messages = [
+            self._build_message("GeneralError", task_error["message"],
+                                self.status)
+            for task_error in oneview_task.get("taskErrors") or []
+            if task_error.get("message")
+        ]
+
+        if not self.messages and self.state == "Completed":
+            self.messages = [self._build_success_message()]
+
+    def set_running(self):
+        self.state = "Running"
+
+    def set_completed(self):
+        """Finishes the Task successfully"""
+        self.state = "Completed"
+        self.status = "OK"
+        self.end_time = _get_current_time()
+        self.messages = [self._build_success_message()]
+
+    def set_created(self, resource_uri):
+        """Finishes the Task which has created a resource
+
+            Args:
+                resource_uri: Redfish URI of the created resource
+        """
+        self.set_completed()
+        self.messages.append(self._build_message(
+            "Created",
+            "The resource {} has been created successfully"
+            .format(resource_uri),
+            self.status))
+
+    def set_exception(self, message):
+        """Finishes the Task with an error
+
+            Args:
+                message: description of the error
+        """
+        self.state = "Exception"
+        self.status = "Critical"
+        self.end_time = _get_current_time()
+        self.messages = [
+            self._build_message("GeneralError", message, self.status)
+        ]
+
+    def _build_success_message(self):
+        return self._build_message("Success",
+                                   "Successfully Completed Request",
+                                   self.status)
+
+    @staticmethod
+    def _build_message(message_id, message, severity):
+        return collections.OrderedDict([
+            ("MessageId", "Base.1.1." + message_id),
+            ("Message", message),
+            ("Severity", severity)
+        ])
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import threading
+
+
+# Interval of the first query of a watched task not updated by SCMB. It is
+# doubled at each query, up to the max interval
+MIN_POLLING_INTERVAL_IN_SEC = 1
+MAX_POLLING_INTERVAL_IN_SEC = 10
+
+condition = threading.Condition()
+
+# OneView tasks being waited by URI: {uri: {'waiters': count, 'task': dict}}
+map_watched_tasks = dict()
+
+
+def init_map_watched_tasks():
+    global map_watched_tasks
+    map_watched_tasks = dict()
+
+
+def update_oneview_task(oneview_task):
+    """Updates a watched OneView task with a newer document
+
+        Used by the SCMB listener, so the requests waiting for the task
+        are woken up as soon as OneView reports its progress. Tasks not
+        being waited are ignored.
+
+        Args:
+            oneview_task: task dict from OneView
+    """
+    with condition:
+        watched = map_watched_tasks.get(oneview_task.get("uri"))
+
+        if not watched:
+            return
+
+        watched["task"] = oneview_task
+        condition.notify_all()
+
+
+def wait_for_oneview_task(ov_client, oneview_task, is_done):
+    """Waits until a OneView task reaches an expected state
+
+        The task is updated by SCMB messages when they are available. If
+        no message arrives during the polling interval the task is
+        queried from OneView, doubling the interval at each query, so
+        long running tasks are not queried at a fixed rate.
+
+        Args:
+            ov_client: OneView client of the OneView running the task
+            oneview_task: task dict returned by OneView
+            is_done: function receiving the task dict which returns
+                True when the expected state is reached
+
+        Returns:
+            dict: the OneView task in the expected state
+    """
+    uri = oneview_task["uri"]
+    interval = MIN_POLLING_INTERVAL_IN_SEC
+
+    _watch(uri, oneview_task)
+    try:
+        while not is_done(oneview_task):
+            updated_task = _wait_for_update(uri, oneview_task, interval)
+
+            if updated_task is None:
+                updated_task = ov_client.tasks.get_by_uri(uri).data
+                interval = min(interval * 2, MAX_POLLING_INTERVAL_IN_SEC)
+                _set_watched_task(uri, updated_task)
+
+            oneview_task = updated_task
+    finally:
+        _unwatch(uri)
+
+    return oneview_task
+
+
+def _watch(uri, oneview_task):
+    with condition:
+        watched = map_watched_tasks.setdefault(
+            uri, {"waiters": 0, "task": oneview_task})
+        watched["waiters"] += 1
+
+
+def _unwatch(uri):
+    with condition:
+        watched = map_watched_tasks[uri]
+        watched["waiters"] -= 1
+
+        if not watched["waiters"]:
+            del map_watched_tasks[uri]
+
+
+def _set_watched_task(uri, oneview_task):
+    with condition:
+        map_watched_tasks[uri]["task"] = oneview_task
+
+
+def _wait_for_update(uri, last_task, timeout):
+    """Returns the task updated by SCMB, or None after the timeout"""
+    with condition:
+        condition.wait_for(
+            lambda: map_watched_tasks[uri]["task"] is not last_task,
+            timeout)
+        oneview_task = map_watched_tasks[uri]["task"]
+
+    return oneview_task if oneview_task is not last_task else None
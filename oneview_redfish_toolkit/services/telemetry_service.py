@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+
+# Python libs
+import array
+import collections
+from datetime import datetime
+from datetime import timezone
+from functools import partial
+import logging
+import os
+import threading
+import time
+
+# Modules own libs
+from oneview_redfish_toolkit import async_oneview
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit import multiple_oneview
+
+
+# Number of samples kept for each Chassis, the oldest are dropped first
+THERMAL_SAMPLES_KEPT = 10
+
+# Number of sampling intervals a Chassis is kept sampled without reads
+THERMAL_IDLE_INTERVALS = 10
+
+# Number of samples of each metric kept for each Chassis
+METRIC_SAMPLES_KEPT = 60
+
+# OneView utilization metrics sampled by Chassis category
+METRICS_BY_CATEGORY = {
+    'server-hardware': ['AmbientTemperature', 'AveragePower',
+                        'CpuUtilization'],
+    'enclosures': ['AmbientTemperature', 'AveragePower']
+}
+
+METRIC_IDS = ['AmbientTemperature', 'AveragePower', 'CpuUtilization']
+
+# Chassis listed to be sampled for the Metric Reports, by OneView resource
+DISCOVERED_CHASSIS_CATEGORIES = collections.OrderedDict([
+    ('server_hardware', 'server-hardware'),
+    ('enclosures', 'enclosures')
+])
+
+# Thermal sample of a Chassis: the time it was taken, in seconds since
+# epoch, and the utilization or topology dict from OneView
+ThermalSample = collections.namedtuple(
+    'ThermalSample', ['sample_time', 'utilization'])
+
+lock = threading.Lock()
+
+# Chassis sampled in background. Each Redfish session sees only the
+# Chassis in the scopes of its user, so they are kept by Redfish session
+# id in the session authentication mode, and by None in the conf
+# authentication mode: {session id or None: {uuid: SampledChassis}}
+map_sampled_chassis = dict()
+
+# Process of the thread sampling the Chassis: {'pid': process id}
+map_telemetry_sampler = dict()
+
+# Time the Chassis of the OneViews were last listed, by Redfish session
+# id or None: {session id or None: seconds}
+map_chassis_discovery = dict()
+
+
+def init_map_sampled_chassis():
+    global map_sampled_chassis
+    global map_chassis_discovery
+    map_sampled_chassis = dict()
+    map_chassis_discovery = dict()
+
+
+def is_sampling_enabled():
+    return config.get_telemetry_sampling_interval() > 0
+
+
+def get_thermal_sample(uuid):
+    """Gets the last thermal sample of a Chassis sampled in background
+
+        Returns:
+            (category, ThermalSample): the OneView category of the Chassis
+            and its last sample, or None when the Chassis is not sampled
+            or its last sample is too old
+    """
+    session_id = client_session.get_current_session_id()
+    sampled_chassis = map_sampled_chassis.get(session_id, {}).get(uuid)
+
+    if not sampled_chassis:
+        return None
+
+    sample = sampled_chassis.get_last_sample()
+    max_age = 2 * config.get_telemetry_sampling_interval()
+
+    if not sample or sample.sample_time < time.time() - max_age:
+        return None
+
+    sampled_chassis.last_read_time = time.time()
+
+    return sampled_chassis.category, sample
+
+
+def add_thermal_sample(uuid, category, utilization):
+    """Keeps a thermal sample read on a request and samples the Chassis
+
+        The Chassis is sampled in background from then on with the
+        client of the session on the OneView which has returned it. So
+        while the Chassis is read by the session its requests do not
+        reach OneView, however many clients of the session read it.
+
+        Args:
+            uuid: the Chassis UUID
+            category: OneView category of the Chassis
+            utilization: utilization or topology dict from OneView
+
+        Returns:
+            ThermalSample: the sample kept
+    """
+    sample = ThermalSample(time.time(), utilization)
+    ov_ip = multiple_oneview.get_ov_ip_by_resource(uuid)
+
+    if ov_ip is None:
+        return sample
+
+    session_id = client_session.get_current_session_id()
+
+    with lock:
+        session_chassis = _get_session_chassis(session_id)
+        sampled_chassis = session_chassis.get(uuid)
+
+        if not sampled_chassis:
+            sampled_chassis = SampledChassis(uuid, category, ov_ip)
+            session_chassis[uuid] = sampled_chassis
+
+    sampled_chassis.add_sample(sample)
+    _start_telemetry_sampler()
+
+    return sample
+
+
+def get_reading_time(sample):
+    """Gets the time of a thermal sample as an ISO 8601 string
+
+        The time of the OneView metric sample is used when available,
+        otherwise the time the sample was taken.
+    """
+    reading_time = sample.sample_time
+
+    for metric in sample.utilization.get("metricList") or []:
+        if metric.get("metricName") == "AmbientTemperature" and \
+                metric.get("metricSamples"):
+            reading_time = metric["metricSamples"][0][0] / 1000
+
+    return _to_iso_time(reading_time)
+
+
+def discover_chassis():
+    """Samples all Server Hardware and Enclosures of the OneViews
+
+        The Chassis are listed with a single query by OneView and
+        category, at most once per sampling interval and session, so the
+        Metric Reports cover all Chassis the session sees and not only
+        those read before. The OneViews are listed concurrently with the
+        clients of the session.
+    """
+    interval = config.get_telemetry_sampling_interval()
+    session_id = client_session.get_current_session_id()
+
+    with lock:
+        if map_chassis_discovery.get(session_id, 0) > time.time() - interval:
+            return
+
+        map_chassis_discovery[session_id] = time.time()
+
+    ov_ips = multiple_oneview.get_available_ov_ips()
+    results = async_oneview.run_concurrently([
+        partial(_discover_appliance_chassis, session_id, ov_ip)
+        for ov_ip in ov_ips
+    ])
+
+    for ov_ip, result in zip(ov_ips, results):
+        if isinstance(result, Exception):
+            logging.error("Error while listing the Chassis of OneView {}: "
+                          "{}".format(ov_ip, result))
+
+    _start_telemetry_sampler()
+
+
+def _discover_appliance_chassis(session_id, ov_ip):
+    ov_client = client_session.get_oneview_client(ov_ip)
+
+    for resource, category in DISCOVERED_CHASSIS_CATEGORIES.items():
+        members = multiple_oneview.execute_query_ov_client(
+            ov_client, resource, multiple_oneview.GET_ALL_FIELDS_FUNCTION,
+            fields="uuid")
+
+        with lock:
+            session_chassis = _get_session_chassis(session_id)
+
+            for member in members:
+                if member["uuid"] not in session_chassis:
+                    session_chassis[member["uuid"]] = SampledChassis(
+                        member["uuid"], category, ov_ip)
+
+
+def _get_session_chassis(session_id):
+    """Gets the Chassis sampled for a Redfish session, called with lock
+
+        The Chassis of the sessions no longer open are dropped when the
+        Chassis of a new session are added.
+    """
+    if session_id not in map_sampled_chassis:
+        _remove_closed_sessions()
+        map_sampled_chassis[session_id] = dict()
+
+    return map_sampled_chassis[session_id]
+
+
+def _remove_closed_sessions():
+    for session_id in set(map_sampled_chassis) | set(map_chassis_discovery):
+        if session_id is not None and \
+                not client_session.has_session_id(session_id):
+            map_sampled_chassis.pop(session_id, None)
+            map_chassis_discovery.pop(session_id, None)
+
+
+def get_metric_values(metric_id):
+    """Gets the samples kept of a metric for the Chassis of the session
+
+        The Chassis are kept sampled while the metric is read.
+
+        Args:
+            metric_id: OneView metric name
+
+        Returns:
+            list: (uuid, timestamp, value) tuples, by Chassis and then
+            from the oldest to the newest sample, with ISO 8601 timestamps
+    """
+    session_id = client_session.get_current_session_id()
+
+    with lock:
+        sampled_chassis_list = list(
+            map_sampled_chassis.get(session_id, {}).values())
+
+    metric_values = []
+    for sampled_chassis in sampled_chassis_list:
+        metric = sampled_chassis.metrics.get(metric_id)
+
+        if metric is None:
+            continue
+
+        sampled_chassis.last_read_time = time.time()
+        metric_values.extend(
+            (sampled_chassis.uuid, _to_iso_time(timestamp), value)
+            for timestamp, value in metric.get_samples())
+
+    return metric_values
+
+
+def sample_chassis():
+    """Samples all Chassis read recently, the appliances concurrently
+
+        The Chassis of each session are sampled with the clients of the
+        session. Chassis not read for some intervals, Chassis which could
+        not be sampled and Chassis of closed sessions are no longer
+        sampled, so they are read again from OneView on their next
+        request.
+    """
+    idle_time = time.time() - \
+        THERMAL_IDLE_INTERVALS * config.get_telemetry_sampling_interval()
+
+    with lock:
+        _remove_closed_sessions()
+
+        chassis_by_appliance = collections.OrderedDict()
+        for session_id, session_chassis in map_sampled_chassis.items():
+            for uuid, sampled_chassis in list(session_chassis.items()):
+                if sampled_chassis.last_read_time < idle_time:
+                    del session_chassis[uuid]
+                    continue
+
+                chassis_by_appliance.setdefault(
+                    (session_id, sampled_chassis.ov_ip), []).append(
+                    sampled_chassis)
+
+    async_oneview.run_concurrently([
+        partial(_sample_appliance_chassis, session_id, ov_ip, chassis_list)
+        for (session_id, ov_ip), chassis_list in chassis_by_appliance.items()
+    ])
+
+
+def _get_sampler_client(session_id, ov_ip):
+    """Gets the client sampling the Chassis of a session on a OneView"""
+    if session_id is None:
+        return client_session.get_oneview_client(ov_ip)
+
+    return client_session.get_oneview_client(
+        ov_ip, client_session.get_token_by_session_id(session_id))
+
+
+def _get_thermal_utilization(ov_client, category, uuid):
+    """Reads the ambient temperature of a Chassis from its OneView
+
+        The utilization is requested by URI, without getting the Chassis
+        resource first.
+    """
+    if category == 'racks':
+        return ov_client.racks.get_device_topology(uuid)
+
+    return ov_client.connection.get(
+        "/rest/{}/{}/utilization?fields={}".format(
+            category, uuid, ",".join(METRICS_BY_CATEGORY[category])))
+
+
+def _sample_appliance_chassis(session_id, ov_ip, chassis_list):
+    try:
+        ov_client = _get_sampler_client(session_id, ov_ip)
+    except Exception as e:
+        logging.exception("Error while getting the client of OneView {} to "
+                          "sample its Chassis: {}".format(ov_ip, e))
+        return
+
+    for sampled_chassis in chassis_list:
+        try:
+            utilization = _get_thermal_utilization(
+                ov_client, sampled_chassis.category, sampled_chassis.uuid)
+        except Exception as e:
+            logging.exception("Error while sampling the Chassis {}: {}"
+                              .format(sampled_chassis.uuid, e))
+            with lock:
+                map_sampled_chassis.get(session_id, {}).pop(
+                    sampled_chassis.uuid, None)
+            continue
+
+        sampled_chassis.add_sample(ThermalSample(time.time(), utilization))
+
+
+def _start_telemetry_sampler():
+    """Starts the thread sampling the Chassis, if not running yet
+
+        Like the task tracker, the thread is only started by the first
+        Chassis read by the process that serves the requests.
+    """
+    with lock:
+        if map_telemetry_sampler.get('pid') == os.getpid():
+            return
+
+        map_telemetry_sampler['pid'] = os.getpid()
+
+    sampler_thread = threading.Thread(target=_sample_chassis_periodically,
+                                      daemon=True)
+    sampler_thread.start()
+
+
+def _sample_chassis_periodically():
+    while True:
+        time.sleep(config.get_telemetry_sampling_interval())
+
+        try:
+            sample_chassis()
+        except Exception as e:
+            logging.exception("Error while sampling the Chassis: {}"
+                              .format(e))
+
+
+def _to_iso_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class SampledChassis(object):
+    """Ring buffers of the thermal and metric samples of a Chassis"""
+
+    def __init__(self, uuid, category, ov_ip):
+        """SampledChassis constructor
+
+            Args:
+                uuid: the Chassis UUID
+                category: OneView category of the Chassis
+                ov_ip: IP of the OneView of the Chassis
+        """
+        self.uuid = uuid
+        self.category = category
+        self.ov_ip = ov_ip
+        self.samples = collections.deque(maxlen=THERMAL_SAMPLES_KEPT)
+        self.metrics = {
+            metric_id: MetricRingBuffer(METRIC_SAMPLES_KEPT)
+            for metric_id in METRICS_BY_CATEGORY.get(category, [])
+        }
+        self.last_read_time = time.time()
+
+    def add_sample(self, sample):
+        """Keeps a thermal sample and the newest sample of its metrics"""
+        self.samples.append(sample)
+
+        for metric in sample.utilization.get("metricList") or []:
+            metric_buffer = self.metrics.get(metric.get("metricName"))
+
+            if metric_buffer is None or not metric.get("metricSamples"):
+                continue
+
+            timestamp, value = max(metric["metricSamples"])
+            if value is not None:
+                metric_buffer.append(timestamp / 1000, value)
+
+    def get_last_sample(self):
+        try:
+            return self.samples[-1]
+        except IndexError:
+            return None
+
+
+class MetricRingBuffer(object):
+    """Fixed size ring buffer of the samples of a metric
+
+        Timestamps and values are kept in arrays of doubles allocated
+        once, so each sample takes 16 bytes however many are kept.
+    """
+
+    def __init__(self, size):
+        """MetricRingBuffer constructor
+
+            Args:
+                size: number of samples kept, the oldest are overwritten
+        """
+        self.lock = threading.Lock()
+        self.timestamps = array.array('d', [0.0] * size)
+        self.values = array.array('d', [0.0] * size)
+        self.next_index = 0
+        self.count = 0
+
+    def append(self, timestamp, value):
+        """Adds a sample newer than the last one, ignoring repeated ones"""
+        size = len(self.values)
+
+        with self.lock:
+            last_index = (self.next_index - 1) % size
+            if self.count and self.timestamps[last_index] >= timestamp:
+                return
+
+            self.timestamps[self.next_index] = timestamp
+            self.values[self.next_index] = value
+            self.next_index = (self.next_index + 1) % size
+            self.count = min(self.count + 1, size)
+
+    def get_samples(self):
+        """Returns the (timestamp, value) samples, oldest first"""
+        size = len(self.values)
+
+        with self.lock:
+            first_index = (self.next_index - self.count) % size
+
+            return [
+                (self.timestamps[(first_index + i) % size],
+                 self.values[(first_index + i) % size])
+                for i in range(self.count)
+            ]
@@ -13,11 +13,123 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+
+# Python libs
+import threading
+import time
+
+# Modules own libs
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.config import \
     COUNTER_LOGGER_NAME
 from oneview_redfish_toolkit.services.computer_system_service import \
     ComputerSystemService
 from oneview_redfish_toolkit.services import logging_service
+from oneview_redfish_toolkit import single_oneview_context as single
+
+
+lock = threading.Lock()
+
+# Zone indexes, built on demand and updated by the SCMB messages. Each
+# Redfish session sees only the OneView resources in the scopes of its
+# user, so the indexes are kept by Redfish session id in the session
+# authentication mode, and by None in the conf authentication mode:
+#   {session id or None: {
+#       "server_hardware":
+#           {(attribute, attribute value, server hardware type uri):
+#               (expiration time, {server hardware uri: server hardware})},
+#       "drives": {enclosure uri: (expiration time, drives)},
+#       "enclosures": {"valid": (expiration time, enclosure uris with
+#           valid drive enclosures)},
+#       "volumes": {OneView IP or None for all OneViews:
+#           (expiration time, shareable volumes)}}}
+map_zone_indexes = dict()
+
+
+def init_zone_index():
+    global map_zone_indexes
+    map_zone_indexes = dict()
+
+
+def _get_zone_index():
+    """Gets the zone index of the Redfish session of the current request
+
+        The zone index is created when missing, and the zone indexes of
+        the sessions no longer open are dropped at the same time.
+    """
+    session_id = client_session.get_current_session_id()
+
+    with lock:
+        if session_id not in map_zone_indexes:
+            for closed_session_id in [
+                    key for key in map_zone_indexes
+                    if key is not None and
+                    not client_session.has_session_id(key)]:
+                del map_zone_indexes[closed_session_id]
+
+            map_zone_indexes[session_id] = {
+                "server_hardware": dict(),
+                "drives": dict(),
+                "enclosures": dict(),
+                "volumes": dict()
+            }
+
+        return map_zone_indexes[session_id]
+
+
+def update_zone_index_server_hardware(change_type, server_hardware):
+    """Updates a Server Hardware in the zone indexes
+
+        The Server Hardware is removed from the zones it no longer belongs
+        to and updated in the zones it still belongs to. The SCMB messages
+        are not limited to the scopes of the session users, so the zones
+        the Server Hardware is added to are queried again on OneView
+        instead.
+
+        Args:
+            change_type: the SCMB message change type (e.g. Updated)
+            server_hardware: Server Hardware dict from the SCMB message
+    """
+    uri = server_hardware["uri"]
+
+    with lock:
+        for zone_index in map_zone_indexes.values():
+            map_zone_server_hardware = zone_index["server_hardware"]
+
+            for key, (_, server_hardware_by_uri) in \
+                    list(map_zone_server_hardware.items()):
+                attribute, value, server_hardware_type_uri = key
+
+                if change_type == "Deleted" or \
+                        server_hardware.get(attribute) != value or \
+                        server_hardware.get("serverHardwareTypeUri") != \
+                        server_hardware_type_uri:
+                    server_hardware_by_uri.pop(uri, None)
+                elif uri in server_hardware_by_uri:
+                    server_hardware_by_uri[uri] = server_hardware
+                else:
+                    del map_zone_server_hardware[key]
+
+
+def remove_zone_index_enclosure(enclosure_uri):
+    """Removes the Drives of an Enclosure from the zone indexes
+
+        The Enclosures with valid Drive Enclosures are removed as well, so
+        both are queried again on OneView when needed.
+    """
+    with lock:
+        for zone_index in map_zone_indexes.values():
+            zone_index["drives"].pop(enclosure_uri, None)
+            zone_index["enclosures"].clear()
+
+
+def _is_valid_zone_index_entry(entry):
+    return entry is not None and entry[0] > time.time()
+
+
+def _get_zone_index_expiration_time():
+    return time.time() + config.get_zone_index_ttl()
 
 
 class ZoneService(object):
@@ -71,6 +183,124 @@ class ZoneService(object):
 
         return template_id, enclosure_id
 
+    def get_server_hardware_by_zone(self, server_profile_template,
+                                    enclosure_uri=None):
+        """Gets the Server Hardware list of a Zone from the zone index
+
+            The Server Hardware of the template type is taken from the
+            enclosure, or from the template enclosure group when the Zone
+            has no enclosure. It is only queried on OneView when the Zone
+            is not indexed yet, or when its entry has expired.
+
+            Args:
+                server_profile_template: the Server Profile Template
+                enclosure_uri: the URI of the Zone Enclosure, if any
+
+            Returns:
+                list: Server Hardware of the Zone
+        """
+        if enclosure_uri:
+            attribute, value = "locationUri", enclosure_uri
+        else:
+            attribute = "serverGroupUri"
+            value = server_profile_template["enclosureGroupUri"]
+
+        key = (attribute, value,
+               server_profile_template["serverHardwareTypeUri"])
+
+        map_zone_server_hardware = _get_zone_index()["server_hardware"]
+
+        entry = map_zone_server_hardware.get(key)
+        if not _is_valid_zone_index_entry(entry):
+            server_hardware_list = self.ov_client.server_hardware.get_all(
+                filter=["{}='{}'".format(attribute, value),
+                        "serverHardwareTypeUri='{}'".format(key[2])])
+
+            entry = (_get_zone_index_expiration_time(),
+                     {server_hardware["uri"]: server_hardware
+                      for server_hardware in server_hardware_list})
+
+            with lock:
+                map_zone_server_hardware[key] = entry
+
+        with lock:
+            return list(entry[1].values())
+
+    def get_drives_by_enclosure(self, enclosure):
+        """Gets the Drives with capacity of an Enclosure from the zone index
+
+            Args:
+                enclosure: the Enclosure dict
+
+            Returns:
+                list: Drives index resources of the Enclosure
+        """
+        map_zone_drives = _get_zone_index()["drives"]
+
+        entry = map_zone_drives.get(enclosure["uri"])
+        if not _is_valid_zone_index_entry(entry):
+            entry = (_get_zone_index_expiration_time(),
+                     self._get_drives_by_enclosure(enclosure))
+
+            with lock:
+                map_zone_drives[enclosure["uri"]] = entry
+
+        return entry[1]
+
+    def get_shareable_volumes(self):
+        """Gets the shareable storage volumes listed as external storage
+
+            Volumes are only queried when the external storage is enabled
+            in the toolkit configuration, with a filter for the shareable
+            ones, and are kept in the zone index of the session. In the
+            single OneView context only the volumes of that OneView are
+            returned.
+
+            Returns:
+                list: shareable volumes, or an empty list when the
+                external storage is disabled
+        """
+        if not config.external_storage_enabled():
+            return []
+
+        ov_ip = single.is_single_oneview_context() and \
+            single.get_single_oneview_ip() or None
+
+        map_zone_volumes = _get_zone_index()["volumes"]
+
+        entry = map_zone_volumes.get(ov_ip)
+        if not _is_valid_zone_index_entry(entry):
+            volumes = self.ov_client.volumes.get_all(
+                filter="isShareable=true")
+
+            entry = (_get_zone_index_expiration_time(),
+                     [volume for volume in volumes if volume["isShareable"]])
+
+            with lock:
+                map_zone_volumes[ov_ip] = entry
+
+        return entry[1]
+
+    def _get_drives_by_enclosure(self, enclosure):
+        drive_encl_assoc_uri = "/rest/index/associations/resources" \
+                               "?parenturi={}&category=drive-enclosures"\
+            .format(enclosure["uri"])
+        drive_encl_assoc = self.ov_client.connection.get(drive_encl_assoc_uri)
+        get_drives_uri = '/rest/index/resources' \
+            '?category=drives&count=10000' \
+            '&filter="driveEnclosureUri:{}"'
+        drives = []
+        for member in drive_encl_assoc["members"]:
+            drive_encl_uri = member["childResource"]["uri"]
+            drives_index_list = self.ov_client.connection.get(
+                get_drives_uri.format(drive_encl_uri))
+
+            drives = [drive for drive in drives_index_list["members"]
+                      if drive["attributes"].get('capacityInGB') and
+                      int(drive["attributes"]["capacityInGB"]) > 0]
+
+        return drives
+
     def _get_enclosures_uris_by_template(self, server_profile_template,
                                          logical_encl_list):
         enclosure_uris = []
@@ -94,8 +324,17 @@ class ZoneService(object):
                 server_profile_templates: the list of Server Profile Template
         """
         zone_ids = []
-        enclosure_uris_with_valid_drive_enclosures = \
-            self._get_enclosures_uris_with_valid_drive_enclosures()
+        map_zone_enclosures = _get_zone_index()["enclosures"]
+
+        entry = map_zone_enclosures.get("valid")
+        if not _is_valid_zone_index_entry(entry):
+            entry = (_get_zone_index_expiration_time(),
+                     self._get_enclosures_uris_with_valid_drive_enclosures())
+
+            with lock:
+                map_zone_enclosures["valid"] = entry
+
+        enclosure_uris_with_valid_drive_enclosures = entry[1]
         logical_encl_list = self.ov_client.logical_enclosures.get_all()
         for template in server_profile_templates:
             template_id = template["uri"].split("/")[-1]
@@ -16,6 +16,7 @@
 
 # Modules own libs
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import multiple_oneview
 
 
@@ -40,8 +41,8 @@ def multiple_parameter_resource(resource, function, *args, **kwargs):
     new_args = tuple(temp_args)
     resource_object = multiple_oneview.query_ov_client_by_resource(
         uri_or_id, resource, get_function, uri_or_id)
-    resp = multiple_oneview.execute_query_function(
-        resource_object, function, *new_args, **kwargs)
+    resp = multiple_oneview.execute_query_function_by_resource(
+        uri_or_id, resource_object, function, *new_args, **kwargs)
     return resp
 
 
@@ -67,6 +68,17 @@ def all_oneviews_resource(resource, function, *args, **kwargs):
     return all_results
 
 
+def all_oneviews_resource_pages(resource, function, *args, **kwargs):
+    # The paged aliases (get_all_pages and get_all_fields_pages) are read
+    # from OneView through their function (get_all and get_all_fields)
+    # using start and count, one page at a time
+    paged_function = function[:-len('_pages')]
+
+    return multiple_oneview.search_resource_pages_multiple_ov(
+        resource, paged_function, config.get_collection_page_size(),
+        *args, **kwargs)
+
+
 def spt_get_all_with_filter(resource, function, *args, **kwargs):
     if 'filter' not in kwargs:
         return all_oneviews_resource(resource, function, *args, **kwargs)
@@ -104,6 +116,15 @@ def create_server_profile(resource, function, *args, **kwargs):
     return _run_action(server_hardware_uri, 'server_hardware', 'get_by_uri', resource, function, *args, **kwargs)
 
 
+def update_server_hardware_resource(resource, function, *args, **kwargs):
+    # In this case, args are resulted by the connection.put call;
+    # The first index represents the URI of a Server Hardware sub resource
+    # to update (e.g. <server hardware uri>/powerState);
+    server_hardware_uri = args[0].rsplit("/", 1)[0]
+    return _run_action(server_hardware_uri, 'server_hardware', 'get_by_uri',
+                       resource, function, *args, **kwargs)
+
+
 def delete_server_profile(resource, function, *args, **kwargs):
     sp_uuid = args[0]
     return _run_action(sp_uuid, 'server_profiles', 'get_by_id', resource,
@@ -119,8 +140,8 @@ def update_power_state_server_hardware(resource, function, *args, **kwargs):
 
     resource_object = multiple_oneview.query_ov_client_by_resource(
         sh_uuid, resource, get_function, sh_uuid)
-    resp = multiple_oneview.execute_query_function(
-        resource_object, function, args[0], **kwargs)
+    resp = multiple_oneview.execute_query_function_by_resource(
+        sh_uuid, resource_object, function, args[0], **kwargs)
     return resp
 
 
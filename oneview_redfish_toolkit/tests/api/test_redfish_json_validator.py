@@ -22,12 +22,15 @@ import collections
 import json
 from unittest import mock
 
+from hpOneView.exceptions import HPOneViewException
+
 from oneview_redfish_toolkit.api.errors import \
     OneViewRedfishInvalidAttributeValueException
 from oneview_redfish_toolkit.api.errors import \
     OneViewRedfishResourceNotFoundException
 from oneview_redfish_toolkit.api.redfish_json_validator import \
     RedfishJsonValidator
+from oneview_redfish_toolkit.api.util import port_map
 from oneview_redfish_toolkit.tests.base_test import BaseTest
 
 
@@ -92,6 +95,58 @@ class TestRedfishJsonValidator(BaseTest):
             redfish_json_validator.get_resource_by_id(
                 [], "deviceNumber", "INVALID_ID")
 
+    def test_get_port_map_resource(self):
+        port_map.init_map_port_map_indexes()
+        redfish_json_validator = RedfishJsonValidator('ServiceRoot')
+
+        with open(
+                'oneview_redfish_toolkit/mockups/oneview/ServerHardware.json'
+        ) as f:
+            server_hardware = json.load(f)
+
+        device_slot = server_hardware["portMap"]["deviceSlots"][2]
+        port = device_slot["physicalPorts"][0]
+        virtual_port = port["virtualPorts"][1]
+
+        self.assertIs(
+            device_slot,
+            redfish_json_validator.get_port_map_resource(
+                server_hardware, str(device_slot["deviceNumber"])))
+        self.assertIs(
+            port,
+            redfish_json_validator.get_port_map_resource(
+                server_hardware, device_slot["deviceNumber"],
+                port["portNumber"]))
+        self.assertIs(
+            virtual_port,
+            redfish_json_validator.get_port_map_resource(
+                server_hardware, device_slot["deviceNumber"],
+                port["portNumber"], virtual_port["portNumber"]))
+
+        with self.assertRaises(OneViewRedfishResourceNotFoundException):
+            redfish_json_validator.get_port_map_resource(
+                server_hardware, device_slot["deviceNumber"], 99)
+
+        with self.assertRaises(OneViewRedfishInvalidAttributeValueException):
+            redfish_json_validator.get_port_map_resource(
+                server_hardware, "INVALID_ID")
+
+    def test_port_map_index_is_cached_by_etag(self):
+        port_map.init_map_port_map_indexes()
+
+        with open(
+                'oneview_redfish_toolkit/mockups/oneview/ServerHardware.json'
+        ) as f:
+            server_hardware = json.load(f)
+
+        index = port_map.get_port_map_index(server_hardware)
+
+        self.assertIs(index, port_map.get_port_map_index(server_hardware))
+
+        server_hardware["eTag"] = "new eTag"
+
+        self.assertIsNot(index, port_map.get_port_map_index(server_hardware))
+
     @mock.patch('oneview_redfish_toolkit.api.schemas.SCHEMAS', schemas_dict)
     def test_get_odata_type_by_class(self):
         redfish_json_validator = RedfishJsonValidator('ServiceRoot')
@@ -106,3 +161,56 @@ class TestRedfishJsonValidator(BaseTest):
         self.assertEqual(
             redfish_json_validator.get_odata_type_by_schema(zone_schema_name),
             odata_type_zone_schema)
+
+    def test_serialize_stream(self):
+        redfish_json_validator = RedfishJsonValidator('ServiceRoot')
+        redfish_json_validator.redfish["@odata.type"] = "#Collection"
+        redfish_json_validator.redfish["Members@odata.count"] = 0
+        redfish_json_validator.redfish["Members"] = list()
+        redfish_json_validator.redfish["@odata.id"] = "/redfish/v1/Chassis"
+
+        members = [{"@odata.id": "/redfish/v1/Chassis/" + str(i)}
+                   for i in range(3)]
+
+        expected = collections.OrderedDict()
+        expected["@odata.type"] = "#Collection"
+        expected["@odata.id"] = "/redfish/v1/Chassis"
+        expected["Members"] = members
+        expected["Members@odata.count"] = 3
+
+        result = "".join(
+            redfish_json_validator.serialize_stream(iter(members)))
+
+        self.assertEqual(json.dumps(expected, indent=4), result)
+
+    def test_serialize_stream_when_members_fail(self):
+        redfish_json_validator = RedfishJsonValidator('ServiceRoot')
+        redfish_json_validator.redfish["@odata.id"] = "/redfish/v1/Chassis"
+
+        def members():
+            yield {"@odata.id": "/redfish/v1/Chassis/1"}
+            raise HPOneViewException({
+                'errorCode': 'INTERNAL_ERROR',
+                'message': 'An unexpected error',
+            })
+
+        result = "".join(redfish_json_validator.serialize_stream(members()))
+
+        # the json is ended with the Members written before the error
+        self.assertEqual({"@odata.id": "/redfish/v1/Chassis",
+                          "Members": [
+                              {"@odata.id": "/redfish/v1/Chassis/1"}
+                          ],
+                          "Members@odata.count": 1},
+                         json.loads(result))
+
+    def test_serialize_stream_without_members(self):
+        redfish_json_validator = RedfishJsonValidator('ServiceRoot')
+        redfish_json_validator.redfish["@odata.id"] = "/redfish/v1/Chassis"
+
+        result = "".join(redfish_json_validator.serialize_stream([]))
+
+        self.assertEqual({"@odata.id": "/redfish/v1/Chassis",
+                          "Members": [],
+                          "Members@odata.count": 0},
+                         json.loads(result))
@@ -15,6 +15,7 @@
 # under the License.
 
 # Python libs
+import json
 import os
 import shutil
 from unittest import mock
@@ -27,6 +28,10 @@ from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api import scmb
 from oneview_redfish_toolkit.api.scmb import SCMB
 from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit.services import server_hardware_type_service
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.services import task_watch_service
+from oneview_redfish_toolkit.services import zone_service
 from oneview_redfish_toolkit.tests.base_test import BaseTest
 from oneview_redfish_toolkit import util
 
@@ -158,6 +163,110 @@ class TestSCMB(BaseTest):
 
         self.assertTrue(dispatch_mock.called)
 
+    @mock.patch.object(server_hardware_type_service, 'config')
+    @mock.patch.object(util, 'dispatch_event')
+    def test_consume_message_for_cached_resource(self, dispatch_mock,
+                                                 config_mock):
+        config_mock.get_server_hardware_type_ttl.return_value = 60
+        server_hardware_type_service.init_map_server_hardware_types()
+        server_hardware_type = {
+            "category": "server-hardware-types",
+            "eTag": "2",
+            "uri": "/rest/server-hardware-types/1"
+        }
+        message = {
+            "changeType": "Updated",
+            "resource": server_hardware_type,
+            "resourceUri": "/rest/server-hardware-types/1"
+        }
+        scmb_thread = SCMB('1.1.1.1', 'cred', 'token')
+
+        # a Server Hardware Type not read yet is not cached
+        scmb_thread.consume_message(
+            None, None, None, json.dumps(message).encode('UTF-8'))
+
+        self.assertEqual(
+            {}, server_hardware_type_service.map_server_hardware_types)
+
+        server_hardware_type_service.map_server_hardware_types[
+            "/rest/server-hardware-types/1"] = (0, {"eTag": "1"})
+
+        scmb_thread.consume_message(
+            None, None, None, json.dumps(message).encode('UTF-8'))
+
+        self.assertEqual(
+            server_hardware_type,
+            server_hardware_type_service.map_server_hardware_types[
+                "/rest/server-hardware-types/1"][1])
+
+        message["changeType"] = "Deleted"
+        scmb_thread.consume_message(
+            None, None, None, json.dumps(message).encode('UTF-8'))
+
+        self.assertEqual(
+            {}, server_hardware_type_service.map_server_hardware_types)
+        dispatch_mock.assert_not_called()
+
+    @mock.patch.object(zone_service, 'update_zone_index_server_hardware')
+    @mock.patch.object(util, 'dispatch_event')
+    def test_consume_message_for_server_hardware(self, dispatch_mock,
+                                                 update_zone_index_mock):
+        server_hardware = {
+            "category": "server-hardware",
+            "locationUri": "/rest/enclosures/1",
+            "name": "Encl1, bay 1"
+        }
+        message = {
+            "changeType": "Updated",
+            "resource": server_hardware,
+            "resourceUri": "/rest/server-hardware/1",
+            "timestamp": "2018-07-09T08:19:18.524Z"
+        }
+        scmb_thread = SCMB('1.1.1.1', 'cred', 'token')
+
+        scmb_thread.consume_message(
+            None, None, None, json.dumps(message).encode('UTF-8'))
+
+        update_zone_index_mock.assert_called_with(
+            "Updated", dict(server_hardware, uri="/rest/server-hardware/1"))
+        self.assertTrue(dispatch_mock.called)
+
+    @mock.patch.object(util, 'dispatch_event')
+    def test_consume_message_for_task(self, dispatch_mock):
+        task_watch_service.init_map_watched_tasks()
+        task_tracker_service.init_map_tasks()
+        task_uri = "/rest/tasks/1"
+        running_task = {
+            "uri": task_uri,
+            "taskState": "Running",
+            "associatedResource": {"resourceUri": None}
+        }
+        task_watch_service._watch(task_uri, running_task)
+        tracked_task = task_tracker_service.create_task("Task")
+        tracked_task.update_from_oneview_task(running_task)
+        completed_task = {
+            "category": "tasks",
+            "taskState": "Completed",
+            "associatedResource": {
+                "resourceUri": "/rest/server-profiles/1"
+            }
+        }
+        message = {
+            "changeType": "Updated",
+            "resource": completed_task,
+            "resourceUri": task_uri
+        }
+        scmb_thread = SCMB('1.1.1.1', 'cred', 'token')
+
+        scmb_thread.consume_message(
+            None, None, None, json.dumps(message).encode('UTF-8'))
+
+        self.assertEqual(
+            dict(completed_task, uri=task_uri),
+            task_watch_service._wait_for_update(task_uri, running_task, 0))
+        self.assertEqual("Completed", tracked_task.state)
+        dispatch_mock.assert_not_called()
+
     @mock.patch.object(SCMB, '_get_ov_ca_cert')
     @mock.patch.object(scmb, 'config')
     @mock.patch.object(SCMB, '_is_cert_working_with_scmb')
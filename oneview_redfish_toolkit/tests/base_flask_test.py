@@ -25,13 +25,23 @@ from hpOneView import HPOneViewException
 
 from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api.redfish_error import RedfishError
+from oneview_redfish_toolkit.api.util import port_map
 from oneview_redfish_toolkit.blueprints.util.response_builder import \
     ResponseBuilder
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import circuit_breaker
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import handler_multiple_oneview
 from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import appliance_health_service
+from oneview_redfish_toolkit.services import sas_logical_jbod_service
+from oneview_redfish_toolkit.services import server_hardware_type_service
+from oneview_redfish_toolkit.services import service_root_service
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.services import task_watch_service
+from oneview_redfish_toolkit.services import telemetry_service
+from oneview_redfish_toolkit.services import zone_service
 from oneview_redfish_toolkit.tests.base_test import BaseTest
 
 
@@ -126,6 +136,8 @@ class BaseFlaskTest(BaseTest):
             g.oneview_client = \
                 handler_multiple_oneview.MultipleOneViewResource()
 
+        cls.app.after_request(multiple_oneview.set_partial_result_header)
+
         cls.client = cls.app.test_client()
 
         # propagate the exceptions to the test client
@@ -136,7 +148,58 @@ class BaseFlaskTest(BaseTest):
         cls.oneview_client = mock.MagicMock()
         cls.mock_get_client_by_ip.return_value = cls.oneview_client
         cls.mock_get_client_by_token.return_value = cls.oneview_client
+        client_session.init_map_clients()
+        client_session.init_map_pooled_clients()
+        circuit_breaker.init_map_circuit_breakers()
         category_resource.init_map_category_resources()
+        sas_logical_jbod_service.init_map_drives_by_sas_logical_jbod()
+        server_hardware_type_service.init_map_server_hardware_types()
+        service_root_service.init_map_service_root()
+        port_map.init_map_port_map_indexes()
+        zone_service.init_zone_index()
+        task_tracker_service.init_map_tasks()
+        task_watch_service.init_map_watched_tasks()
+        telemetry_service.init_map_sampled_chassis()
+        appliance_health_service.init_map_polled_appliances()
+
+    def mock_get_all_fields(self, members_by_resource, ov_client=None):
+        """Mocks the OneView lists requested with only some fields
+
+            The lists are requested with connection.get on the resource
+            URI, so each resource gets the URI of its OneView resource.
+
+            Args:
+                members_by_resource: the members listed, or the exception
+                    raised, by resource of the OneView client
+                ov_client: the mocked OneView client, by default the one
+                    of the requests
+        """
+        ov_client = ov_client or self.oneview_client
+        members_by_uri = dict()
+
+        for resource, members in members_by_resource.items():
+            uri = "/rest/" + resource.replace("_", "-")
+            getattr(ov_client, resource).URI = uri
+            members_by_uri[uri] = members
+
+        def get(uri):
+            members = members_by_uri.get(uri.split("?")[0], mock.DEFAULT)
+
+            if isinstance(members, Exception):
+                raise members
+
+            if members is mock.DEFAULT:
+                return members
+
+            return {"members": members}
+
+        ov_client.connection.get.side_effect = get
+
+    @staticmethod
+    def get_all_fields_uri(resource, fields, start=0, count=-1):
+        """Gets the URI of a OneView list requested with only some fields"""
+        return "/rest/{}?start={}&count={}&fields={}".format(
+            resource.replace("_", "-"), start, count, fields)
 
     @classmethod
     def tearDownClass(cls):
@@ -698,6 +698,34 @@ class TestChassis(BaseFlaskTest):
             self.assertEqual("application/json", response.mimetype)
             self.assertEqual(json_str, '{"ResetType": "%s"}' % reset_type)
 
+    @mock.patch.object(chassis.config, 'async_actions_enabled')
+    def test_change_power_state_async_without_oneview_task(
+            self, async_actions_enabled):
+        """Tests changes a SH power state when OneView returns no task"""
+        async_actions_enabled.return_value = True
+        self.oneview_client.index_resources.get_all.return_value = \
+            [{"category": "server-hardware"}]
+        self.oneview_client.server_hardware.get_by_id.return_value = \
+            ServerHardware(self.oneview_client, self.server_hardware)
+        self.oneview_client.connection.put.return_value = \
+            (None, self.server_hardware)
+
+        response = self.client.post(
+            "/redfish/v1/Chassis/30303437-3034-4D32-3230-313133364752"
+            "/Actions/Chassis.Reset",
+            data=json.dumps(dict(ResetType="On")),
+            content_type='application/json')
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+        self.assertEqual("Completed", result["TaskState"])
+        self.assertEqual("OK", result["TaskStatus"])
+        self.oneview_client.connection.put.assert_called_once_with(
+            self.server_hardware["uri"] + "/powerState", {"powerState": "On"})
+        self.oneview_client.server_hardware.update_power_state\
+            .assert_not_called()
+
     def test_change_power_state_invalid_value(self):
         """Tests changes a SH chassi type with invalid power value"""
 
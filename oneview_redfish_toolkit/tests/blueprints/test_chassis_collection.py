@@ -16,12 +16,17 @@
 
 # Python libs
 import json
+from unittest import mock
 
 # 3rd party libs
 from flask_api import status
+from hpOneView.exceptions import HPOneViewException
 
 # Module libs
 from oneview_redfish_toolkit.blueprints import chassis_collection
+from oneview_redfish_toolkit import circuit_breaker
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit import multiple_oneview
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -45,10 +50,11 @@ class TestChassisCollection(BaseFlaskTest):
     def test_get_chassis_collection_unexpected_error(self):
         """Tests ChassisCollection with an error"""
 
-        self.oneview_client.enclosures.get_all.return_value = [object]
-        self.oneview_client.racks.get_all.return_value = [object]
-        self.oneview_client.server_hardware.get_all.side_effect = \
-            Exception("An exception has occurred")
+        self.mock_get_all_fields({
+            "enclosures": [object],
+            "racks": [object],
+            "server_hardware": Exception("An exception has occurred")
+        })
 
         with open(
                 'oneview_redfish_toolkit/mockups/errors/'
@@ -69,9 +75,11 @@ class TestChassisCollection(BaseFlaskTest):
     def test_get_chassis_collection_empty(self):
         """Tests ChassisCollection with an empty sh, enclosure and rack list"""
 
-        self.oneview_client.enclosures.get_all.return_value = []
-        self.oneview_client.racks.get_all.return_value = []
-        self.oneview_client.server_hardware.get_all.return_value = []
+        self.mock_get_all_fields({
+            "enclosures": [],
+            "racks": [],
+            "server_hardware": []
+        })
 
         with open(
                 'oneview_redfish_toolkit/mockups/redfish/'
@@ -87,6 +95,56 @@ class TestChassisCollection(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqual(chassis_collection_empty, result)
 
+    @mock.patch.object(multiple_oneview, 'config')
+    def test_get_chassis_collection_with_open_circuit(self, config_mock):
+        """Tests ChassisCollection skipping a OneView with an open circuit"""
+
+        config_mock.get_oneview_multiple_ips.return_value = \
+            ['10.0.0.1', '10.0.0.2']
+        self.mock_get_all_fields({
+            "enclosures": [],
+            "racks": [],
+            "server_hardware": []
+        })
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            circuit_breaker.record_call("10.0.0.2", 0.1, failed=True)
+
+        response = self.client.get("/redfish/v1/Chassis/")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            '199 - "Partial result, OneViews 10.0.0.2 are unavailable"',
+            response.headers["Warning"])
+        self.oneview_client.connection.get.assert_any_call(
+            self.get_all_fields_uri("server_hardware", "uuid"))
+        self.assertEqual(3, self.oneview_client.connection.get.call_count)
+
+    @mock.patch.object(config, 'stream_collections_enabled')
+    @mock.patch.object(multiple_oneview, 'config')
+    def test_get_chassis_collection_streamed_with_open_circuit(
+            self, config_mock, stream_collections_enabled):
+        """Tests ChassisCollection streamed with an open circuit"""
+
+        stream_collections_enabled.return_value = True
+        config_mock.get_oneview_multiple_ips.return_value = \
+            ['10.0.0.1', '10.0.0.2']
+        self.mock_get_all_fields({
+            "enclosures": [],
+            "racks": [],
+            "server_hardware": []
+        })
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            circuit_breaker.record_call("10.0.0.2", 0.1, failed=True)
+
+        response = self.client.get("/redfish/v1/Chassis/")
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            '199 - "Partial result, OneViews 10.0.0.2 are unavailable"',
+            response.headers["Warning"])
+
     def test_get_chassis_collection(self):
         """Tests ChassisCollection with a known Results"""
 
@@ -118,10 +176,11 @@ class TestChassisCollection(BaseFlaskTest):
             chassis_collection_mockup = json.load(f)
 
         # Create mock response
-        self.oneview_client.server_hardware.get_all.return_value = \
-            server_hardware_list
-        self.oneview_client.enclosures.get_all.return_value = enclosures
-        self.oneview_client.racks.get_all.return_value = racks
+        self.mock_get_all_fields({
+            "server_hardware": server_hardware_list,
+            "enclosures": enclosures,
+            "racks": racks
+        })
 
         # Get ChassisCollection
         response = self.client.get("/redfish/v1/Chassis/")
@@ -133,3 +192,71 @@ class TestChassisCollection(BaseFlaskTest):
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(chassis_collection_mockup, result)
+
+    @mock.patch.object(config, 'stream_collections_enabled')
+    def test_get_chassis_collection_streamed(self, stream_collections_enabled):
+        """Tests ChassisCollection streamed from OneView pages"""
+
+        with open(
+            'oneview_redfish_toolkit/mockups/oneview/'
+            'ServerHardwareList.json'
+        ) as f:
+            server_hardware_list = json.load(f)
+
+        with open(
+            'oneview_redfish_toolkit/mockups/oneview/'
+            'Enclosures.json'
+        ) as f:
+            enclosures = json.load(f)
+
+        with open(
+            'oneview_redfish_toolkit/mockups/oneview/'
+            'Racks.json'
+        ) as f:
+            racks = json.load(f)
+
+        with open(
+                'oneview_redfish_toolkit/mockups/redfish/'
+                'ChassisCollection.json'
+        ) as f:
+            chassis_collection_mockup = json.load(f)
+
+        stream_collections_enabled.return_value = True
+        self.mock_get_all_fields({
+            "server_hardware": server_hardware_list,
+            "enclosures": enclosures,
+            "racks": racks
+        })
+
+        response = self.client.get("/redfish/v1/Chassis/")
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.assertEqualMockup(chassis_collection_mockup, result)
+        self.oneview_client.connection.get.assert_called_with(
+            self.get_all_fields_uri(
+                "server_hardware", "uuid",
+                count=config.get_collection_page_size()))
+
+    @mock.patch.object(config, 'stream_collections_enabled')
+    def test_get_chassis_collection_streamed_with_error(
+            self, stream_collections_enabled):
+        """Tests ChassisCollection streamed when OneView answers an error"""
+
+        stream_collections_enabled.return_value = True
+        self.mock_get_all_fields({
+            "enclosures": HPOneViewException({
+                'errorCode': 'INTERNAL_ERROR',
+                'message': 'An unexpected error',
+            })
+        })
+
+        response = self.client.get("/redfish/v1/Chassis/")
+
+        json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_500_INTERNAL_SERVER_ERROR,
+                         response.status_code)
+        self.assertEqual("application/json", response.mimetype)
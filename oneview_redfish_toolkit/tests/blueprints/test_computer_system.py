@@ -35,10 +35,12 @@ from unittest.mock import call
 # Module libs
 from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 import oneview_redfish_toolkit.api.status_mapping as status_mapping
+from oneview_redfish_toolkit import async_oneview
 from oneview_redfish_toolkit.blueprints import computer_system
 from oneview_redfish_toolkit import category_resource
 from oneview_redfish_toolkit import multiple_oneview
 from oneview_redfish_toolkit.services import computer_system_service
+from oneview_redfish_toolkit.services import task_tracker_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -97,6 +99,13 @@ class TestComputerSystem(BaseFlaskTest):
         ) as f:
             self.drives = json.load(f)
 
+        # Loading SASLogicalJBODListForStorage mockup value
+        with open(
+                'oneview_redfish_toolkit/mockups/oneview/'
+                'SASLogicalJBODListForStorage.json'
+        ) as f:
+            self.sas_logical_jbods = json.load(f)
+
         # Loading LabelForServerProfile mockup result
         with open(
                 'oneview_redfish_toolkit/mockups/oneview'
@@ -308,6 +317,8 @@ class TestComputerSystem(BaseFlaskTest):
             server_hardware_type_obj
         self.oneview_client.oneview_client.labels.get_by_resource.return_value = \
             self.server_hardware_types
+        self.oneview_client.sas_logical_jbods.get_all.return_value = \
+            self.sas_logical_jbods
         self.oneview_client.sas_logical_jbods.get_drives.return_value = \
             [self.drives[4]]
         self.oneview_client.labels.get_by_resource.return_value = \
@@ -353,6 +364,24 @@ class TestComputerSystem(BaseFlaskTest):
             "61c3a463-1355-4c68-a4e3-4f08c322af1b"
         )
 
+    def test_get_computer_system_server_profile_concurrently(self):
+        """Tests ComputerSystem fetching its resources concurrently"""
+
+        async_oneview.init_event_loop()
+        self.addCleanup(setattr, async_oneview, 'map_event_loop', None)
+
+        self.test_get_computer_system_server_profile()
+
+    def test_get_computer_system_server_profile_with_cached_drives(self):
+        """Tests ComputerSystem reusing the drives of an unchanged JBOD"""
+
+        self.test_get_computer_system_server_profile()
+        self.test_get_computer_system_server_profile()
+
+        self.oneview_client.sas_logical_jbods.get_drives.assert_called_once_with(
+            "/rest/sas-logical-jbods/9e83a03d-7a84-4f0d-a8d7-bd05a30c3175"
+        )
+
     def test_get_computer_system_spt(self):
         """Tests ComputerSystem with a known Server Profile Templates"""
 
@@ -504,6 +533,46 @@ class TestComputerSystem(BaseFlaskTest):
                 'powerState': 'Off'
             })
 
+    @mock.patch.object(task_tracker_service, '_start_task_tracker')
+    @mock.patch.object(computer_system.config, 'async_actions_enabled')
+    def test_change_power_state_async(self, async_actions_enabled,
+                                      start_task_tracker):
+        """Tests change SH power state returning a Task of the action"""
+        async_actions_enabled.return_value = True
+        profile_obj = ServerProfiles(self.oneview_client, self.server_profile)
+        serverhw_obj = ServerHardware(
+            self.oneview_client, self.server_hardware)
+        self.oneview_client.\
+            server_profiles.get_by_id.return_value = profile_obj
+        self.oneview_client.server_hardware.get_by_uri.return_value = \
+            serverhw_obj
+        oneview_task = {
+            "uri": "/rest/tasks/7A7E8A2B-D2DE-4B12-8F2A-C3C1A3D5F2E1",
+            "taskState": "Running"
+        }
+        self.oneview_client.connection.put.return_value = (oneview_task, None)
+
+        response = self.client.post(
+            "/redfish/v1/Systems/b425802b-a6a5-4941-8885-aab68dfa2ee2"
+            "/Actions/ComputerSystem.Reset",
+            data=json.dumps(dict(ResetType="ForceRestart")),
+            content_type='application/json')
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.assertEqual("Running", result["TaskState"])
+        self.assertTrue(response.headers["Location"].endswith(
+            "/redfish/v1/TaskService/Tasks/" + result["Id"]))
+        self.oneview_client.connection.put.assert_called_once_with(
+            self.server_hardware["uri"] + "/powerState",
+            {"powerState": "On", "powerControl": "ColdBoot"})
+        start_task_tracker.assert_called_once_with()
+
+        task = task_tracker_service.get_task(result["Id"])
+        self.assertEqual(oneview_task["uri"], task.oneview_task_uri)
+
     def test_change_power_state_invalid_value(self):
         """Tests change SH power state with invalid power value"""
         profile_obj = ServerProfiles(self.oneview_client, self.server_profile)
@@ -812,6 +881,8 @@ class TestComputerSystem(BaseFlaskTest):
                 serverhw_obj
             self.oneview_client.server_hardware_types.get_by_uri.return_value = \
                 server_hardware_type_obj
+            self.oneview_client.sas_logical_jbods.get_all.return_value = \
+                self.sas_logical_jbods
             self.oneview_client.sas_logical_jbods.get_drives.return_value = \
                 [self.drives[4]]
             self.oneview_client.labels.get_by_resource.return_value = \
@@ -858,6 +929,8 @@ class TestComputerSystem(BaseFlaskTest):
                 serverhw_obj
             self.oneview_client.server_hardware_types.get_by_uri.return_value = \
                 server_hardware_type_obj
+            self.oneview_client.sas_logical_jbods.get_all.return_value = \
+                self.sas_logical_jbods
             self.oneview_client.sas_logical_jbods.get_drives.return_value = \
                 [self.drives[4]]
             self.oneview_client.labels.get_by_resource.return_value = \
@@ -914,6 +987,8 @@ class TestComputerSystem(BaseFlaskTest):
             serverhw_obj
         self.oneview_client.server_hardware_types.get_by_uri.return_value = \
             server_hardware_type_obj
+        self.oneview_client.sas_logical_jbods.get_all.return_value = \
+            self.sas_logical_jbods
         self.oneview_client.sas_logical_jbods.get_drives.return_value = \
             [self.drives[4]]
         self.oneview_client.labels.get_by_resource.return_value = label_for_sp
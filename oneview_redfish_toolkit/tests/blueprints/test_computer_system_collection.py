@@ -15,10 +15,12 @@
 # under the License.
 
 import json
+from unittest import mock
 
 from flask_api import status
 
 from oneview_redfish_toolkit.blueprints import computer_system_collection
+from oneview_redfish_toolkit.services import task_tracker_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -35,7 +37,7 @@ class TestComputerSystemCollection(BaseFlaskTest):
     def test_get_computer_system_collection_empty(self):
         """Tests ComputerSystemCollection with an empty list"""
 
-        self.oneview_client.server_profiles.get_all.return_value = []
+        self.mock_get_all_fields({"server_profiles": []})
         self.oneview_client.server_profile_templates.get_all.return_value = []
 
         response = self.client.get("/redfish/v1/Systems/")
@@ -53,11 +55,119 @@ class TestComputerSystemCollection(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(expected_result, result)
 
+    def _set_bulk_reset_resources(self):
+        self.oneview_client.server_profiles.get_all.return_value = [
+            {"uuid": "b425802b-a6a5-4941-8885-aab68dfa2ee2",
+             "serverHardwareUri": "/rest/server-hardware/"
+                                  "30303437-3034-4D32-3230-313130304752"},
+            {"uuid": "0e8e1b8c-2f4b-4a6f-9b0e-2d9c4a1f6d3e",
+             "serverHardwareUri": None}
+        ]
+        self.oneview_client.server_hardware.get_all.return_value = [
+            {"uuid": "30303437-3034-4D32-3230-313130304752",
+             "uri": "/rest/server-hardware/"
+                    "30303437-3034-4D32-3230-313130304752",
+             "name": "0000A66101, bay 3",
+             "powerState": "On"}
+        ]
+
+    def _post_bulk_reset(self, reset_type):
+        return self.client.post(
+            "/redfish/v1/Systems/Actions/Oem/"
+            "HpeComputerSystemCollection.Reset",
+            data=json.dumps({
+                "ResetType": reset_type,
+                "Members": [
+                    {"@odata.id": "/redfish/v1/Systems/"
+                                  "b425802b-a6a5-4941-8885-aab68dfa2ee2"},
+                    {"@odata.id": "/redfish/v1/Systems/"
+                                  "0e8e1b8c-2f4b-4a6f-9b0e-2d9c4a1f6d3e"}
+                ]}),
+            content_type='application/json')
+
+    def test_reset_computer_systems(self):
+        """Tests resetting many Computer Systems in one call"""
+        self._set_bulk_reset_resources()
+
+        response = self._post_bulk_reset("ForceRestart")
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.assertEqual({
+            "ResetType": "ForceRestart",
+            "Members": [
+                {"@odata.id": "/redfish/v1/Systems/"
+                              "b425802b-a6a5-4941-8885-aab68dfa2ee2",
+                 "Status": "Completed"},
+                {"@odata.id": "/redfish/v1/Systems/"
+                              "0e8e1b8c-2f4b-4a6f-9b0e-2d9c4a1f6d3e",
+                 "Status": "Failed",
+                 "Message": "Computer System "
+                            "0e8e1b8c-2f4b-4a6f-9b0e-2d9c4a1f6d3e not found"}
+            ],
+            "Members@odata.count": 2
+        }, result)
+        self.oneview_client.server_profiles.get_all.assert_called_once_with(
+            filter="uuid='b425802b-a6a5-4941-8885-aab68dfa2ee2' OR "
+                   "uuid='0e8e1b8c-2f4b-4a6f-9b0e-2d9c4a1f6d3e'")
+        self.oneview_client.server_hardware.get_all.assert_called_once_with(
+            filter="uri='/rest/server-hardware/"
+                   "30303437-3034-4D32-3230-313130304752'")
+        # the Server Hardware found is updated without being searched again
+        self.oneview_client.server_hardware.new.assert_called_once_with(
+            self.oneview_client.connection,
+            self.oneview_client.server_hardware.get_all.return_value[0])
+        self.oneview_client.server_hardware.new.return_value.\
+            update_power_state.assert_called_once_with(
+                {"powerState": "On", "powerControl": "ColdBoot"})
+        self.oneview_client.server_hardware.get_by_id.assert_not_called()
+        self.oneview_client.server_hardware.get_by_uri.assert_not_called()
+
+    @mock.patch.object(task_tracker_service, '_start_task_tracker')
+    @mock.patch.object(computer_system_collection.config,
+                       'async_actions_enabled')
+    def test_reset_computer_systems_async(self, async_actions_enabled,
+                                          start_task_tracker):
+        """Tests resetting many Computer Systems returning their Tasks"""
+        async_actions_enabled.return_value = True
+        self._set_bulk_reset_resources()
+        self.oneview_client.connection.put.return_value = (
+            {"uri": "/rest/tasks/7A7E8A2B-D2DE-4B12-8F2A-C3C1A3D5F2E1",
+             "taskState": "Running"}, None)
+
+        response = self._post_bulk_reset("On")
+
+        result = json.loads(response.data.decode("utf-8"))
+        task_id = task_tracker_service.get_task_ids()[0]
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual({
+            "@odata.id": "/redfish/v1/Systems/"
+                         "b425802b-a6a5-4941-8885-aab68dfa2ee2",
+            "Status": "Accepted",
+            "Task": {"@odata.id": "/redfish/v1/TaskService/Tasks/" + task_id}
+        }, result["Members"][0])
+        self.assertEqual("Failed", result["Members"][1]["Status"])
+        self.oneview_client.connection.put.assert_called_once_with(
+            "/rest/server-hardware/30303437-3034-4D32-3230-313130304752"
+            "/powerState", {"powerState": "On"})
+
+    def test_reset_computer_systems_with_invalid_reset_type(self):
+        """Tests resetting many Computer Systems with an invalid ResetType"""
+
+        response = self._post_bulk_reset("INVALID_TYPE")
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.oneview_client.server_profiles.get_all.assert_not_called()
+
     def test_get_computer_system_collection_fail(self):
         """Tests ComputerSystemCollection with an error"""
 
-        self.oneview_client.server_profiles.get_all.side_effect = \
-            Exception("An exception has occurred")
+        self.mock_get_all_fields({
+            "server_profiles": Exception("An exception has occurred")
+        })
 
         with open(
                 'oneview_redfish_toolkit/mockups/errors/'
@@ -108,8 +218,7 @@ class TestComputerSystemCollection(BaseFlaskTest):
                 'DriveEnclosureList.json'
         ) as f:
             drive_enclosure = json.load(f)
-        self.oneview_client.server_profiles.get_all.return_value = \
-            server_profile_list
+        self.mock_get_all_fields({"server_profiles": server_profile_list})
 
         self.oneview_client.server_profile_templates.get_all.return_value = \
             server_profile_template_list
@@ -127,7 +236,9 @@ class TestComputerSystemCollection(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(computer_system_collection_mockup, result)
 
-        self.oneview_client.server_profiles.get_all.assert_called_with()
+        self.oneview_client.connection.get.assert_called_with(
+            self.get_all_fields_uri("server_profiles",
+                                    "uuid,serverHardwareUri"))
         self.oneview_client.\
             server_profile_templates.get_all.assert_called_with()
 
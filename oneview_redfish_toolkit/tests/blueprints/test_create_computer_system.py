@@ -34,7 +34,10 @@ from hpOneView.resources.activity.tasks import Tasks
 # Module libs
 from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.blueprints import computer_system
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit.services import computer_system_service
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.services import task_watch_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -240,8 +243,9 @@ class TestCreateComputerSystem(BaseFlaskTest):
             self.common_calls_to_assert_drives)
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
-    def test_create_system(self, time_mock, power_state):
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
+    def test_create_system(self, wait_for_update, power_state):
         """Tests create a redfish System with Network, Storage and Server"""
 
         with open(
@@ -326,7 +330,59 @@ class TestCreateComputerSystem(BaseFlaskTest):
         #     '/rest/server-profiles', expected_server_profile_built
         # )
         self.assertEqual(self.oneview_client.tasks.get_by_uri.call_count, 3)
-        time_mock.sleep.assert_called_with(3)
+        self.assertEqual(
+            [call(task_without_resource_uri["uri"], mock.ANY, 1),
+             call(task_without_resource_uri["uri"], mock.ANY, 2),
+             call(task_without_resource_uri["uri"], mock.ANY, 4)],
+            wait_for_update.call_args_list)
+
+    @mock.patch.object(task_tracker_service, '_get_task_executor')
+    @mock.patch.object(config, 'async_actions_enabled', return_value=True)
+    @mock.patch.object(ServerHardware, 'update_power_state')
+    def test_create_system_async(self, power_state, _, get_task_executor):
+        """Tests create a System in background when async is enabled"""
+
+        task_with_resource_uri = {
+            "associatedResource": {
+                "resourceUri": self.server_profile["uri"]
+            },
+            "uri": "/rest/tasks/123456"
+        }
+
+        self.run_common_mock_to_server_hardware()
+        power_state.return_value = None
+        self.run_common_mock_to_server_profile_template()
+        self.run_common_mock_to_drives()
+        self.run_common_mock_to_volumes()
+        storage_pool_obj = StoragePools(self.oneview_client, {
+            "storageSystemUri": "/rest/storage-systems/TXQ1000307"
+        })
+        self.oneview_client.storage_pools.get_by_uri.return_value = storage_pool_obj
+        self.oneview_client.connection.post.return_value = \
+            (task_with_resource_uri, None)
+        executor = get_task_executor.return_value
+        executor.submit.side_effect = lambda function, *args: function(*args)
+
+        response = self.client.post(
+            "/redfish/v1/Systems",
+            data=json.dumps(self.data_to_create_system),
+            content_type='application/json')
+
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+        task_id = task_tracker_service.get_task_ids()[0]
+        self.assertIn(
+            "/redfish/v1/TaskService/Tasks/" + task_id,
+            response.headers["Location"])
+
+        task = task_tracker_service.get_task(task_id)
+        self.assertEqual("Completed", task.state)
+        self.assertEqual(
+            "The resource /redfish/v1/Systems/{} has been created "
+            "successfully".format(self.server_profile["uuid"]),
+            task.messages[-1]["Message"])
+        self.assertTrue(executor.submit.called)
+        self.oneview_client.labels.create.assert_called_with(dict(
+            resourceUri=self.server_profile["uri"], labels=[mock.ANY]))
 
     def test_create_when_server_hardware_already_belongs_to_system(self,):
         """Tests create when server profile already applied to the server"""
@@ -444,8 +500,10 @@ class TestCreateComputerSystem(BaseFlaskTest):
         self.oneview_client.connection.post.assert_not_called()
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
-    def test_create_system_without_description(self, time_mock, power_state):
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
+    def test_create_system_without_description(self, wait_for_update,
+                                               power_state):
         """Tests create a redfish System with Network, Storage and Server"""
 
         with open(
@@ -529,7 +587,11 @@ class TestCreateComputerSystem(BaseFlaskTest):
         #     '/rest/server-profiles', expected_server_profile_built
         # )
         self.assertEqual(self.oneview_client.tasks.get_by_uri.call_count, 3)
-        time_mock.sleep.assert_called_with(3)
+        self.assertEqual(
+            [call(task_without_resource_uri["uri"], mock.ANY, 1),
+             call(task_without_resource_uri["uri"], mock.ANY, 2),
+             call(task_without_resource_uri["uri"], mock.ANY, 4)],
+            wait_for_update.call_args_list)
 
     def test_create_system_when_request_content_is_wrong(self):
         """Tests trying create a redfish System without Links"""
@@ -671,7 +733,8 @@ class TestCreateComputerSystem(BaseFlaskTest):
         self.oneview_client.connection.post.assert_not_called()
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
     def test_create_system_when_request_content_has_not_storage(self, _, power_state):
         """Tests create a redfish System without Storage.
 
@@ -766,7 +829,8 @@ class TestCreateComputerSystem(BaseFlaskTest):
         #     expected_server_profile_built)
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
     def test_create_system_when_has_not_storage_and_controller(self, _, power_state):
         """Tests create a System without Storage but with Storage Controller.
 
@@ -857,7 +921,8 @@ class TestCreateComputerSystem(BaseFlaskTest):
         self.oneview_client.index_resources.get.assert_not_called()
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
     def test_create_system_when_a_task_error_is_raised(self, _, power_state):
         """Tests create a System when the Oneview raises a task error.
 
@@ -899,7 +964,8 @@ class TestCreateComputerSystem(BaseFlaskTest):
         self.assert_common_calls()
 
     @mock.patch.object(ServerHardware, 'update_power_state')
-    @mock.patch.object(computer_system_service, 'time')
+    @mock.patch.object(task_watch_service, '_wait_for_update',
+                       return_value=None)
     def test_when_has_more_than_one_task_error(self, _, power_state):
         """Tests create a System when the Oneview raises two task errors.
 
@@ -27,7 +27,9 @@ from flask_api import status
 import oneview_redfish_toolkit.api.status_mapping as status_mapping
 from oneview_redfish_toolkit.blueprints import manager
 from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import appliance_health_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -38,6 +40,8 @@ class TestManager(BaseFlaskTest):
             - manager
                 - know value
                 - not found error
+                - served from the appliance snapshot
+                - unreachable appliance
     """
 
     @classmethod
@@ -200,3 +204,137 @@ class TestManager(BaseFlaskTest):
             status.HTTP_404_NOT_FOUND,
             response.status_code)
         self.assertEqual("application/json", response.mimetype)
+
+    @mock.patch.object(appliance_health_service,
+                       '_start_appliance_health_poller')
+    @mock.patch.object(config, 'get_appliance_health_interval')
+    @mock.patch.object(client_session, 'get_oneview_client')
+    @mock.patch.object(multiple_oneview, 'execute_query_ov_client')
+    @mock.patch.object(multiple_oneview, 'get_map_appliances')
+    def test_get_manager_from_snapshot(self, get_map_appliances,
+                                       execute_query_ov_client,
+                                       get_oneview_client,
+                                       get_appliance_health_interval,
+                                       start_appliance_health_poller):
+        """Tests get Manager twice with the appliance polled in background"""
+
+        get_map_appliances.return_value = self.map_appliance
+        get_oneview_client.return_value = self.oneview_client
+        get_appliance_health_interval.return_value = 60
+        execute_query_ov_client.side_effect = [
+            self.appliance_info, self.appliance_state,
+            self.appliance_health_status
+        ]
+
+        for _ in range(2):
+            response = self.client.get(
+                "/redfish/v1/Managers/b08eb206-a904-46cf-9172-dcdff2fa9639"
+            )
+
+            result = json.loads(response.data.decode("utf-8"))
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqualMockup(self.manager_mockup, result)
+
+        self.assertEqual(3, execute_query_ov_client.call_count)
+        start_appliance_health_poller.assert_called_once_with()
+
+    @mock.patch.object(appliance_health_service,
+                       '_start_appliance_health_poller')
+    @mock.patch.object(config, 'get_appliance_health_interval')
+    @mock.patch.object(client_session, 'get_oneview_client')
+    @mock.patch.object(multiple_oneview, 'execute_query_ov_client')
+    @mock.patch.object(multiple_oneview, 'get_map_appliances')
+    def test_get_manager_snapshot_by_session(self, get_map_appliances,
+                                             execute_query_ov_client,
+                                             get_oneview_client,
+                                             get_appliance_health_interval,
+                                             start_appliance_health_poller):
+        """Tests get Manager from sessions with different clients"""
+
+        other_oneview_client = mock.MagicMock()
+        get_map_appliances.return_value = self.map_appliance
+        get_oneview_client.side_effect = [
+            self.oneview_client, other_oneview_client, self.oneview_client
+        ]
+        get_appliance_health_interval.return_value = 60
+        execute_query_ov_client.side_effect = [
+            self.appliance_info, self.appliance_state,
+            self.appliance_health_status
+        ] * 3
+        client_session._set_new_client_by_token("abc", {})
+        client_session._set_new_client_by_token("def", {})
+
+        for token in ["abc", "def", "abc"]:
+            response = self.client.get(
+                "/redfish/v1/Managers/b08eb206-a904-46cf-9172-dcdff2fa9639",
+                headers={"X-Auth-Token": token}
+            )
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        # each session reads the appliance with its own OneView session
+        self.assertEqual(6, execute_query_ov_client.call_count)
+        self.assertIs(other_oneview_client,
+                      execute_query_ov_client.call_args_list[3][0][0])
+        self.assertEqual(
+            2, len(appliance_health_service.map_polled_appliances))
+
+        # the appliance is no longer polled for a closed session
+        client_session.clear_session_by_token("abc")
+        appliance_health_service.poll_appliances()
+
+        self.assertEqual(9, execute_query_ov_client.call_count)
+        self.assertIs(other_oneview_client,
+                      execute_query_ov_client.call_args_list[6][0][0])
+        self.assertEqual(
+            [(client_session.get_session_id_by_token("def"), "10.0.0.1")],
+            list(appliance_health_service.map_polled_appliances))
+
+    @mock.patch.object(appliance_health_service,
+                       '_start_appliance_health_poller')
+    @mock.patch.object(config, 'get_appliance_health_interval')
+    @mock.patch.object(client_session, 'get_oneview_client')
+    @mock.patch.object(multiple_oneview, 'execute_query_ov_client')
+    @mock.patch.object(multiple_oneview, 'get_map_appliances')
+    def test_get_manager_when_appliance_is_unreachable(
+            self, get_map_appliances, execute_query_ov_client,
+            get_oneview_client, get_appliance_health_interval,
+            start_appliance_health_poller):
+        """Tests get Manager when its appliance does not answer"""
+
+        get_map_appliances.return_value = self.map_appliance
+        get_oneview_client.return_value = self.oneview_client
+        get_appliance_health_interval.return_value = 60
+        execute_query_ov_client.side_effect = \
+            ConnectionRefusedError("Connection refused")
+
+        with self.assertRaises(ConnectionRefusedError):
+            appliance_health_service.get_manager_snapshot(
+                "10.0.0.1", self.oneview_client)
+
+        response = self.client.get(
+            "/redfish/v1/Managers/b08eb206-a904-46cf-9172-dcdff2fa9639"
+        )
+
+        self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE,
+                         response.status_code)
+        self.assertEqual(1, execute_query_ov_client.call_count)
+        self.assertIn("10.0.0.1",
+                      appliance_health_service.map_unreachable_appliances)
+        start_appliance_health_poller.assert_called_once_with()
+
+        # the appliance answers the next poll
+        execute_query_ov_client.side_effect = [
+            self.appliance_info, self.appliance_state,
+            self.appliance_health_status
+        ]
+        appliance_health_service.poll_appliances()
+
+        response = self.client.get(
+            "/redfish/v1/Managers/b08eb206-a904-46cf-9172-dcdff2fa9639"
+        )
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertNotIn("10.0.0.1",
+                         appliance_health_service.map_unreachable_appliances)
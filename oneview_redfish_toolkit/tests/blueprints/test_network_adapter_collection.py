@@ -74,6 +74,91 @@ class TestNetworkAdapterCollection(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(network_adapter_collection_mockup, result)
 
+    def test_get_network_adapter_collection_expanded(self):
+        """Tests NetworkAdapterCollection with $expand"""
+
+        with open(
+            'oneview_redfish_toolkit/mockups/redfish/NetworkAdapters3.json'
+        ) as f:
+            network_adapter_mockup = json.load(f)
+
+        with open(
+            'oneview_redfish_toolkit/mockups/redfish/NetworkPort1-Ethernet.json'
+        ) as f:
+            network_port_mockup = json.load(f)
+
+        with open(
+            'oneview_redfish_toolkit/mockups/redfish/'
+            'NetworkDeviceFunction1_1_a.json'
+        ) as f:
+            network_device_function_mockup = json.load(f)
+
+        serverhw_obj = ServerHardware(
+            self.oneview_client, self.server_hardware)
+        self.oneview_client.server_hardware.get_by_id.return_value = \
+            serverhw_obj
+
+        response = self.client.get(
+            "/redfish/v1/Chassis/30303437-3034-4D32-3230-313133364752/"
+            "NetworkAdapters/?$expand=.($levels=3)"
+        )
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.assertEqual(1, result["Members@odata.count"])
+
+        network_adapter = result["Members"][0]
+        network_ports = network_adapter.pop("NetworkPorts")
+        network_device_functions = \
+            network_adapter.pop("NetworkDeviceFunctions")
+        del network_adapter_mockup["NetworkPorts"]
+        del network_adapter_mockup["NetworkDeviceFunctions"]
+
+        self.assertEqualMockup(network_adapter_mockup, network_adapter)
+        self.assertEqual(2, network_ports["Members@odata.count"])
+        self.assertEqualMockup(network_port_mockup,
+                               network_ports["Members"][0])
+        self.assertEqual(16, network_device_functions["Members@odata.count"])
+        self.assertEqualMockup(network_device_function_mockup,
+                               network_device_functions["Members"][0])
+        self.oneview_client.server_hardware.get_by_id.assert_called_once_with(
+            "30303437-3034-4D32-3230-313133364752")
+
+    def test_get_network_adapter_collection_expanded_one_level(self):
+        """Tests NetworkAdapterCollection with $expand of one level"""
+
+        serverhw_obj = ServerHardware(
+            self.oneview_client, self.server_hardware)
+        self.oneview_client.server_hardware.get_by_id.return_value = \
+            serverhw_obj
+
+        response = self.client.get(
+            "/redfish/v1/Chassis/30303437-3034-4D32-3230-313133364752/"
+            "NetworkAdapters/?$expand=*"
+        )
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            {"@odata.id": "/redfish/v1/Chassis/30303437-3034-4D32-3230-"
+                          "313133364752/NetworkAdapters/3/NetworkPorts/"},
+            result["Members"][0]["NetworkPorts"])
+
+    def test_get_network_adapter_collection_invalid_expand(self):
+        """Tests NetworkAdapterCollection with an invalid $expand"""
+
+        response = self.client.get(
+            "/redfish/v1/Chassis/30303437-3034-4D32-3230-313133364752/"
+            "NetworkAdapters/?$expand=.($levels=abc)"
+        )
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.oneview_client.server_hardware.get_by_id.assert_not_called()
+
     def test_get_network_adapter_collection_sh_not_found(self):
         """Tests NetworkAdapterCollection"""
 
@@ -119,9 +119,9 @@ class TestNetworkDeviceFunctionCollection(BaseFlaskTest):
         )
         self.assertEqual("application/json", response.mimetype)
 
-    @mock.patch.object(RedfishJsonValidator, "get_resource_by_id")
+    @mock.patch.object(RedfishJsonValidator, "get_port_map_resource")
     def test_get_network_device_function_collection_empty(self,
-                                                          get_resource_by_id):
+                                                          get_port_map_rsrc):
         """Tests NetworkDeviceFunctionCollection with empty list"""
 
         # Loading NetworkDeviceFunctionCollectionEmpty mockup result
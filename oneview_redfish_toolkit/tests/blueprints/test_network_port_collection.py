@@ -74,8 +74,8 @@ class TestNetworkPortCollection(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(network_port_collection_mockup, result)
 
-    @mock.patch.object(RedfishJsonValidator, "get_resource_by_id")
-    def test_get_network_port_collection_empty(self, get_resource_by_id):
+    @mock.patch.object(RedfishJsonValidator, "get_port_map_resource")
+    def test_get_network_port_collection_empty(self, get_port_map_resource):
         """Tests NetworkPortCollection empty server hardware"""
 
         # Loading NetworkPortCollectionEmpty mockup result
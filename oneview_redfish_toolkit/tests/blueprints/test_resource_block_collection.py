@@ -16,12 +16,15 @@
 
 # Python libs
 import json
+from unittest import mock
+from unittest.mock import call
 
 # 3rd party libs
 from flask_api import status
 
 # Module libs
 from oneview_redfish_toolkit.blueprints import resource_block_collection
+from oneview_redfish_toolkit import strategy_multiple_oneview
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -65,11 +68,10 @@ class TestResourceBlockCollection(BaseFlaskTest):
         ) as f:
             resource_block_collection_mockup = json.load(f)
 
-        self.oneview_client.server_hardware.get_all.return_value = \
-            server_hardware_list
-
-        self.oneview_client.server_profile_templates.get_all.return_value = \
-            server_profile_template_list
+        self.mock_get_all_fields({
+            "server_hardware": server_hardware_list,
+            "server_profile_templates": server_profile_template_list
+        })
 
         self.oneview_client.index_resources.get_all.return_value = \
             drives_list
@@ -88,12 +90,59 @@ class TestResourceBlockCollection(BaseFlaskTest):
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(resource_block_collection_mockup, result)
+        self.oneview_client.connection.get.assert_has_calls([
+            call(self.get_all_fields_uri("server_hardware", "uri,uuid")),
+            call(self.get_all_fields_uri("server_profile_templates",
+                                         "uri,uuid"))
+        ], any_order=True)
+        self.assertEqual(2, self.oneview_client.connection.get.call_count)
+        self.oneview_client.volumes.get_all.assert_not_called()
+        self.oneview_client.index_resources.get_all.assert_called_once_with(
+            category="drives", fields="uri", start=0, count=500)
+
+    @mock.patch.object(strategy_multiple_oneview.config,
+                       'get_collection_page_size')
+    def test_get_resource_block_collection_drive_pages(self,
+                                                       get_page_size_mock):
+        """Tests ResourceBlockCollection reading the drives page by page"""
+
+        with open(
+            'oneview_redfish_toolkit/mockups/oneview/Drives.json'
+        ) as f:
+            drives_list = json.load(f)
+
+        get_page_size_mock.return_value = 2
+        self.mock_get_all_fields({
+            "server_hardware": [],
+            "server_profile_templates": []
+        })
+        self.oneview_client.index_resources.get_all.side_effect = [
+            drives_list[0:2], drives_list[2:4], drives_list[4:]
+        ]
+
+        response = self.client.get(
+            "/redfish/v1/CompositionService/ResourceBlocks/")
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            [{"@odata.id": "/redfish/v1/CompositionService/ResourceBlocks/" +
+              drive["uri"].split("/")[-1]} for drive in drives_list],
+            result["Members"])
+        self.oneview_client.index_resources.get_all.assert_has_calls([
+            call(category="drives", fields="uri", start=0, count=2),
+            call(category="drives", fields="uri", start=2, count=2),
+            call(category="drives", fields="uri", start=4, count=2)
+        ])
 
     def test_get_resource_block_collection_empty(self):
         """Tests ResourceBlockCollection with an empty list"""
 
-        self.oneview_client.server_hardware.get_all.return_value = []
-        self.oneview_client.server_profile_templates.get_all.return_value = []
+        self.mock_get_all_fields({
+            "server_hardware": [],
+            "server_profile_templates": []
+        })
         self.oneview_client.index_resources.get_all.return_value = []
         self.oneview_client.volumes.get_all.return_value = []
 
@@ -28,6 +28,8 @@ from oneview_redfish_toolkit.blueprints import service_root
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import connection
+from oneview_redfish_toolkit import multiple_oneview
+from oneview_redfish_toolkit.services import service_root_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -42,6 +44,9 @@ class TestServiceRoot(BaseFlaskTest):
             service_root.service_root, url_prefix='/redfish/v1/')
 
     def setUp(self):
+        multiple_oneview.init_map_appliances()
+        service_root_service.init_map_service_root()
+
         with open(
             'oneview_redfish_toolkit/mockups/redfish/ServiceRoot.json'
         ) as f:
@@ -129,3 +134,38 @@ class TestServiceRoot(BaseFlaskTest):
         self.assertEqualMockup(self.service_root_mockup, result)
         get_credentials.assert_not_called()
         get_oneview_client.assert_not_called()
+
+    @mock.patch.object(config, 'get_authentication_mode')
+    @mock.patch.object(config, 'get_oneview_multiple_ips')
+    @mock.patch.object(connection, 'request_oneview')
+    def test_get_service_root_cached(self, request_oneview,
+                                     get_oneview_multiple_ips,
+                                     get_authentication_mode):
+        """Tests ServiceRoot is served from memory once built"""
+
+        get_authentication_mode.return_value = 'session'
+        request_oneview.return_value = \
+            {'uuid': '00000000-0000-0000-0000-000000000000'}
+        get_oneview_multiple_ips.return_value = ['10.0.0.1']
+
+        self.client.get("/redfish/v1/")
+        result = self.client.get("/redfish/v1/")
+
+        result = json.loads(result.data.decode("utf-8"))
+
+        self.assertEqualMockup(self.service_root_mockup, result)
+        request_oneview.assert_called_once_with(
+            '10.0.0.1', '/rest/appliance/nodeinfo/version')
+
+        # the UUID of the logged in appliance replaces the cached one
+        multiple_oneview.set_map_appliances_entry(
+            '10.0.0.1', '11111111-1111-1111-1111-111111111111')
+
+        result = self.client.get("/redfish/v1/")
+
+        result = json.loads(result.data.decode("utf-8"))
+
+        self.assertEqual('11111111-1111-1111-1111-111111111111',
+                         result['UUID'])
+        request_oneview.assert_called_once_with(
+            '10.0.0.1', '/rest/appliance/nodeinfo/version')
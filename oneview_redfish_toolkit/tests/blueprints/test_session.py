@@ -123,6 +123,42 @@ class TestSession(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(expected_session_collection, result)
 
+    def test_get_session_collection_paged(self, _, uuid_mock):
+        """Tests get Session Collection pages with $skip and $top"""
+
+        self._build_common_sessions(uuid_mock)
+        members = [{"@odata.id": "/redfish/v1/SessionService/Sessions/" +
+                    session_id} for session_id in self.session_ids]
+
+        response = self.client.get(
+            "/redfish/v1/SessionService/Sessions?$top=2",
+            content_type='application/json')
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(members[:2], result["Members"])
+        self.assertEqual(3, result["Members@odata.count"])
+        self.assertEqual("/redfish/v1/SessionService/Sessions?$skip=2",
+                         result["Members@odata.nextLink"])
+
+        response = self.client.get(
+            "/redfish/v1/SessionService/Sessions?$skip=2&$top=2",
+            content_type='application/json')
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(members[2:], result["Members"])
+        self.assertEqual(3, result["Members@odata.count"])
+        self.assertNotIn("Members@odata.nextLink", result)
+
+        response = self.client.get(
+            "/redfish/v1/SessionService/Sessions?$skip=-1",
+            content_type='application/json')
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
     def test_get_session(self, _, uuid_mock):
         """Tests get a specific Session"""
 
@@ -20,7 +20,6 @@ import json
 
 # 3rd party libs
 from unittest import mock
-from unittest.mock import call
 
 from flask_api import status
 from hpOneView.exceptions import HPOneViewException
@@ -64,6 +63,10 @@ class TestStorage(BaseFlaskTest):
         ) as f:
             self.logical_jbods = json.load(f)
 
+        self.logical_jbods_filter = \
+            "uri='{}' OR uri='{}'".format(self.logical_jbods[0]["uri"],
+                                          self.logical_jbods[1]["uri"])
+
         with open(
             'oneview_redfish_toolkit/mockups/redfish/Storage.json'
         ) as f:
@@ -123,7 +126,7 @@ class TestStorage(BaseFlaskTest):
         self.oneview_client.server_hardware_types.get_by_uri.return_value \
             = server_hardware_type_obj
         self.oneview_client.\
-            sas_logical_jbods.get.side_effect = self.logical_jbods
+            sas_logical_jbods.get_all.return_value = self.logical_jbods
 
         response = self.client.get(
             "/redfish/v1/Systems/"
@@ -141,12 +144,35 @@ class TestStorage(BaseFlaskTest):
             self.server_profile["uuid"])
         self.oneview_client.server_hardware_types.get_by_uri.assert_called_with(
             self.server_hardware_type["uri"])
-        self.oneview_client.sas_logical_jbods.get.assert_has_calls(
-            [
-                call(self.logical_jbods[0]["uri"]),
-                call(self.logical_jbods[1]["uri"])
-            ]
-        )
+        self.oneview_client.sas_logical_jbods.get_all.assert_called_once_with(
+            filter=self.logical_jbods_filter)
+        self.oneview_client.sas_logical_jbods.get.assert_not_called()
+
+    def test_get_storage_with_cached_server_hardware_type(self):
+        """Tests Storage reusing the cached Server Hardware Type"""
+
+        profile_obj = ServerProfiles(self.oneview_client, self.server_profile)
+        self.oneview_client.\
+            server_profiles.get_by_id.return_value = profile_obj
+        self.oneview_client.server_hardware_types.get_by_uri.return_value \
+            = ServerHardwareTypes(self.oneview_client,
+                                  self.server_hardware_type)
+        self.oneview_client.\
+            sas_logical_jbods.get_all.return_value = self.logical_jbods
+
+        for _ in range(2):
+            response = self.client.get(
+                "/redfish/v1/Systems/"
+                "b425802b-a6a5-4941-8885-aab68dfa2ee2/Storage/1"
+            )
+
+            result = json.loads(response.data.decode("utf-8"))
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertEqualMockup(self.storage_mockup, result)
+
+        self.oneview_client.server_hardware_types.get_by_uri\
+            .assert_called_once_with(self.server_hardware_type["uri"])
 
     def test_get_storage_when_profile_not_found(self):
         """Tests when server profile not found"""
@@ -216,7 +242,7 @@ class TestStorage(BaseFlaskTest):
         self.oneview_client.\
             server_profiles.get_by_id.return_value = profile_obj
         self.oneview_client.\
-            sas_logical_jbods.get.side_effect = self.logical_jbods
+            sas_logical_jbods.get_all.return_value = self.logical_jbods
 
         response = self.client.get(
             "/redfish/v1/Systems/"
@@ -230,12 +256,9 @@ class TestStorage(BaseFlaskTest):
         self.assertEqualMockup(self.drive_mockup, result)
         self.oneview_client.server_profiles.get_by_id.assert_called_with(
             self.server_profile["uuid"])
-        self.oneview_client.sas_logical_jbods.get.assert_has_calls(
-            [
-                call(self.logical_jbods[0]["uri"]),
-                call(self.logical_jbods[1]["uri"])
-            ]
-        )
+        self.oneview_client.sas_logical_jbods.get_all.assert_called_once_with(
+            filter=self.logical_jbods_filter)
+        self.oneview_client.sas_logical_jbods.get.assert_not_called()
 
     def test_get_drive_when_profile_not_found(self):
         """Tests when server profile not found"""
@@ -276,6 +299,7 @@ class TestStorage(BaseFlaskTest):
         profile_obj = ServerProfiles(self.oneview_client, self.server_profile)
         self.oneview_client.\
             server_profiles.get_by_id.return_value = profile_obj
+        self.oneview_client.sas_logical_jbods.get_all.return_value = []
         self.oneview_client.sas_logical_jbods.get.side_effect = \
             self.not_found_error
 
@@ -288,6 +312,8 @@ class TestStorage(BaseFlaskTest):
         self.assertEqual("application/json", response.mimetype)
         self.oneview_client.server_profiles.get_by_id.assert_called_with(
             self.server_profile["uuid"])
+        self.oneview_client.sas_logical_jbods.get_all.assert_called_once_with(
+            filter=self.logical_jbods_filter)
         self.oneview_client.sas_logical_jbods.get.assert_called_with(
             self.logical_jbods[0]["uri"]
         )
@@ -298,7 +324,7 @@ class TestStorage(BaseFlaskTest):
         self.oneview_client.\
             server_profiles.get_by_id.return_value = profile_obj
         self.oneview_client.\
-            sas_logical_jbods.get.side_effect = self.logical_jbods
+            sas_logical_jbods.get_all.return_value = self.logical_jbods
 
         # we have the 4 drives, so id '5' is invalid
         response = self.client.get(
@@ -311,12 +337,9 @@ class TestStorage(BaseFlaskTest):
         self.assertIn("Drive 5 not found", str(response.data))
         self.oneview_client.server_profiles.get_by_id.assert_called_with(
             self.server_profile["uuid"])
-        self.oneview_client.sas_logical_jbods.get.assert_has_calls(
-            [
-                call(self.logical_jbods[0]["uri"]),
-                call(self.logical_jbods[1]["uri"])
-            ]
-        )
+        self.oneview_client.sas_logical_jbods.get_all.assert_called_once_with(
+            filter=self.logical_jbods_filter)
+        self.oneview_client.sas_logical_jbods.get.assert_not_called()
 
     def test_get_drive_when_drive_id_is_invalid(self):
         """Tests when drive id is not a number"""
@@ -324,7 +347,7 @@ class TestStorage(BaseFlaskTest):
         self.oneview_client.\
             server_profiles.get.return_value = profile_obj
         self.oneview_client.\
-            sas_logical_jbods.get.side_effect = self.logical_jbods
+            sas_logical_jbods.get_all.return_value = self.logical_jbods
 
         response = self.client.get(
             "/redfish/v1/Systems/"
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import json
+from unittest import mock
+
+# 3rd party libs
+from flask_api import status
+
+# Module libs
+from oneview_redfish_toolkit.blueprints import task_service
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit.services import task_tracker_service
+from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
+
+
+class TestTaskService(BaseFlaskTest):
+    """Tests for TaskService blueprint"""
+
+    @classmethod
+    def setUpClass(self):
+        super(TestTaskService, self).setUpClass()
+
+        self.app.register_blueprint(task_service.task_service)
+
+    def test_get_task_service(self):
+        """Tests get TaskService"""
+
+        response = self.client.get("/redfish/v1/TaskService")
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        with open(
+            'oneview_redfish_toolkit/mockups/redfish/TaskService.json'
+        ) as f:
+            task_service_mockup = json.loads(f.read())
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+        self.assertEqualMockup(task_service_mockup, result)
+
+    def test_get_task_collection(self):
+        """Tests get TaskCollection with the Tasks in memory"""
+        first_task = task_tracker_service.create_task("First task")
+        second_task = task_tracker_service.create_task("Second task")
+
+        response = self.client.get("/redfish/v1/TaskService/Tasks")
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(2, result["Members@odata.count"])
+        self.assertEqual(
+            [{"@odata.id": "/redfish/v1/TaskService/Tasks/" +
+              first_task.task_id},
+             {"@odata.id": "/redfish/v1/TaskService/Tasks/" +
+              second_task.task_id}],
+            result["Members"])
+
+    def test_get_tasks_by_session(self):
+        """Tests a session only gets its own Tasks"""
+        tasks_by_token = dict()
+        for token in ["abc", "def"]:
+            client_session._set_new_client_by_token(token, {})
+
+            with self.app.test_request_context(
+                    headers={"X-Auth-Token": token}):
+                tasks_by_token[token] = \
+                    task_tracker_service.create_task("Task of " + token)
+
+        response = self.client.get("/redfish/v1/TaskService/Tasks",
+                                   headers={"X-Auth-Token": "abc"})
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(
+            [{"@odata.id": "/redfish/v1/TaskService/Tasks/" +
+              tasks_by_token["abc"].task_id}],
+            result["Members"])
+
+        task_uri = "/redfish/v1/TaskService/Tasks/" + \
+            tasks_by_token["def"].task_id
+
+        response = self.client.get(task_uri, headers={"X-Auth-Token": "abc"})
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+        response = self.client.get(task_uri, headers={"X-Auth-Token": "def"})
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_get_task_not_found(self):
+        """Tests get a Task that does not exist"""
+
+        response = self.client.get("/redfish/v1/TaskService/Tasks/invalid")
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        self.assertEqual("application/json", response.mimetype)
+
+    @mock.patch.object(task_tracker_service, '_start_task_tracker')
+    def test_get_task_updated_from_oneview_task(self, start_task_tracker):
+        """Tests get a Task after its OneView task has failed"""
+        task_uri = "/rest/tasks/7A7E8A2B-D2DE-4B12-8F2A-C3C1A3D5F2E1"
+        task = task_tracker_service.create_task("Reset On of 0000A66101")
+        task_tracker_service.track_oneview_task(
+            task, self.oneview_client,
+            {"uri": task_uri, "taskState": "Running"})
+
+        response = self.client.get(
+            "/redfish/v1/TaskService/Tasks/" + task.task_id)
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("Running", result["TaskState"])
+        self.assertEqual([], result["Messages"])
+        self.assertNotIn("EndTime", result)
+        start_task_tracker.assert_called_once_with()
+
+        self.oneview_client.tasks.get_by_uri.return_value.data = {
+            "uri": task_uri,
+            "taskState": "Error",
+            "taskErrors": [{"message": "Power operation failed"}]
+        }
+        task_tracker_service.refresh_oneview_tasks()
+
+        response = self.client.get(
+            "/redfish/v1/TaskService/Tasks/" + task.task_id)
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("Exception", result["TaskState"])
+        self.assertEqual("Critical", result["TaskStatus"])
+        self.assertIn("EndTime", result)
+        self.assertEqual(
+            [{"MessageId": "Base.1.1.GeneralError",
+              "Message": "Power operation failed",
+              "Severity": "Critical"}],
+            result["Messages"])
+        self.oneview_client.tasks.get_by_uri.assert_called_once_with(task_uri)
+
+    @mock.patch.object(task_tracker_service, '_start_task_tracker')
+    def test_get_task_when_oneview_task_query_fails(self,
+                                                    start_task_tracker):
+        """Tests get a Task while its OneView task cannot be queried"""
+        task_uri = "/rest/tasks/7A7E8A2B-D2DE-4B12-8F2A-C3C1A3D5F2E1"
+        task = task_tracker_service.create_task("Reset On of 0000A66101")
+        task_tracker_service.track_oneview_task(
+            task, self.oneview_client,
+            {"uri": task_uri, "taskState": "Running"})
+        self.oneview_client.tasks.get_by_uri.side_effect = \
+            ConnectionResetError("Connection reset by peer")
+
+        for _ in range(
+                task_tracker_service.MAX_CONSECUTIVE_QUERY_ERRORS - 1):
+            task_tracker_service.refresh_oneview_tasks()
+
+        response = self.client.get(
+            "/redfish/v1/TaskService/Tasks/" + task.task_id)
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual("Running", result["TaskState"])
+
+        task_tracker_service.refresh_oneview_tasks()
+
+        response = self.client.get(
+            "/redfish/v1/TaskService/Tasks/" + task.task_id)
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual("Exception", result["TaskState"])
+        self.assertEqual(
+            "Could not get the state of the OneView task",
+            result["Messages"][0]["Message"])
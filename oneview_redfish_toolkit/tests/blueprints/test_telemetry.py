@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Python libs
+import json
+from unittest import mock
+
+# 3rd party libs
+from flask import request
+from flask_api import status
+
+# Module libs
+from oneview_redfish_toolkit.blueprints import telemetry
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services import telemetry_service
+from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
+
+
+class TestTelemetry(BaseFlaskTest):
+    """Tests for Telemetry blueprint"""
+
+    @classmethod
+    def setUpClass(self):
+        super(TestTelemetry, self).setUpClass()
+
+        self.app.register_blueprint(telemetry.telemetry)
+
+    @staticmethod
+    def _build_utilization(timestamp, temperature, power, cpu=None):
+        metrics = [("AmbientTemperature", temperature),
+                   ("AveragePower", power)]
+        if cpu is not None:
+            metrics.append(("CpuUtilization", cpu))
+
+        return {
+            "metricList": [
+                {
+                    "metricName": name,
+                    "metricSamples": [[timestamp, value]],
+                    "metricCapacity": 100
+                }
+                for name, value in metrics
+            ]
+        }
+
+    @mock.patch.object(telemetry_service, 'config')
+    def test_get_telemetry_service_when_sampling_is_disabled(
+            self, config_mock):
+        """Tests get TelemetryService without telemetry sampling"""
+        config_mock.get_telemetry_sampling_interval.return_value = 0
+
+        response = self.client.get("/redfish/v1/TelemetryService")
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertFalse(result["ServiceEnabled"])
+
+        response = self.client.get(
+            "/redfish/v1/TelemetryService/MetricReports")
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual([], result["Members"])
+
+        response = self.client.get(
+            "/redfish/v1/TelemetryService/MetricReports/AveragePower")
+
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    @mock.patch.object(telemetry_service, '_start_telemetry_sampler')
+    @mock.patch.object(telemetry_service, 'config')
+    def test_get_metric_report(self, config_mock, start_sampler):
+        """Tests get a MetricReport with the samples of all Chassis"""
+        config_mock.get_telemetry_sampling_interval.return_value = 60
+        sampler_client = self.oneview_client
+        self.mock_get_all_fields({
+            "server_hardware": [{"uuid": "sh-1"}],
+            "enclosures": [{"uuid": "encl-1"}]
+        })
+
+        response = self.client.get(
+            "/redfish/v1/TelemetryService/MetricReports/AveragePower")
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual([], result["MetricValues"])
+        sampler_client.connection.get.assert_has_calls([
+            mock.call(self.get_all_fields_uri("server_hardware", "uuid")),
+            mock.call(self.get_all_fields_uri("enclosures", "uuid"))
+        ])
+        start_sampler.assert_called_once_with()
+
+        sampler_client.connection.get.reset_mock()
+        sampler_client.connection.get.side_effect = [
+            self._build_utilization(1505772000000, 20, 150, 10),
+            self._build_utilization(1505772000000, 19, 2000),
+            self._build_utilization(1505772300000, 21, 180.5, 15),
+            self._build_utilization(1505772000000, 19, 2000)
+        ]
+        telemetry_service.sample_chassis()
+        telemetry_service.sample_chassis()
+
+        response = self.client.get(
+            "/redfish/v1/TelemetryService/MetricReports/AveragePower")
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("AveragePower", result["Id"])
+        self.assertEqual([
+            {
+                "MetricId": "AveragePower",
+                "MetricValue": "150",
+                "Timestamp": "2017-09-18T22:00:00+00:00",
+                "MetricProperty": "/redfish/v1/Chassis/sh-1"
+            },
+            {
+                "MetricId": "AveragePower",
+                "MetricValue": "180.5",
+                "Timestamp": "2017-09-18T22:05:00+00:00",
+                "MetricProperty": "/redfish/v1/Chassis/sh-1"
+            },
+            {
+                "MetricId": "AveragePower",
+                "MetricValue": "2000",
+                "Timestamp": "2017-09-18T22:00:00+00:00",
+                "MetricProperty": "/redfish/v1/Chassis/encl-1"
+            }
+        ], result["MetricValues"])
+        sampler_client.connection.get.assert_has_calls([
+            mock.call("/rest/server-hardware/sh-1/utilization"
+                      "?fields=AmbientTemperature,AveragePower,"
+                      "CpuUtilization"),
+            mock.call("/rest/enclosures/encl-1/utilization"
+                      "?fields=AmbientTemperature,AveragePower")
+        ])
+        # the Chassis are listed at most once per sampling interval
+        self.assertEqual(4, sampler_client.connection.get.call_count)
+
+    @mock.patch.object(telemetry_service, '_start_telemetry_sampler')
+    @mock.patch.object(telemetry_service, 'config')
+    def test_get_metric_report_by_session(self, config_mock, _):
+        """Tests a MetricReport only has the Chassis the session sees"""
+        config_mock.get_telemetry_sampling_interval.return_value = 60
+        ov_client_by_token = {
+            "abc": self.oneview_client,
+            "def": mock.MagicMock()
+        }
+        self.mock_get_all_fields({
+            "server_hardware": [{"uuid": "sh-1"}],
+            "enclosures": []
+        }, ov_client_by_token["abc"])
+        self.mock_get_all_fields({
+            "server_hardware": [{"uuid": "sh-2"}],
+            "enclosures": []
+        }, ov_client_by_token["def"])
+
+        def get_oneview_client_by_token(ov_ip, token=None):
+            return ov_client_by_token[
+                token or request.headers.get("x-auth-token")]
+
+        with mock.patch.object(client_session, '_get_oneview_client_by_token',
+                               side_effect=get_oneview_client_by_token):
+            for token, ov_client in ov_client_by_token.items():
+                client_session._set_new_client_by_token(token, {
+                    ip: ov_client for ip in config.get_oneview_multiple_ips()
+                })
+                response = self.client.get(
+                    "/redfish/v1/TelemetryService/MetricReports/AveragePower",
+                    headers={"X-Auth-Token": token})
+
+                self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+            for timestamp, ov_client in zip([1505772000000, 1505772300000],
+                                            ov_client_by_token.values()):
+                ov_client.connection.get.side_effect = None
+                ov_client.connection.get.return_value = \
+                    self._build_utilization(timestamp, 20, 150)
+            telemetry_service.sample_chassis()
+
+            for token, uuid in [("abc", "sh-1"), ("def", "sh-2")]:
+                response = self.client.get(
+                    "/redfish/v1/TelemetryService/MetricReports/AveragePower",
+                    headers={"X-Auth-Token": token})
+                result = json.loads(response.data.decode("utf-8"))
+
+                self.assertEqual(status.HTTP_200_OK, response.status_code)
+                self.assertEqual(["/redfish/v1/Chassis/" + uuid],
+                                 [value["MetricProperty"]
+                                  for value in result["MetricValues"]])
+
+    def test_metric_ring_buffer_keeps_the_newest_samples(self):
+        """Tests the MetricRingBuffer overwrites the oldest samples"""
+        metric_buffer = telemetry_service.MetricRingBuffer(3)
+
+        for timestamp in range(1, 6):
+            metric_buffer.append(timestamp, timestamp * 10)
+        metric_buffer.append(5, 60)
+
+        self.assertEqual([(3, 30), (4, 40), (5, 50)],
+                         metric_buffer.get_samples())
@@ -28,6 +28,9 @@ from hpOneView.resources.servers.server_hardware import ServerHardware
 # Module libs
 from oneview_redfish_toolkit.blueprints import thermal
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services import telemetry_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -151,6 +154,110 @@ class TestChassis(BaseFlaskTest):
         # below assert is commented as in the upgraded version
         # self.assertTrue(category_resource.get_category_by_resource_id(uuid))
 
+    @mock.patch.object(telemetry_service, '_start_telemetry_sampler')
+    @mock.patch.object(telemetry_service, 'config')
+    @mock.patch.object(ServerHardware, 'get_utilization')
+    def test_get_blade_thermal_sampled(self, server_utilization, config_mock,
+                                       start_sampler):
+        """"Tests BladeThermal served from the telemetry samples"""
+
+        with open(
+                'oneview_redfish_toolkit/mockups/oneview/'
+                'ServerHardwareUtilization.json'
+        ) as f:
+            server_hardware_utilization = json.load(f)
+
+        config_mock.get_telemetry_sampling_interval.return_value = 60
+        self.oneview_client.index_resources.get_all.return_value = \
+            [{"category": "server-hardware"}]
+        serverhw_obj = ServerHardware(self.oneview_client, {
+            "uri": "/rest/server-hardware/36343537-3338-4448-3538-4E5030333434"
+        })
+        self.oneview_client.server_hardware.get_by_id.return_value = serverhw_obj
+        server_utilization.return_value = server_hardware_utilization
+        uri = "/redfish/v1/Chassis/36343537-3338-4448-3538-4E5030333434/"\
+              "Thermal"
+
+        self.client.get(uri)
+        response = self.client.get(uri)
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(20, result["Temperatures"][0]["ReadingCelsius"])
+        self.assertEqual(
+            {"Hpe": {"ReadingTime": "2017-09-18T22:00:00+00:00"}},
+            result["Temperatures"][0]["Oem"])
+        server_utilization.assert_called_once_with(
+            fields='AmbientTemperature')
+        start_sampler.assert_called_once_with()
+
+        # the Chassis is sampled by URI in background
+        self.oneview_client.connection.get.return_value = dict(
+            server_hardware_utilization, metricList=[{
+                "metricName": "AmbientTemperature",
+                "metricSamples": [[1505772300000, 22]],
+                "metricCapacity": 35
+            }])
+        telemetry_service.sample_chassis()
+
+        response = self.client.get(uri)
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(22, result["Temperatures"][0]["ReadingCelsius"])
+        server_utilization.assert_called_once_with(
+            fields='AmbientTemperature')
+        self.oneview_client.connection.get.assert_called_once_with(
+            "/rest/server-hardware/36343537-3338-4448-3538-4E5030333434/"
+            "utilization?fields=AmbientTemperature,AveragePower,"
+            "CpuUtilization")
+
+    @mock.patch.object(telemetry_service, '_start_telemetry_sampler')
+    @mock.patch.object(telemetry_service, 'config')
+    @mock.patch.object(ServerHardware, 'get_utilization')
+    def test_get_blade_thermal_sampled_by_session(self, server_utilization,
+                                                  config_mock, _):
+        """"Tests a session is not served the samples of other sessions"""
+
+        with open(
+                'oneview_redfish_toolkit/mockups/oneview/'
+                'ServerHardwareUtilization.json'
+        ) as f:
+            server_hardware_utilization = json.load(f)
+
+        config_mock.get_telemetry_sampling_interval.return_value = 60
+        self.oneview_client.index_resources.get_all.return_value = \
+            [{"category": "server-hardware"}]
+        serverhw_obj = ServerHardware(self.oneview_client, {
+            "uri": "/rest/server-hardware/36343537-3338-4448-3538-4E5030333434"
+        })
+        self.oneview_client.server_hardware.get_by_id.return_value = \
+            serverhw_obj
+        server_utilization.return_value = server_hardware_utilization
+        client_ov_by_ip = {ip: self.oneview_client
+                           for ip in config.get_oneview_multiple_ips()}
+        client_session._set_new_client_by_token("abc", client_ov_by_ip)
+        client_session._set_new_client_by_token("def", client_ov_by_ip)
+        uri = "/redfish/v1/Chassis/36343537-3338-4448-3538-4E5030333434/"\
+              "Thermal"
+
+        for token in ["abc", "abc", "def"]:
+            response = self.client.get(uri, headers={"X-Auth-Token": token})
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        # the Chassis may be out of the scopes of the second session, so
+        # it is read again from OneView with the client of that session
+        self.assertEqual(2, server_utilization.call_count)
+        self.assertEqual(2, len(telemetry_service.map_sampled_chassis))
+
+        # the samples of a closed session are dropped
+        client_session.clear_session_by_token("abc")
+        telemetry_service.sample_chassis()
+
+        self.assertEqual(1, len(telemetry_service.map_sampled_chassis))
+
     @mock.patch.object(ServerHardware, 'get_utilization')
     def test_get_blade_not_found(self, server_utilization):
         self.oneview_client.index_resources.get_all.return_value = \
@@ -15,6 +15,7 @@
 # under the License.
 import copy
 import json
+from unittest import mock
 from unittest.mock import call
 
 from flask_api import status
@@ -24,6 +25,9 @@ from hpOneView.resources.servers.enclosures import Enclosures
 from hpOneView.resources.servers.server_profile_templates import ServerProfileTemplate
 
 from oneview_redfish_toolkit.blueprints import zone
+from oneview_redfish_toolkit import client_session
+from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit.services import zone_service
 from oneview_redfish_toolkit.tests.base_flask_test import BaseFlaskTest
 
 
@@ -131,6 +135,98 @@ class TestZone(BaseFlaskTest):
                 + self.server_profile_template["serverHardwareTypeUri"] + "'"
             ])
 
+    def test_get_zone_from_zone_index(self):
+        """Tests get a Zone updated incrementally in the zone index"""
+
+        self.test_get_zone_when_uuid_is_template_id_with_enclosure_id()
+
+        removed_server_hardware = self.server_hardware_list[0]
+        zone_service.update_zone_index_server_hardware(
+            "Deleted", removed_server_hardware)
+
+        response = self.client.get(
+            "/redfish/v1/CompositionService/ResourceZones/" +
+            self.spt_id + "-" + self.enclosure["uuid"])
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertNotIn(
+            {"@odata.id": "/redfish/v1/CompositionService/ResourceBlocks/" +
+                          removed_server_hardware["uuid"]},
+            result["Links"]["ResourceBlocks"])
+        self.assertEqual(2, self.oneview_client.connection.get.call_count)
+        self.oneview_client.server_hardware.get_all.assert_called_once()
+
+        added_server_hardware = dict(
+            removed_server_hardware,
+            locationUri=self.enclosure["uri"],
+            serverHardwareTypeUri=self.server_profile_template[
+                "serverHardwareTypeUri"])
+        zone_service.update_zone_index_server_hardware(
+            "Created", added_server_hardware)
+
+        response = self.client.get(
+            "/redfish/v1/CompositionService/ResourceZones/" +
+            self.spt_id + "-" + self.enclosure["uuid"])
+
+        result = json.loads(response.data.decode("utf-8"))
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertIn(
+            {"@odata.id": "/redfish/v1/CompositionService/ResourceBlocks/" +
+                          removed_server_hardware["uuid"]},
+            result["Links"]["ResourceBlocks"])
+
+    def test_get_zone_index_by_session(self):
+        """Tests each Redfish session has its own zone index"""
+
+        api_client = self.oneview_client
+
+        enclosure_obj = Enclosures(self.oneview_client, self.enclosure)
+        api_client.enclosures.get_by_id.return_value = enclosure_obj
+
+        spt_obj = ServerProfileTemplate(
+            self.oneview_client, self.server_profile_template)
+        api_client.server_profile_templates.get_by_id.return_value = \
+            spt_obj
+
+        api_client.server_hardware.get_all.return_value = \
+            self.server_hardware_list
+        api_client.connection.get.side_effect = [
+            self.drive_encl_assoc,
+            self.drives
+        ] * 3
+        api_client.volumes.get_all.return_value = []
+
+        client_ov_by_ip = {ip: api_client
+                           for ip in config.get_oneview_multiple_ips()}
+        client_session._set_new_client_by_token("abc", client_ov_by_ip)
+        client_session._set_new_client_by_token("def", client_ov_by_ip)
+
+        for token in ["abc", "abc", "def"]:
+            response = self.client.get(
+                "/redfish/v1/CompositionService/ResourceZones/" +
+                self.spt_id + "-" + self.enclosure["uuid"],
+                headers={"X-Auth-Token": token})
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        self.assertEqual(2, api_client.server_hardware.get_all.call_count)
+        self.assertEqual(4, api_client.connection.get.call_count)
+
+        # the zone index of a closed session is dropped
+        client_session.clear_session_by_token("abc")
+        client_session._set_new_client_by_token("ghi", client_ov_by_ip)
+
+        response = self.client.get(
+            "/redfish/v1/CompositionService/ResourceZones/" +
+            self.spt_id + "-" + self.enclosure["uuid"],
+            headers={"X-Auth-Token": "ghi"})
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(2, len(zone_service.map_zone_indexes))
+
     def test_get_zone_when_uuid_is_only_template_id(self):
         """Tests get a Zone when the zone uuid is only template id"""
 
@@ -302,3 +398,44 @@ class TestZone(BaseFlaskTest):
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual("application/json", response.mimetype)
         self.assertEqualMockup(zone_with_external_storage_mockup, result)
+        api_client.volumes.get_all.assert_not_called()
+
+    @mock.patch.object(zone_service.config, 'external_storage_enabled')
+    def test_get_zone_when_external_storage_enabled(self,
+                                                    external_storage_enabled):
+        """Tests get a Zone listing the shareable volumes"""
+
+        external_storage_enabled.return_value = True
+        api_client = self.oneview_client
+
+        enclosure_obj = Enclosures(self.oneview_client, self.enclosure)
+        api_client.enclosures.get_by_id.return_value = enclosure_obj
+
+        spt_obj = ServerProfileTemplate(
+            self.oneview_client, self.server_profile_template)
+        api_client.server_profile_templates.get_by_id.return_value = \
+            spt_obj
+
+        api_client.server_hardware.get_all.return_value = \
+            self.server_hardware_list
+        api_client.connection.get.side_effect = [
+            self.drive_encl_assoc,
+            self.drives
+        ]
+        api_client.volumes.get_all.return_value = self.volumes
+
+        for _ in range(2):
+            response = self.client.get(
+                "/redfish/v1/CompositionService/ResourceZones/" + self.spt_id
+                + "-" + self.enclosure["uuid"])
+
+            result = json.loads(response.data.decode("utf-8"))
+
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+            self.assertIn(
+                {"@odata.id": "/redfish/v1/CompositionService/ResourceBlocks/"
+                              "B526F59E-9BC7-467F-9205-A9F4015CE296"},
+                result["Links"]["ResourceBlocks"])
+
+        api_client.volumes.get_all.assert_called_once_with(
+            filter="isShareable=true")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+import unittest
+from unittest import mock
+
+from flask import _app_ctx_stack
+from flask import _request_ctx_stack
+from flask import Flask
+from flask import g
+from flask import request
+
+from oneview_redfish_toolkit import async_oneview
+
+
+class TestAsyncOneView(unittest.TestCase):
+    """Tests for async_oneview.py"""
+
+    def setUp(self):
+        async_oneview.init_event_loop(max_workers=4)
+
+    def tearDown(self):
+        async_oneview.map_event_loop = None
+
+    def test_run_concurrently(self):
+        # Every query waits for the others, so it only finishes when all
+        # of them are running at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def query(value):
+            barrier.wait()
+            return value
+
+        result = async_oneview.run_concurrently(
+            [lambda: query(1), lambda: query(2), lambda: query(3)])
+
+        self.assertEqual([1, 2, 3], result)
+
+    def test_run_concurrently_returns_exceptions(self):
+        error = Exception("An error has occurred")
+
+        def query_with_error():
+            raise error
+
+        result = async_oneview.run_concurrently(
+            [lambda: "resource", query_with_error])
+
+        self.assertEqual(["resource", error], result)
+
+    def test_run_concurrently_in_flask_context(self):
+        app = Flask(__name__)
+
+        def query():
+            return g.value, request.headers.get('x-auth-token')
+
+        with app.test_request_context(headers={'x-auth-token': 'token'}):
+            g.value = 'value'
+
+            result = async_oneview.run_concurrently([query, query])
+
+        self.assertEqual([('value', 'token'), ('value', 'token')], result)
+
+    def test_run_concurrently_with_a_context_copy_per_query(self):
+        app = Flask(__name__)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def query():
+            barrier.wait()
+            g.elapsed_time_ov += 1
+            return id(_app_ctx_stack.top), id(_request_ctx_stack.top)
+
+        with app.test_request_context(headers={'x-auth-token': 'token'}):
+            g.elapsed_time_ov = 0
+            app_context = _app_ctx_stack.top
+            request_context = _request_ctx_stack.top
+
+            result = async_oneview.run_concurrently([query, query])
+
+            # the caller contexts are neither pushed nor popped by the
+            # queries, which share g with the caller
+            self.assertIs(app_context, _app_ctx_stack.top)
+            self.assertIs(request_context, _request_ctx_stack.top)
+            self.assertEqual(1, app_context._refcnt)
+            self.assertEqual('token', request.headers.get('x-auth-token'))
+            self.assertEqual(2, g.elapsed_time_ov)
+
+        self.assertNotEqual(result[0], result[1])
+        self.assertNotIn(id(app_context), [ids[0] for ids in result])
+        self.assertNotIn(id(request_context), [ids[1] for ids in result])
+
+    def test_nested_queries_run_sequentially(self):
+        def nested_query():
+            return async_oneview.run_concurrently(
+                [threading.get_ident, threading.get_ident])
+
+        result = async_oneview.run_concurrently([nested_query, nested_query])
+
+        for thread_ids in result:
+            self.assertEqual(thread_ids[0], thread_ids[1])
+            self.assertNotEqual(threading.get_ident(), thread_ids[0])
+
+    def test_run_sequentially_when_event_loop_is_not_enabled(self):
+        async_oneview.map_event_loop = None
+
+        result = async_oneview.run_concurrently(
+            [threading.get_ident, threading.get_ident])
+
+        self.assertEqual([threading.get_ident()] * 2, result)
+
+    def test_fetch_concurrently_raises_first_error(self):
+        first_error = Exception("First error")
+        second_error = Exception("Second error")
+
+        def query_with_error(error):
+            raise error
+
+        with self.assertRaises(Exception) as context:
+            async_oneview.fetch_concurrently(
+                [lambda: "resource",
+                 lambda: query_with_error(first_error),
+                 lambda: query_with_error(second_error)])
+
+        self.assertIs(first_error, context.exception)
+
+    def test_fetch_sequentially_stops_on_error(self):
+        async_oneview.map_event_loop = None
+        query_after_error = mock.Mock()
+
+        def query_with_error():
+            raise Exception("An error has occurred")
+
+        with self.assertRaises(Exception):
+            async_oneview.fetch_concurrently(
+                [query_with_error, query_after_error])
+
+        query_after_error.assert_not_called()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (2018) Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+    Tests for circuit_breaker.py
+"""
+
+import configparser
+import unittest
+from unittest import mock
+
+from hpOneView.exceptions import HPOneViewException
+
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
+from oneview_redfish_toolkit import circuit_breaker
+from oneview_redfish_toolkit import config
+
+
+@mock.patch.object(circuit_breaker, 'time')
+@mock.patch.object(config, 'get_config')
+class TestCircuitBreaker(unittest.TestCase):
+    """Test class for circuit_breaker"""
+
+    def setUp(self):
+        circuit_breaker.init_map_circuit_breakers()
+
+        self.config_obj = configparser.ConfigParser()
+        self.config_obj.add_section('redfish')
+
+    def _open_circuit(self, ov_ip):
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            with self.assertRaises(ConnectionRefusedError):
+                circuit_breaker.call(ov_ip, mock.Mock(
+                    side_effect=ConnectionRefusedError()))
+
+    def test_opens_at_error_rate(self, get_config, time_mock):
+        get_config.return_value = self.config_obj
+        time_mock.time.return_value = 1000
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            circuit_breaker.call("10.0.0.1", mock.Mock(return_value=[]))
+
+        # OneView errors are answered by an available appliance
+        with self.assertRaises(HPOneViewException):
+            circuit_breaker.call("10.0.0.1", mock.Mock(
+                side_effect=HPOneViewException({
+                    "errorCode": "RESOURCE_NOT_FOUND",
+                    "message": "error"})))
+
+        self.assertEqual(circuit_breaker.CLOSED,
+                         circuit_breaker.get_state("10.0.0.1"))
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN + 1):
+            with self.assertRaises(ConnectionRefusedError):
+                circuit_breaker.call("10.0.0.1", mock.Mock(
+                    side_effect=ConnectionRefusedError()))
+
+        self.assertEqual(circuit_breaker.OPEN,
+                         circuit_breaker.get_state("10.0.0.1"))
+        self.assertFalse(circuit_breaker.allow_request("10.0.0.1"))
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.2"))
+
+    def test_opens_with_connection_errors_from_hponeview(self, get_config,
+                                                         time_mock):
+        get_config.return_value = self.config_obj
+        time_mock.time.return_value = 1000
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            with self.assertRaises(HPOneViewException):
+                circuit_breaker.call("10.0.0.1", mock.Mock(
+                    side_effect=HPOneViewException("Connection reset")))
+
+        self.assertEqual(circuit_breaker.OPEN,
+                         circuit_breaker.get_state("10.0.0.1"))
+
+    def test_opens_with_slow_calls(self, get_config, time_mock):
+        get_config.return_value = self.config_obj
+        # each call starts at 1000 and ends at 1015
+        time_mock.time.side_effect = [1000, 1000, 1015, 1015] * \
+            circuit_breaker.MIN_CALLS_TO_OPEN
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            self.assertEqual([], circuit_breaker.call(
+                "10.0.0.1", mock.Mock(return_value=[])))
+
+        self.assertEqual(circuit_breaker.OPEN,
+                         circuit_breaker.get_state("10.0.0.1"))
+
+    def test_probe_after_cooldown(self, get_config, time_mock):
+        get_config.return_value = self.config_obj
+        time_mock.time.return_value = 1000
+        self._open_circuit("10.0.0.1")
+
+        time_mock.time.return_value = 1029
+        self.assertFalse(circuit_breaker.allow_request("10.0.0.1"))
+
+        # a single request probes the appliance after the cooldown, the
+        # probe is taken only when the query runs
+        time_mock.time.return_value = 1030
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.1"))
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.1"))
+
+        def probe():
+            self.assertEqual(circuit_breaker.HALF_OPEN,
+                             circuit_breaker.get_state("10.0.0.1"))
+            self.assertFalse(circuit_breaker.allow_request("10.0.0.1"))
+            with self.assertRaises(OneViewRedfishUnavailableException):
+                circuit_breaker.call("10.0.0.1", mock.Mock())
+            raise ConnectionRefusedError()
+
+        with self.assertRaises(ConnectionRefusedError):
+            circuit_breaker.call("10.0.0.1", probe)
+
+        self.assertEqual(circuit_breaker.OPEN,
+                         circuit_breaker.get_state("10.0.0.1"))
+
+        time_mock.time.return_value = 1060
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.1"))
+        circuit_breaker.call("10.0.0.1", mock.Mock(return_value=[]))
+
+        self.assertEqual(circuit_breaker.CLOSED,
+                         circuit_breaker.get_state("10.0.0.1"))
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.1"))
+
+    def test_disabled(self, get_config, time_mock):
+        self.config_obj.set('redfish', 'circuit_breaker_error_rate', '0')
+        get_config.return_value = self.config_obj
+        time_mock.time.return_value = 1000
+
+        self._open_circuit("10.0.0.1")
+
+        self.assertEqual(circuit_breaker.CLOSED,
+                         circuit_breaker.get_state("10.0.0.1"))
+        self.assertTrue(circuit_breaker.allow_request("10.0.0.1"))
@@ -19,10 +19,15 @@
 """
 import collections
 from collections import OrderedDict
+import threading
 import unittest
 from unittest import mock
 from unittest.mock import call
 
+from hpOneView.exceptions import HPOneViewException
+
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import connection
@@ -34,14 +39,23 @@ class TestAuthentication(unittest.TestCase):
 
     def setUp(self):
         client_session.init_map_clients()
+        client_session.init_map_pooled_clients()
         multiple_oneview.init_map_appliances()
 
+        for option, value in (('get_session_pool_idle_timeout', 300),
+                              ('get_session_idle_timeout', 86400)):
+            patcher = mock.patch.object(config, option, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     @mock.patch.object(client_session, 'uuid')
     @mock.patch('oneview_redfish_toolkit.connection.OneViewClient')
+    @mock.patch.object(config, 'get_oneview_login_timeout')
     @mock.patch.object(config, 'get_oneview_multiple_ips')
     @mock.patch.object(config, 'get_authentication_mode')
     def test_map_token_redfish_for_multiple_ov(self, get_authentication_mode,
                                                get_oneview_multiple_ips,
+                                               get_oneview_login_timeout,
                                                oneview_client_mockup,
                                                uuid_mock):
         get_authentication_mode.return_value = 'session'
@@ -63,14 +77,16 @@ class TestAuthentication(unittest.TestCase):
 
         uuid_mock.uuid4.return_value = session_id
 
-        iter_conns_ov = iter(connection_list)
+        conns_ov_by_ip = dict(zip(list_ips, connection_list))
 
         client_session.init_map_clients()
 
         get_oneview_multiple_ips.return_value = list_ips
+        get_oneview_login_timeout.return_value = 30
 
+        # the OneViews are logged in concurrently, in any order
         def function_returning_token(ov_config):
-            return next(iter_conns_ov)
+            return conns_ov_by_ip[ov_config['ip']]
 
         oneview_client_mockup.side_effect = function_returning_token
         conn_1.connection.get_session_id.return_value = mocked_rf_token
@@ -96,11 +112,13 @@ class TestAuthentication(unittest.TestCase):
             self.assertEqual(connections_ov[ov_ip], ov_conn)
 
     @mock.patch.object(connection, 'OneViewClient')
+    @mock.patch.object(config, 'get_oneview_login_timeout')
     @mock.patch.object(config, 'get_oneview_multiple_ips')
     @mock.patch.object(config, 'get_authentication_mode')
     def test_login_with_specific_login_domain_for_multiple_ov(
             self, get_authentication_mode,
-            get_oneview_multiple_ips, oneview_client_mockup):
+            get_oneview_multiple_ips, get_oneview_login_timeout,
+            oneview_client_mockup):
 
         get_authentication_mode.return_value = 'session'
         tokens_ov = collections.OrderedDict({'10.0.0.1': 'abc',
@@ -111,6 +129,7 @@ class TestAuthentication(unittest.TestCase):
         client_session.init_map_clients()
 
         get_oneview_multiple_ips.return_value = list_ips
+        get_oneview_login_timeout.return_value = 30
 
         client_session.login('SOME_DOMAIN\\user', 'password123')
 
@@ -126,6 +145,255 @@ class TestAuthentication(unittest.TestCase):
             }
         )
 
+    @mock.patch.object(connection, 'OneViewClient')
+    @mock.patch.object(config, 'degraded_sessions_allowed')
+    @mock.patch.object(config, 'get_oneview_login_timeout')
+    @mock.patch.object(config, 'get_oneview_multiple_ips')
+    @mock.patch.object(config, 'get_authentication_mode')
+    def test_login_when_a_oneview_fails(self, get_authentication_mode,
+                                        get_oneview_multiple_ips,
+                                        get_oneview_login_timeout,
+                                        degraded_sessions_allowed,
+                                        oneview_client_mockup):
+        get_authentication_mode.return_value = 'session'
+        get_oneview_multiple_ips.return_value = ['10.0.0.1', '10.0.0.2']
+        get_oneview_login_timeout.return_value = 30
+        login_error = HPOneViewException({
+            'errorCode': 'AUTHN_AUTH_FAIL',
+            'message': 'Invalid user name or password',
+        })
+        conn_2 = mock.MagicMock()
+        conn_2.connection.get_session_id.return_value = 'def'
+
+        def function_returning_client(ov_config):
+            if ov_config['ip'] == '10.0.0.1':
+                raise login_error
+            return conn_2
+
+        oneview_client_mockup.side_effect = function_returning_client
+
+        # a failed login fails the session by default
+        degraded_sessions_allowed.return_value = False
+
+        with self.assertRaises(HPOneViewException):
+            client_session.login('user', 'password')
+
+        self.assertEqual({}, client_session._get_map_clients())
+
+        # the session is created with the available OneViews when allowed
+        degraded_sessions_allowed.return_value = True
+
+        rf_token, _ = client_session.login('user', 'password')
+
+        self.assertEqual('def', rf_token)
+        self.assertEqual(
+            {'10.0.0.2': conn_2},
+            client_session._get_map_clients()['def']['client_ov_by_ip'])
+
+    def test_run_on_oneviews_with_timeout(self):
+        release = threading.Event()
+
+        def login_function(ip):
+            if ip == '10.0.0.2':
+                release.wait(5)
+            return ip + ' client'
+
+        try:
+            results = client_session.run_on_oneviews(
+                ['10.0.0.1', '10.0.0.2'], login_function, 0.1)
+        finally:
+            release.set()
+
+        self.assertEqual('10.0.0.1 client', results['10.0.0.1'])
+        self.assertIsInstance(results['10.0.0.2'],
+                              OneViewRedfishUnavailableException)
+
+    def test_run_on_oneviews_logs_out_late_logins(self):
+        release = threading.Event()
+        late_client = mock.MagicMock()
+        logged_out = threading.Event()
+        late_client.connection.logout.side_effect = \
+            lambda: logged_out.set()
+
+        def login_function(ip):
+            release.wait(5)
+            return late_client
+
+        try:
+            results = client_session.run_on_oneviews(
+                ['10.0.0.1'], login_function, 0.1,
+                client_session._logout_late_login)
+        finally:
+            release.set()
+
+        self.assertIsInstance(results['10.0.0.1'],
+                              OneViewRedfishUnavailableException)
+        self.assertTrue(logged_out.wait(5))
+
+    @mock.patch.object(connection, 'OneViewClient')
+    @mock.patch.object(config, 'get_oneview_login_timeout')
+    @mock.patch.object(config, 'get_oneview_multiple_ips')
+    @mock.patch.object(config, 'get_authentication_mode')
+    def test_login_shares_pooled_clients(self, get_authentication_mode,
+                                         get_oneview_multiple_ips,
+                                         get_oneview_login_timeout,
+                                         oneview_client_mockup):
+        get_authentication_mode.return_value = 'session'
+        get_oneview_multiple_ips.return_value = ['10.0.0.1']
+        get_oneview_login_timeout.return_value = 30
+        conn_1 = mock.MagicMock()
+        conn_1.connection.get_session_id.return_value = 'abc'
+        conn_2 = mock.MagicMock()
+        conn_2.connection.get_session_id.return_value = 'def'
+        oneview_client_mockup.side_effect = [conn_1, conn_2]
+
+        token_1, session_id_1 = client_session.login('user', 'password')
+        token_2, session_id_2 = client_session.login('user', 'password')
+
+        # the second session shares the OneView session of the first one
+        self.assertEqual('abc', token_1)
+        self.assertNotIn(token_2, ('abc', session_id_1))
+        self.assertNotEqual(session_id_1, session_id_2)
+        oneview_client_mockup.assert_called_once()
+        map_clients = client_session._get_map_clients()
+        self.assertIs(conn_1,
+                      map_clients[token_2]['client_ov_by_ip']['10.0.0.1'])
+
+        # a different password logs in to OneView again
+        token_3, _ = client_session.login('user', 'other password')
+
+        self.assertEqual('def', token_3)
+        self.assertEqual(2, oneview_client_mockup.call_count)
+
+        # the client is kept while a session uses it
+        client_session.clear_session_by_token(token_1)
+        client_session.evict_idle_pooled_clients()
+
+        self.assertEqual(2, len(client_session.map_pooled_clients))
+
+        # and logged out after being idle for the timeout
+        client_session.clear_session_by_token(token_2)
+        for pooled_client in client_session.map_pooled_clients.values():
+            pooled_client.idle_since -= 300
+
+        client_session.evict_idle_pooled_clients()
+
+        conn_1.connection.logout.assert_called_once_with()
+        conn_2.connection.logout.assert_not_called()
+        self.assertEqual(1, len(client_session.map_pooled_clients))
+
+    @mock.patch.object(client_session, '_set_manager_into_appliances_map')
+    @mock.patch.object(connection, 'new_oneview_client')
+    def test_concurrent_logins_of_a_pooled_client(self, new_oneview_client,
+                                                  _):
+        first_client = mock.MagicMock()
+        second_client = mock.MagicMock()
+
+        def new_client_while_other_login_is_pooled(ip, username, password):
+            if new_oneview_client.call_count == 1:
+                client_session._get_pooled_client(ip, username, password,
+                                                  'login-2')
+                return first_client
+            return second_client
+
+        new_oneview_client.side_effect = \
+            new_client_while_other_login_is_pooled
+
+        oneview_client = client_session._get_pooled_client(
+            '10.0.0.1', 'user', 'password', 'login-1')
+
+        # the login pooled last is logged out
+        self.assertIs(second_client, oneview_client)
+        first_client.connection.logout.assert_called_once_with()
+        second_client.connection.logout.assert_not_called()
+        self.assertEqual(1, len(client_session.map_pooled_clients))
+
+    @mock.patch.object(config, 'get_session_pool_idle_timeout')
+    @mock.patch.object(client_session, '_set_manager_into_appliances_map')
+    @mock.patch.object(connection, 'new_oneview_client')
+    def test_pooled_client_is_not_evicted_during_a_login(
+            self, new_oneview_client, _, get_session_pool_idle_timeout):
+        pooled_client = mock.MagicMock()
+        new_oneview_client.return_value = pooled_client
+        get_session_pool_idle_timeout.return_value = 60
+
+        client_session._get_pooled_client(
+            '10.0.0.1', 'user', 'password', 'login-1')
+        for pooled in client_session.map_pooled_clients.values():
+            pooled.idle_since -= 300
+
+        # an idle client is reserved by the login getting it
+        client_session.evict_idle_pooled_clients()
+
+        pooled_client.connection.logout.assert_not_called()
+        self.assertEqual(1, len(client_session.map_pooled_clients))
+
+        client_session.clear_session_by_token('login-1')
+        for pooled in client_session.map_pooled_clients.values():
+            pooled.idle_since -= 300
+        client_session.evict_idle_pooled_clients()
+
+        pooled_client.connection.logout.assert_called_once_with()
+        self.assertEqual(0, len(client_session.map_pooled_clients))
+
+    @mock.patch.object(client_session, '_start_oneview_reconnector')
+    @mock.patch.object(connection, 'OneViewClient')
+    @mock.patch.object(config, 'get_credentials')
+    @mock.patch.object(config, 'degraded_start_allowed')
+    @mock.patch.object(config, 'get_oneview_login_timeout')
+    @mock.patch.object(config, 'get_oneview_multiple_ips')
+    @mock.patch.object(config, 'get_authentication_mode')
+    def test_login_conf_mode_when_a_oneview_fails(
+            self, get_authentication_mode, get_oneview_multiple_ips,
+            get_oneview_login_timeout, degraded_start_allowed,
+            get_credentials, oneview_client_mockup,
+            start_oneview_reconnector):
+        get_authentication_mode.return_value = 'conf'
+        get_oneview_multiple_ips.return_value = ['10.0.0.1', '10.0.0.2']
+        get_oneview_login_timeout.return_value = 30
+        get_credentials.return_value = {'userName': 'administrator',
+                                        'password': 'password'}
+        conn_1 = mock.MagicMock()
+        conn_2 = mock.MagicMock()
+        login_error = OneViewRedfishUnavailableException(
+            'OneView is unreachable at 10.0.0.2')
+        conns_ov_by_ip = {'10.0.0.1': conn_1, '10.0.0.2': login_error}
+
+        def function_returning_client(ov_config):
+            conn = conns_ov_by_ip[ov_config['ip']]
+            if isinstance(conn, Exception):
+                raise conn
+            return conn
+
+        oneview_client_mockup.side_effect = function_returning_client
+        client_session.init_map_clients()
+
+        # a failed login fails the start by default
+        degraded_start_allowed.return_value = False
+
+        with self.assertRaises(OneViewRedfishUnavailableException):
+            client_session.login_conf_mode()
+
+        # the toolkit starts with the available OneViews when allowed
+        degraded_start_allowed.return_value = True
+
+        client_session.login_conf_mode()
+
+        self.assertEqual({'10.0.0.1': conn_1},
+                         client_session._get_map_clients())
+        self.assertTrue(client_session.is_oneview_available('10.0.0.1'))
+        self.assertFalse(client_session.is_oneview_available('10.0.0.2'))
+        start_oneview_reconnector.assert_called_with()
+
+        # the OneView becomes available once logged in in background
+        conns_ov_by_ip['10.0.0.2'] = conn_2
+
+        client_session.login_unavailable_oneviews()
+
+        self.assertEqual({'10.0.0.1': conn_1, '10.0.0.2': conn_2},
+                         client_session._get_map_clients())
+        self.assertTrue(client_session.is_oneview_available('10.0.0.2'))
+
     def test_create_credentials(self):
         # when username and password are simple values
         result = connection.create_credentials('administrator', 'pwd123')
@@ -169,6 +437,7 @@ class TestAuthentication(unittest.TestCase):
 
         # using time.sleep to exit from loop raising an InterruptedError
         time_mock.sleep.side_effect = [None, InterruptedError]
+        time_mock.time.return_value = 1000
 
         # Client 1 will represents the success request, must be in the cache
         # Client 2 will represents the fail request, must be removed from
@@ -221,6 +490,46 @@ class TestAuthentication(unittest.TestCase):
                                                        {'Session-Id':
                                                         'ov_session_def'})
 
+    @mock.patch.object(client_session, 'time')
+    def test_garbage_collector_checks_shared_clients_once(self, time_mock):
+        time_mock.sleep.side_effect = [None, InterruptedError]
+        time_mock.time.return_value = 1000
+
+        client = mock.Mock()
+        client.connection.do_http.return_value = (mock.Mock(status=404),
+                                                  None)
+        client_session._set_new_client_by_token('abc', {'10.0.0.11': client})
+        client_session._set_new_client_by_token('def', {'10.0.0.11': client})
+
+        try:
+            client_session._gc_for_expired_sessions()
+        except InterruptedError:
+            pass
+
+        client.connection.do_http.assert_called_once()
+        self.assertEqual(OrderedDict(), client_session._get_map_clients())
+
+    @mock.patch.object(client_session, 'time')
+    def test_evict_idle_sessions(self, time_mock):
+        time_mock.time.return_value = 1000
+        client_session._set_new_client_by_token('abc', {})
+        client_session._set_new_client_by_token('def', {})
+
+        # a session used is kept for the idle timeout after its last use
+        time_mock.time.return_value = 50000
+        client_session.check_authentication('abc')
+
+        time_mock.time.return_value = 1000 + 86400
+        client_session.evict_idle_sessions()
+
+        self.assertEqual(['abc'], list(client_session._get_map_clients()))
+
+        time_mock.time.return_value = 50000 + 86400
+        client_session.evict_idle_sessions()
+
+        self.assertEqual(OrderedDict(), client_session._get_map_clients())
+        self.assertEqual({}, client_session.map_token_last_use)
+
     @mock.patch.object(client_session, 'time')
     def test_garbage_collector_loop(self, time_mock):
         time_mock.sleep.side_effect = [None, None, None, InterruptedError]
@@ -239,6 +548,7 @@ class TestAuthentication(unittest.TestCase):
     def test_garbage_collector_for_expired_sessions_when_raises_exception(
             self, time_mock, logging_mock, uuid_mock):
         time_mock.sleep.side_effect = [None, InterruptedError]
+        time_mock.time.return_value = 1000
 
         uuid_mock.uuid4.return_value = 'session_id_1'
 
@@ -269,6 +579,7 @@ class TestAuthentication(unittest.TestCase):
             self, time_mock, logging_mock, uuid_mock):
         time_mock.sleep.side_effect = [None, None, None, None,
                                        InterruptedError]
+        time_mock.time.return_value = 1000
 
         client = mock.Mock()
         client.connection.do_http.side_effect = [
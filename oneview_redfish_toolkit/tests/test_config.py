@@ -24,7 +24,9 @@ import configparser
 from oneview_redfish_toolkit.api.errors import OneViewRedfishException
 from oneview_redfish_toolkit.api import schemas
 from oneview_redfish_toolkit import config
+from oneview_redfish_toolkit import connection
 import unittest
+from unittest import mock
 
 
 class TestUtil(unittest.TestCase):
@@ -161,3 +163,30 @@ class TestUtil(unittest.TestCase):
             self.assertIsInstance(registry_dict, collections.OrderedDict)
         except Exception as e:
             self.fail('Failed to load registries files: {}'.format(e.msg))
+
+    @mock.patch.object(connection, 'check_oneview_availability')
+    @mock.patch.object(config, 'degraded_start_allowed')
+    @mock.patch.object(config, 'get_oneview_multiple_ips')
+    def test_check_oneviews_availability(self, get_oneview_multiple_ips,
+                                         degraded_start_allowed,
+                                         check_oneview_availability):
+        get_oneview_multiple_ips.return_value = ['10.0.0.1', '10.0.0.2']
+
+        def check_returning_error(oneview_ip):
+            if oneview_ip == '10.0.0.2':
+                raise OneViewRedfishException(
+                    'OneView is unreachable at 10.0.0.2')
+
+        check_oneview_availability.side_effect = check_returning_error
+
+        degraded_start_allowed.return_value = False
+
+        with self.assertRaises(OneViewRedfishException):
+            config.check_oneviews_availability()
+
+        degraded_start_allowed.return_value = True
+
+        config.check_oneviews_availability()
+
+        check_oneview_availability.assert_has_calls(
+            [mock.call('10.0.0.1'), mock.call('10.0.0.2')], any_order=True)
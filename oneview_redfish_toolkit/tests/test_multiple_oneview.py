@@ -28,7 +28,11 @@ from unittest.mock import call
 
 from hpOneView.exceptions import HPOneViewException
 
+from oneview_redfish_toolkit import async_oneview
+from oneview_redfish_toolkit.api.errors import \
+    OneViewRedfishUnavailableException
 from oneview_redfish_toolkit import category_resource
+from oneview_redfish_toolkit import circuit_breaker
 from oneview_redfish_toolkit import client_session
 from oneview_redfish_toolkit import config
 from oneview_redfish_toolkit import connection
@@ -360,3 +364,219 @@ class TestMultipleOneView(unittest.TestCase):
              call("10.0.0.2"),
              call("10.0.0.3")]
         )
+
+
+@mock.patch.object(config, 'get_config')
+@mock.patch.object(client_session, 'get_oneview_client')
+@mock.patch.object(single_oneview_context, 'is_single_oneview_context')
+class TestMultipleOneViewQueries(unittest.TestCase):
+    """Test class for queries on all OneViews"""
+
+    def setUp(self):
+        self.config_obj = configparser.ConfigParser()
+        self.config_obj.add_section('oneview_config')
+        self.config_obj.add_section('redfish')
+        self.config_obj.set('oneview_config', 'ip', '10.0.0.1, 10.0.0.2')
+        self.config_obj.set('redfish', 'authentication_mode', 'conf')
+        self.config_obj.set('redfish', 'collection_page_size', '2')
+        multiple_oneview.init_map_resources()
+        circuit_breaker.init_map_circuit_breakers()
+
+    def test_get_all_pages_in_all_ov(self, is_single_oneview_context,
+                                     get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        first_ov_client = mock.MagicMock()
+        first_ov_client.server_hardware.get_all.side_effect = [
+            [{"uuid": "1"}, {"uuid": "2"}],
+            [{"uuid": "3"}]
+        ]
+        second_ov_client = mock.MagicMock()
+        second_ov_client.server_hardware.get_all.side_effect = [
+            [{"uuid": "4"}, {"uuid": "5"}],
+            []
+        ]
+        get_oneview_client.side_effect = [first_ov_client, second_ov_client]
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        pages = handler_multiple_ov.server_hardware.get_all_pages()
+
+        # nothing is requested before the pages are consumed
+        get_oneview_client.assert_not_called()
+
+        self.assertEqual(
+            [[{"uuid": "1"}, {"uuid": "2"}],
+             [{"uuid": "3"}],
+             [{"uuid": "4"}, {"uuid": "5"}]],
+            list(pages))
+        first_ov_client.server_hardware.get_all.assert_has_calls(
+            [call(start=0, count=2),
+             call(start=2, count=2)])
+        second_ov_client.server_hardware.get_all.assert_has_calls(
+            [call(start=0, count=2),
+             call(start=2, count=2)])
+
+    def test_get_all_pages_raises_unexpected_error(self,
+                                                   is_single_oneview_context,
+                                                   get_oneview_client,
+                                                   get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        ov_client = mock.MagicMock()
+        ov_client.server_hardware.get_all.side_effect = HPOneViewException({
+            'errorCode': 'INTERNAL_ERROR',
+            'message': 'An unexpected error',
+        })
+        get_oneview_client.return_value = ov_client
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        with self.assertRaises(HPOneViewException):
+            list(handler_multiple_ov.server_hardware.get_all_pages())
+
+    def test_get_all_concurrently_in_all_ov(self, is_single_oneview_context,
+                                            get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+        async_oneview.init_event_loop()
+        self.addCleanup(setattr, async_oneview, 'map_event_loop', None)
+
+        first_ov_client = mock.MagicMock()
+        first_ov_client.enclosures.get_all.return_value = [{"uuid": "1"}]
+        second_ov_client = mock.MagicMock()
+        second_ov_client.enclosures.get_all.return_value = [{"uuid": "2"}]
+        get_oneview_client.side_effect = [first_ov_client, second_ov_client]
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        result = handler_multiple_ov.enclosures.get_all()
+
+        self.assertEqual([{"uuid": "1"}, {"uuid": "2"}], result)
+
+    def test_get_all_skips_ov_with_open_circuit(self,
+                                                is_single_oneview_context,
+                                                get_oneview_client,
+                                                get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            circuit_breaker.record_call("10.0.0.1", 0.1, failed=True)
+
+        ov_client = mock.MagicMock()
+        ov_client.enclosures.get_all.return_value = [{"uuid": "2"}]
+        get_oneview_client.return_value = ov_client
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        result = handler_multiple_ov.enclosures.get_all()
+
+        self.assertEqual([{"uuid": "2"}], result)
+        get_oneview_client.assert_called_once_with("10.0.0.2")
+
+    def test_get_not_found_with_open_circuit(self, is_single_oneview_context,
+                                             get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        for _ in range(circuit_breaker.MIN_CALLS_TO_OPEN):
+            circuit_breaker.record_call("10.0.0.1", 0.1, failed=True)
+
+        ov_client = mock.MagicMock()
+        ov_client.enclosures.get.side_effect = HPOneViewException({
+            'errorCode': 'RESOURCE_NOT_FOUND',
+            'message': 'The requested resource cannot be retrieved',
+        })
+        get_oneview_client.return_value = ov_client
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        # the resource may be on the skipped OneView
+        with self.assertRaises(OneViewRedfishUnavailableException):
+            handler_multiple_ov.enclosures.get('UUID_1')
+
+        get_oneview_client.assert_called_once_with("10.0.0.2")
+
+    def test_get_all_raises_connection_error(self, is_single_oneview_context,
+                                             get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        ov_client = mock.MagicMock()
+        ov_client.enclosures.get_all.side_effect = HPOneViewException(
+            "Connection reset by peer")
+        get_oneview_client.return_value = ov_client
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        with self.assertRaises(HPOneViewException):
+            handler_multiple_ov.enclosures.get_all()
+
+    def test_get_all_fields_follows_next_pages(self, is_single_oneview_context,
+                                               get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+
+        ov_client = mock.MagicMock()
+        ov_client.server_hardware.URI = "/rest/server-hardware"
+        ov_client.connection.get.side_effect = [
+            {"uri": "/rest/server-hardware?start=0&count=-1&fields=uuid",
+             "nextPageUri": "/rest/server-hardware?start=1&count=-1"
+                            "&fields=uuid",
+             "members": [{"uuid": "1"}]},
+            {"uri": "/rest/server-hardware?start=1&count=-1&fields=uuid",
+             "nextPageUri": None,
+             "members": [{"uuid": "2"}]}
+        ]
+        get_oneview_client.return_value = ov_client
+        self.config_obj.set('oneview_config', 'ip', '10.0.0.1')
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        result = handler_multiple_ov.server_hardware.get_all_fields(
+            fields="uuid")
+
+        self.assertEqual([{"uuid": "1"}, {"uuid": "2"}], result)
+        ov_client.connection.get.assert_has_calls([
+            call("/rest/server-hardware?start=0&count=-1&fields=uuid"),
+            call("/rest/server-hardware?start=1&count=-1&fields=uuid")
+        ])
+
+    def test_update_power_state_goes_through_the_circuit(
+            self, is_single_oneview_context, get_oneview_client, get_config):
+        get_config.return_value = self.config_obj
+        is_single_oneview_context.return_value = False
+        multiple_oneview.set_map_resources_entry("UUID_1", "10.0.0.1")
+
+        ov_client = mock.MagicMock()
+        server_hardware = ov_client.server_hardware.get_by_id.return_value
+        server_hardware.update_power_state.side_effect = \
+            ConnectionRefusedError("Connection refused")
+        get_oneview_client.return_value = ov_client
+
+        handler_multiple_ov = \
+            handler_multiple_oneview.MultipleOneViewResource()
+
+        with mock.patch.object(circuit_breaker, 'record_call',
+                               wraps=circuit_breaker.record_call) as \
+                record_call:
+            with self.assertRaises(ConnectionRefusedError):
+                handler_multiple_ov.server_hardware.update_power_state(
+                    {"powerState": "Off"}, "UUID_1")
+
+        # the read of the Server Hardware and the action are recorded
+        self.assertEqual(2, record_call.call_count)
+        self.assertEqual(call("10.0.0.1", mock.ANY, failed=True),
+                         record_call.call_args)
+        server_hardware.update_power_state.assert_called_once_with(
+            {"powerState": "Off"})